@@ -1,16 +1,112 @@
 """Module for ReadyNAS integration with Home Assistant."""
 
-from homeassistant.components.button import ButtonEntity
+import asyncio
+import logging
+import time
+
+import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import EntityCategory
-
-from .const import DOMAIN
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers import config_validation as cv
+
+from .const import (
+    ATTR_DEADLINE,
+    ATTR_ENTRY_ID,
+    CONF_CERT_FINGERPRINT,
+    CONF_SNMP_AUTH_KEY,
+    CONF_SNMP_COMMUNITY,
+    CONF_SNMP_PORT,
+    CONF_SNMP_PRIV_KEY,
+    CONF_SNMP_RESOURCES,
+    CONF_SNMP_USERNAME,
+    CONF_SNMP_VERSION,
+    CONF_SYSLOG_PORT,
+    DEFAULT_SHUTDOWN_DEADLINE,
+    DEFAULT_SNMP_PORT,
+    DOMAIN,
+    SERVICE_SHUTDOWN,
+)
+from .metrics import ReadyNASMetricsView
 from .pyreadynas import ReadyNASAPI
 
+_LOGGER = logging.getLogger(__name__)
+
 PLATFORMS = [Platform.BUTTON, Platform.BINARY_SENSOR, Platform.SELECT, Platform.SENSOR]
 
+# Seconds setup may spend pinning the certificate and logging in before it
+# gives up and lets Home Assistant retry later
+SETUP_TIMEOUT = 10
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+SHUTDOWN_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_DEADLINE, default=DEFAULT_SHUTDOWN_DEADLINE): vol.All(
+            vol.Coerce(float), vol.Range(min=1)
+        ),
+    }
+)
+
+
+async def async_setup(hass: HomeAssistant, config) -> bool:
+    """Set up the ReadyNAS services."""
+
+    async def async_handle_shutdown(call: ServiceCall) -> ServiceResponse:
+        """Halt every targeted NAS concurrently within one overall deadline."""
+        apis = hass.data.get(DOMAIN, {})
+        entry_ids = call.data.get(ATTR_ENTRY_ID) or list(apis)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + call.data[ATTR_DEADLINE]
+
+        async def _shutdown(api):
+            start = time.monotonic()
+            try:
+                async with asyncio.timeout_at(deadline):
+                    if not await api.shutdown_nas(timeout=10):
+                        result = "failed"
+                    else:
+                        await api.wait_until_offline()
+                        result = "offline"
+            except TimeoutError:
+                result = "timeout"
+            return {
+                "host": api.host,
+                "result": result,
+                "seconds": round(time.monotonic() - start, 1),
+            }
+
+        targets = {
+            entry_id: apis[entry_id] for entry_id in entry_ids if entry_id in apis
+        }
+        _LOGGER.warning(f"⚠️ Shutting down {len(targets)} ReadyNAS unit(s)")
+        results = await asyncio.gather(*(_shutdown(api) for api in targets.values()))
+
+        # Keyed by entry, since two entries may point at the same host
+        summary = dict(zip(targets, results))
+        for entry_id in entry_ids:
+            if entry_id not in apis:
+                summary[entry_id] = {"host": None, "result": "not_loaded", "seconds": 0}
+        return {"results": summary}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SHUTDOWN,
+        async_handle_shutdown,
+        schema=SHUTDOWN_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.http.register_view(ReadyNASMetricsView(hass))
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Set up ReadyNAS from a config entry."""
@@ -23,16 +119,84 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         entry.data["password"],
         use_ssl=entry.data.get("use_ssl", True),  # Changed default to True
         ignore_ssl_errors=entry.data.get("ignore_ssl_errors", True),
+        cert_fingerprint=entry.data.get(CONF_CERT_FINGERPRINT),
     )
 
+    # Pinning and the login share one short deadline, so a NAS that is down
+    # fails setup quickly instead of holding up Home Assistant's startup
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + SETUP_TIMEOUT
+
+    # Entries added before certificate pinning trust the certificate seen now
+    if api.use_ssl and api.ignore_ssl_errors and not api.cert_fingerprint:
+        if not await api.pin_certificate(timeout=SETUP_TIMEOUT):
+            await api.close()
+            raise ConfigEntryNotReady(f"Could not read the certificate of {api.host}")
+        hass.config_entries.async_update_entry(
+            entry,
+            data={**entry.data, CONF_CERT_FINGERPRINT: api.cert_fingerprint},
+        )
+
+    # Log in up front so the platforms and an emergency shutdown don't each
+    # have to fetch the admin page first
+    if deadline - loop.time() <= 0 or not await api.ensure_csrf_token(deadline):
+        await api.close()
+        raise ConfigEntryNotReady(f"Could not log in to {api.host}")
+
+    # Telemetry resources the user moved from dbbroker to SNMP
+    snmp_resources = entry.options.get(CONF_SNMP_RESOURCES) or []
+    if snmp_resources:
+        from .snmp import ReadyNASSNMP, pysnmp_available
+
+        if not await hass.async_add_executor_job(pysnmp_available):
+            _LOGGER.error(
+                f"❌ SNMP is enabled for {api.host} but pysnmp is not installed, "
+                f"reading {', '.join(snmp_resources)} over dbbroker instead"
+            )
+        else:
+            host = api.host
+            if host.count(":") == 1:
+                host = host.rsplit(":", 1)[0]
+            snmp = ReadyNASSNMP(
+                host,
+                port=entry.options.get(CONF_SNMP_PORT, DEFAULT_SNMP_PORT),
+                version=entry.options.get(CONF_SNMP_VERSION, "2c"),
+                community=entry.options.get(CONF_SNMP_COMMUNITY, "public"),
+                username=entry.options.get(CONF_SNMP_USERNAME),
+                auth_key=entry.options.get(CONF_SNMP_AUTH_KEY) or None,
+                priv_key=entry.options.get(CONF_SNMP_PRIV_KEY) or None,
+            )
+            api.telemetry = {resource: snmp for resource in snmp_resources}
+
     # Store the API instance using the correct domain
     hass.data[DOMAIN][entry.entry_id] = api
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Alerts are routed once the platforms are listening for them
+    syslog_port = entry.options.get(CONF_SYSLOG_PORT)
+    if syslog_port:
+        from .syslog_listener import async_register_entry, async_unregister_entry
+
+        try:
+            await async_register_entry(hass, entry.entry_id, api.host, syslog_port)
+        except OSError as err:
+            _LOGGER.error(f"❌ Could not listen for syslog on UDP {syslog_port}: {err}")
+        else:
+            entry.async_on_unload(
+                lambda: async_unregister_entry(hass, entry.entry_id, syslog_port)
+            )
+
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     # Unload all platforms
@@ -41,22 +205,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         # Remove API instance using correct domain
         if DOMAIN in hass.data:
-            hass.data[DOMAIN].pop(entry.entry_id, None)
+            api = hass.data[DOMAIN].pop(entry.entry_id, None)
+            if api is not None:
+                await api.close()
+                # One SNMP transport serves every resource moved to it
+                for transport in set(api.telemetry.values()):
+                    transport.close()
 
     return unload_ok
-
-
-class ReadyNASShutdownButton(ButtonEntity):
-    """Representation of ReadyNAS shutdown button."""
-
-    def __init__(self, api, name) -> None:
-        """Initialize the button."""
-        self._api = api
-        self._attr_name = f"{name} Shutdown"
-        self._attr_unique_id = f"{name.lower()}_shutdown"
-        self.icon = "mdi:power"
-        self._attr_entity_category = EntityCategory.CONFIG
-
-    async def async_press(self) -> None:
-        """Handle the button press."""
-        await self._api.shutdown_nas()
@@ -1,14 +1,15 @@
 """Binary sensors for ReadyNAS integration."""
 
 import logging
-from datetime import timedelta
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
@@ -16,11 +17,18 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 
-from .const import DOMAIN
+from .const import CONF_RULES, DOMAIN, SIGNAL_SNAPSHOT
+from .pyreadynas import collection_current
+from .rules import SCOPES, RuleEngine, compile_rules
+from .sensor import disk_name
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Unique id suffixes of the fixed first-volume sensors the rules replaced
+LEGACY_UNIQUE_IDS = ("volume_low_space", "health_status")
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ):
@@ -28,13 +36,13 @@ async def async_setup_entry(
     api = hass.data[DOMAIN][entry.entry_id]
     host = entry.data["host"]
 
-    # Create coordinator with same SSL settings as initial setup
+    # The sensor platform polls the NAS, this coordinator only mirrors its
+    # snapshots so the rules never cost a request of their own
     coordinator = DataUpdateCoordinator(
         hass,
         _LOGGER,
-        name=f"ReadyNAS {host}",
+        name=f"ReadyNAS {host} rules",
         update_method=lambda: async_update_data(hass, entry, api),
-        update_interval=timedelta(seconds=30),
     )
 
     await coordinator.async_config_entry_first_refresh()
@@ -44,116 +52,146 @@ async def async_setup_entry(
         "manufacturer": "NETGEAR",
         "model": "ReadyNAS",
     }
-    async_add_entities([ReadyNASHealthSensor(coordinator, entry, device_info)], True)
-    async_add_entities(
-        [ReadyNASVolumeLowSpaceSensor(coordinator, entry, device_info)], True
+
+    registry = er.async_get(hass)
+    for suffix in LEGACY_UNIQUE_IDS:
+        entity_id = registry.async_get_entity_id(
+            "binary_sensor", DOMAIN, f"{entry.entry_id}_{suffix}"
+        )
+        if entity_id:
+            registry.async_remove(entity_id)
+
+    rules = ReadyNASRules(
+        coordinator,
+        entry,
+        RuleEngine(entry.options.get(CONF_RULES) or compile_rules(entry.options)),
+        device_info,
+        async_add_entities,
+    )
+    rules.async_reconcile()
+    entry.async_on_unload(coordinator.async_add_listener(rules.async_reconcile))
+
+    @callback
+    def async_handle_snapshot(data):
+        """Take over a snapshot the sensor platform just fetched."""
+        coordinator.async_set_updated_data(data)
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_SNAPSHOT.format(entry.entry_id), async_handle_snapshot
+        )
     )
 
 
 async def async_update_data(hass: HomeAssistant, entry: ConfigEntry, api):
-    """Fetch data from API."""
-    try:
-        # Ensure API is using correct SSL settings from config entry
-        api.use_ssl = entry.data.get("use_ssl", True)
-        api.protocol = "https" if api.use_ssl else "http"
-        api.url = f"{api.protocol}://{api.host}/dbbroker"
-        api.admin_url = f"{api.protocol}://{api.host}/admin/"
-
-        # Get the health info
-        health_info = await api.get_volume_info()
-        _LOGGER.debug("Health info received: %s", health_info)  # Add debug logging
-
-        if health_info and isinstance(health_info, list) and health_info:
-            # Get the first volume's health status
-            volume = health_info[0]  # Get first volume
-            data = {
-                "health": volume.get("health", "unknown"),
-                "volumes": health_info,  # Include the full volumes list
-            }
-            _LOGGER.debug("Returning data: %s", data)  # Add debug logging
-            return data
-
-        _LOGGER.warning("No health info received from API")  # Add warning logging
-        return None
-
-    except Exception as err:
-        _LOGGER.error("Error updating ReadyNAS data: %s", err)
-        return None
-
-
-class ReadyNASVolumeLowSpaceSensor(CoordinatorEntity, BinarySensorEntity):
-    """Binary sensor for ReadyNAS volume low space status."""
+    """Return the latest snapshot the sensor platform fetched, if any."""
+    return api.snapshot
+
+
+class ReadyNASRules:
+    """Keep one problem sensor per rule and volume or disk in the snapshot."""
+
+    def __init__(self, coordinator, entry, engine, device_info, async_add_entities):
+        """Initialize the rule entity tracker."""
+        self.coordinator = coordinator
+        self.entry = entry
+        self.engine = engine
+        self._device_info = device_info
+        self._async_add_entities = async_add_entities
+        # (rule id, target) -> (unique_id, scope) of the entities added
+        self._known = {}
+
+    @callback
+    def async_reconcile(self):
+        """Add and remove rule sensors as volumes and disks come and go."""
+        data = self.coordinator.data
+        if not self.coordinator.last_update_success or not data:
+            return
+
+        # Only scopes fetched fresh are diffed. Targets of a missing or stale
+        # collection are unknown, their sensors go unavailable and stay.
+        fresh = {
+            scope
+            for scope, (collection, _) in SCOPES.items()
+            if collection_current(data, collection)
+        }
+        current = {}
+        for rule in self.engine.rules:
+            if rule.scope not in fresh:
+                continue
+            for key in self.engine.targets(data, rule.scope):
+                current[(rule.id, key)] = rule
+
+        new_entities = []
+        for rule_key, rule in current.items():
+            if rule_key not in self._known:
+                entity = ReadyNASRuleSensor(
+                    self.coordinator,
+                    self.entry,
+                    self.engine,
+                    rule,
+                    rule_key[1],
+                    self._device_info,
+                )
+                self._known[rule_key] = (entity.unique_id, rule.scope)
+                new_entities.append(entity)
+
+        registry = er.async_get(self.coordinator.hass)
+        for rule_key in self._known.keys() - current.keys():
+            if self._known[rule_key][1] not in fresh:
+                continue
+            _LOGGER.info(f"➖ Removing rule {rule_key[0]} for {rule_key[1]}")
+            unique_id, _ = self._known.pop(rule_key)
+            entity_id = registry.async_get_entity_id("binary_sensor", DOMAIN, unique_id)
+            if entity_id:
+                registry.async_remove(entity_id)
+
+        if new_entities:
+            self._async_add_entities(new_entities)
+
+
+class ReadyNASRuleSensor(CoordinatorEntity, BinarySensorEntity):
+    """Binary sensor for one problem rule applied to one volume or disk."""
 
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_device_class = BinarySensorDeviceClass.PROBLEM
 
-    def __init__(self, coordinator, config_entry, device_info):
+    def __init__(self, coordinator, config_entry, engine, rule, target, device_info):
         """Initialize the binary sensor."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"{config_entry.entry_id}_volume_low_space"
-        self._attr_name = "Volume Low Space"
+        self._engine = engine
+        self._rule = rule
+        self._target = target
+        if rule.scope == "disk":
+            label = disk_name(target)
+        else:
+            label = f"Volume {target}"
+        self._attr_unique_id = f"{config_entry.entry_id}_rule_{rule.id}_{target}"
+        self._attr_name = f"{label} {rule.name}"
         self._attr_device_info = DeviceInfo(**device_info) if device_info else None
 
     @property
-    def is_on(self):
-        """Return True if the volume space is low."""
-        if not self.coordinator.data or "volumes" not in self.coordinator.data:
-            return None
-
-        # Get first volume's data
-        if self.coordinator.data["volumes"]:
-            volume = self.coordinator.data["volumes"][0]
-            used_percentage = volume.get("used_percentage", 0)
-            used_converted = round(used_percentage / 1000, 1)
-            # Return True if used percentage is above 90%
-            return used_converted > 90 if used_converted is not None else None
-
-        return None
+    def _result(self):
+        return self._engine.evaluate(self.coordinator.data).get(
+            (self._rule.id, self._target)
+        )
 
     @property
-    def extra_state_attributes(self):
-        """Return the state attributes."""
-        if not self.coordinator.data or "volumes" not in self.coordinator.data:
-            return {}
-
-        if self.coordinator.data["volumes"]:
-            volume = self.coordinator.data["volumes"][0]
-            return {
-                "used_percentage": round(volume.get("used_percentage", 0), 1),
-                "free_gb": round(volume.get("free_gb", 0), 2),
-            }
-        return {}
-
-
-class ReadyNASHealthSensor(CoordinatorEntity, BinarySensorEntity):
-    """Binary sensor for ReadyNAS health status."""
-
-    _attr_has_entity_name = True
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_device_class = BinarySensorDeviceClass.PROBLEM
-
-    def __init__(self, coordinator, config_entry, device_info):
-        """Initialize the binary sensor."""
-        super().__init__(coordinator)
-        self._attr_unique_id = f"{config_entry.entry_id}_health_status"
-        self._attr_name = "Health Status"
-        self._attr_device_info = DeviceInfo(**device_info) if device_info else None
+    def available(self):
+        """Return if the volume or disk is in the latest snapshot."""
+        return self.coordinator.last_update_success and self._result is not None
 
     @property
     def is_on(self):
-        """Return True if the health status is degraded."""
-        if not self.coordinator.data:
-            return None
-        health_status = self.coordinator.data.get("health")
-        # Return True if health status is anything other than REDUNDANT
-        return health_status != "REDUNDANT" if health_status else None
+        """Return True while the rule is in problem state."""
+        result = self._result
+        return result[0] if result else None
 
     @property
     def extra_state_attributes(self):
-        """Return the state attributes."""
-        if not self.coordinator.data:
+        """Return the value and the thresholds it is checked against."""
+        result = self._result
+        if result is None:
             return {}
-        return {
-            "health_status": self.coordinator.data.get("health", "unknown"),
-        }
+        return {"value": result[1], **self._rule.attributes()}
@@ -19,7 +19,7 @@ async def async_setup_entry(
     """Set up ReadyNAS button based on a config entry."""
     api = hass.data[DOMAIN][entry.entry_id]
 
-    async_add_entities([ReadyNASShutdownButton(api, entry)], True)
+    async_add_entities([ReadyNASShutdownButton(api, entry)])
 
 
 class ReadyNASShutdownButton(ButtonEntity):
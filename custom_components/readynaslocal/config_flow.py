@@ -3,9 +3,36 @@
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_SSL, CONF_USERNAME
+from homeassistant.core import callback
+from homeassistant.helpers import config_validation as cv
 
-from .const import DOMAIN  # Add DOMAIN import
+from .const import (  # Add DOMAIN import
+    CONF_CERT_FINGERPRINT,
+    CONF_DISK_HEALTHY,
+    CONF_DISK_TEMPERATURE,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_RULE_HYSTERESIS,
+    CONF_RULES,
+    CONF_SNMP_AUTH_KEY,
+    CONF_SNMP_COMMUNITY,
+    CONF_SNMP_PORT,
+    CONF_SNMP_PRIV_KEY,
+    CONF_SNMP_RESOURCES,
+    CONF_SNMP_USERNAME,
+    CONF_SNMP_VERSION,
+    CONF_SYSLOG_PORT,
+    CONF_TOP_SHARES,
+    CONF_USE_SSL,
+    CONF_VOLUME_FREE_GB,
+    CONF_VOLUME_HEALTHY,
+    CONF_VOLUME_USED_PERCENT,
+    DEFAULT_SNMP_PORT,
+    DEFAULT_TOP_SHARES,
+    DOMAIN,
+)
 from .pyreadynas import ReadyNASAPI
+from .rules import DEFAULT_RULE_OPTIONS, compile_rules
+from .snmp import SNMP_RESOURCES, pysnmp_available
 
 
 class ReadyNASConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -13,24 +40,17 @@ class ReadyNASConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        """Return the options flow for this handler."""
+        return ReadyNASOptionsFlow()
+
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
+        errors = {}
 
-        if user_input is None:
-            return self.async_show_form(
-                step_id="user",
-                data_schema=vol.Schema(
-                    {
-                        vol.Required(CONF_HOST): str,
-                        vol.Required(CONF_USERNAME): str,
-                        vol.Required(CONF_PASSWORD): str,
-                        vol.Optional(CONF_SSL, default=True): bool,
-                        vol.Optional("ignore_ssl_errors", default=True): bool,
-                    }
-                ),
-            )
-
-        try:
+        if user_input is not None:
             # Initialize API with user input
             api = ReadyNASAPI(
                 user_input[CONF_HOST],
@@ -40,45 +60,149 @@ class ReadyNASConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 ignore_ssl_errors=user_input.get("ignore_ssl_errors", True),
             )
 
-            # Test connection
-            if not await api.get_health_info():
-                return self.async_show_form(
-                    step_id="user",
-                    data_schema=vol.Schema(
-                        {
-                            vol.Required(CONF_HOST): str,
-                            vol.Required(CONF_USERNAME): str,
-                            vol.Required(CONF_PASSWORD): str,
-                            vol.Optional(
-                                CONF_SSL, default=True
-                            ): bool,  # Changed default to True
-                            vol.Optional("ignore_ssl_errors", default=True): bool,
-                        }
-                    ),
-                    errors={"base": "cannot_connect"},
+            # Probe instead of a full poll so a typo fails within seconds
+            try:
+                # Rather than ignoring certificate errors for good, trust the
+                # certificate seen now and accept only that one from here on.
+                # Without it the entry would pin whatever is presented at
+                # its first setup instead.
+                if (
+                    api.use_ssl
+                    and api.ignore_ssl_errors
+                    and not await api.pin_certificate()
+                ):
+                    error = "cannot_connect"
+                else:
+                    error = await api.probe()
+            except Exception:
+                error = "unknown"
+
+            if error is None:
+                # Create unique ID based on host
+                await self.async_set_unique_id(f"readynas_{user_input[CONF_HOST]}")
+                self._abort_if_unique_id_configured()
+
+                return self.async_create_entry(
+                    title=f"ReadyNAS ({user_input[CONF_HOST]})",
+                    # Setup reads the scheme from use_ssl
+                    data={
+                        **user_input,
+                        CONF_USE_SSL: user_input.get(CONF_SSL, True),
+                        CONF_CERT_FINGERPRINT: api.cert_fingerprint,
+                    },
                 )
+            errors["base"] = error
 
-            # Create unique ID based on host
-            await self.async_set_unique_id(f"readynas_{user_input[CONF_HOST]}")
-            self._abort_if_unique_id_configured()
+        return self.async_show_form(
+            step_id="user",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_HOST): str,
+                    vol.Required(CONF_USERNAME): str,
+                    vol.Required(CONF_PASSWORD): str,
+                    # Changed default to True
+                    vol.Optional(CONF_SSL, default=True): bool,
+                    vol.Optional("ignore_ssl_errors", default=True): bool,
+                }
+            ),
+            errors=errors,
+        )
 
-            return self.async_create_entry(
-                title=f"ReadyNAS ({user_input[CONF_HOST]})", data=user_input
-            )
 
-        except Exception:
-            return self.async_show_form(
-                step_id="user",
-                data_schema=vol.Schema(
-                    {
-                        vol.Required(CONF_HOST): str,
-                        vol.Required(CONF_USERNAME): str,
-                        vol.Required(CONF_PASSWORD): str,
-                        vol.Optional(
-                            CONF_SSL, default=True
-                        ): bool,  # Changed default to True
-                        vol.Optional("ignore_ssl_errors", default=True): bool,
-                    }
-                ),
-                errors={"base": "unknown"},
-            )
+class ReadyNASOptionsFlow(config_entries.OptionsFlow):
+    """Options flow for ReadyNAS integration."""
+
+    async def async_step_init(self, user_input=None):
+        """Manage the options."""
+        errors = {}
+        if user_input is not None:
+            # pysnmp is not a requirement of the integration, see the README
+            if user_input.get(
+                CONF_SNMP_RESOURCES
+            ) and not await self.hass.async_add_executor_job(pysnmp_available):
+                errors[CONF_SNMP_RESOURCES] = "pysnmp_missing"
+            else:
+                return self.async_create_entry(
+                    title="",
+                    data={**user_input, CONF_RULES: compile_rules(user_input)},
+                )
+
+        options = {
+            **DEFAULT_RULE_OPTIONS,
+            **self.config_entry.options,
+            **(user_input or {}),
+        }
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_LONG_TERM_STATISTICS,
+                        default=options.get(CONF_LONG_TERM_STATISTICS, False),
+                    ): bool,
+                    vol.Optional(
+                        CONF_TOP_SHARES,
+                        default=options.get(CONF_TOP_SHARES, DEFAULT_TOP_SHARES),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=50)),
+                    vol.Optional(
+                        CONF_SYSLOG_PORT,
+                        default=options.get(CONF_SYSLOG_PORT, 0),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=65535)),
+                    vol.Optional(
+                        CONF_SNMP_RESOURCES,
+                        default=options.get(CONF_SNMP_RESOURCES, []),
+                    ): cv.multi_select(
+                        {resource: resource for resource in SNMP_RESOURCES}
+                    ),
+                    vol.Optional(
+                        CONF_SNMP_VERSION,
+                        default=options.get(CONF_SNMP_VERSION, "2c"),
+                    ): vol.In(["2c", "3"]),
+                    vol.Optional(
+                        CONF_SNMP_PORT,
+                        default=options.get(CONF_SNMP_PORT, DEFAULT_SNMP_PORT),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=65535)),
+                    vol.Optional(
+                        CONF_SNMP_COMMUNITY,
+                        default=options.get(CONF_SNMP_COMMUNITY, "public"),
+                    ): str,
+                    vol.Optional(
+                        CONF_SNMP_USERNAME,
+                        default=options.get(CONF_SNMP_USERNAME, ""),
+                    ): str,
+                    vol.Optional(
+                        CONF_SNMP_AUTH_KEY,
+                        default=options.get(CONF_SNMP_AUTH_KEY, ""),
+                    ): str,
+                    vol.Optional(
+                        CONF_SNMP_PRIV_KEY,
+                        default=options.get(CONF_SNMP_PRIV_KEY, ""),
+                    ): str,
+                    vol.Optional(
+                        CONF_VOLUME_USED_PERCENT,
+                        default=options[CONF_VOLUME_USED_PERCENT],
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+                    vol.Optional(
+                        CONF_VOLUME_FREE_GB,
+                        default=options[CONF_VOLUME_FREE_GB],
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_DISK_TEMPERATURE,
+                        default=options[CONF_DISK_TEMPERATURE],
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=100)),
+                    vol.Optional(
+                        CONF_VOLUME_HEALTHY,
+                        default=options[CONF_VOLUME_HEALTHY],
+                    ): str,
+                    vol.Optional(
+                        CONF_DISK_HEALTHY,
+                        default=options[CONF_DISK_HEALTHY],
+                    ): str,
+                    vol.Optional(
+                        CONF_RULE_HYSTERESIS,
+                        default=options[CONF_RULE_HYSTERESIS],
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=50)),
+                }
+            ),
+            errors=errors,
+        )
@@ -1,8 +1,73 @@
 """Constants for ReadyNAS integration."""
 
+from datetime import timedelta
+
 DOMAIN = "readynaslocal"
 CONF_HOST = "host"
 CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
 CONF_USE_SSL = "use_ssl"
 CONF_IGNORE_SSL_ERRORS = "ignore_ssl_errors"
+# SHA-256 of the certificate trusted on first use instead of ignoring errors
+CONF_CERT_FINGERPRINT = "cert_fingerprint"
+
+SERVICE_SHUTDOWN = "shutdown"
+ATTR_ENTRY_ID = "entry_id"
+ATTR_DEADLINE = "deadline"
+DEFAULT_SHUTDOWN_DEADLINE = 120
+
+CONF_LONG_TERM_STATISTICS = "long_term_statistics"
+CONF_SYSLOG_PORT = "syslog_port"
+CONF_SNMP_RESOURCES = "snmp_resources"
+CONF_SNMP_VERSION = "snmp_version"
+CONF_SNMP_PORT = "snmp_port"
+CONF_SNMP_COMMUNITY = "snmp_community"
+CONF_SNMP_USERNAME = "snmp_username"
+CONF_SNMP_AUTH_KEY = "snmp_auth_key"
+CONF_SNMP_PRIV_KEY = "snmp_priv_key"
+DEFAULT_SNMP_PORT = 161
+
+# Problem rule thresholds, compiled into CONF_RULES by the options flow
+CONF_VOLUME_USED_PERCENT = "volume_used_percent"
+CONF_VOLUME_FREE_GB = "volume_free_gb"
+CONF_DISK_TEMPERATURE = "disk_temperature"
+CONF_VOLUME_HEALTHY = "volume_healthy"
+CONF_DISK_HEALTHY = "disk_healthy"
+CONF_RULE_HYSTERESIS = "rule_hysteresis"
+CONF_RULES = "rules"
+# Shares ranked by usage and by growth, 0 disables share listing
+CONF_TOP_SHARES = "top_shares"
+DEFAULT_TOP_SHARES = 5
+
+# Sensors that are only published as long-term statistics in that mode
+STATISTICS_SENSOR_KEYS = ("cpu_temp", "fan_speed")
+STATISTICS_VOLUME_METRICS = (
+    ("free_gb", "Free Space", "GB"),
+    ("used_gb", "Used Space", "GB"),
+    ("used_percentage", "Used Percentage", "%"),
+)
+
+SMART_SCAN_INTERVAL = timedelta(hours=1)
+SNAPSHOT_SCAN_INTERVAL = timedelta(minutes=15)
+SHARE_SCAN_INTERVAL = timedelta(hours=1)
+# Backup jobs are polled fast only while one runs, otherwise at the idle
+# interval or just after the next scheduled run, whichever comes first
+BACKUP_ACTIVE_INTERVAL = timedelta(seconds=30)
+BACKUP_IDLE_INTERVAL = timedelta(minutes=30)
+# Runs remembered per backup job
+BACKUP_HISTORY = 20
+
+EVENT_SNAPSHOT_CREATED = f"{DOMAIN}_snapshot_created"
+EVENT_SNAPSHOT_DELETED = f"{DOMAIN}_snapshot_deleted"
+EVENT_ALERT = f"{DOMAIN}_alert"
+EVENT_BACKUP_COMPLETED = f"{DOMAIN}_backup_completed"
+EVENT_BACKUP_FAILED = f"{DOMAIN}_backup_failed"
+
+# Dispatcher signal per entry_id carrying the resources a syslog alert touched
+SIGNAL_ALERT = f"{DOMAIN}_alert_{{}}"
+# Dispatcher signal per entry_id carrying each new health snapshot
+SIGNAL_SNAPSHOT = f"{DOMAIN}_snapshot_{{}}"
+# hass.data key of the syslog listeners, by UDP port
+DATA_SYSLOG = f"{DOMAIN}_syslog"
+# hass.data key of the unfinished statistics hour, by entry_id
+DATA_STATISTICS = f"{DOMAIN}_statistics"
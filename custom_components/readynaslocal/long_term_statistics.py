@@ -0,0 +1,175 @@
+"""Long-term statistics import for ReadyNAS telemetry."""
+
+import logging
+import re
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_STATISTICS, DOMAIN, STATISTICS_VOLUME_METRICS
+from .sensor import (
+    DISK_IO_METRICS,
+    ENCLOSURE_METRICS,
+    INTERFACE_METRICS,
+    PERFORMANCE_METRICS,
+    PROBE_METRICS,
+    disk_name,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ReadyNASStatistics:
+    """Aggregate samples per hour and import them as external statistics.
+
+    Each statistic keeps a running [count, total, min, max] for the current
+    hour. When the hour rolls over the finished buckets are imported in one
+    batch, so the recorder sees one row per statistic per hour instead of a
+    state change every poll. An unfinished hour is handed over to the next
+    aggregator of the entry when it reloads, so it is imported once, complete.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator, host, entry_id):
+        """Initialize the aggregator."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self._prefix = re.sub(r"[^a-z0-9_]", "_", host.lower())
+        self._host = host
+        self._entry_id = entry_id
+        # _buckets: statistic_id -> [count, total, min, max]
+        # _meta: statistic_id -> (name, unit)
+        self._hour, self._buckets, self._meta = hass.data.get(DATA_STATISTICS, {}).pop(
+            entry_id, (None, {}, {})
+        )
+
+    def _samples(self):
+        """Yield (key, name, unit, value) for every numeric sample."""
+        data = self.coordinator.data or {}
+        yield "cpu_temp", "CPU Temperature", "°C", data.get("cpu_temp")
+        yield "fan_speed", "Fan Speed", "RPM", data.get("fan_speed")
+        for disk in data.get("disks", []):
+            yield (
+                f"disk_{disk['key']}_temperature",
+                f"{disk_name(disk['key'])} Temperature",
+                "°C",
+                disk.get("temperature"),
+            )
+        enclosure = data.get("enclosure") or {}
+        for key, name, _, unit, _ in ENCLOSURE_METRICS:
+            if unit is not None:
+                yield f"enclosure_{key}", name, unit, enclosure.get(key)
+        for collection, field, prefix, _, unit, _ in PROBE_METRICS:
+            if unit is None:
+                continue
+            # The first probe is already CPU Temperature or Fan Speed
+            for index, probe in enumerate(data.get(collection, [])[1:], 1):
+                yield (
+                    f"{collection}_{probe.get('resource_id') or index}",
+                    f"{prefix} {probe.get('name') or index + 1}",
+                    unit,
+                    probe.get(field),
+                )
+        performance = data.get("performance") or {}
+        for key, name, unit, _ in PERFORMANCE_METRICS:
+            yield f"performance_{key}", name, unit, performance.get(key)
+        for interface, rates in (performance.get("interfaces") or {}).items():
+            for key, name, unit, _ in INTERFACE_METRICS:
+                yield (
+                    f"performance_interfaces_{interface}_{key}",
+                    f"{interface} {name}",
+                    unit,
+                    rates.get(key),
+                )
+        for disk, rates in (performance.get("disks") or {}).items():
+            for key, name, unit, _ in DISK_IO_METRICS:
+                yield (
+                    f"performance_disks_{disk}_{key}",
+                    f"{disk} {name}",
+                    unit,
+                    rates.get(key),
+                )
+        for volume in data.get("volumes", []):
+            name = volume["name"]
+            for metric, label, unit in STATISTICS_VOLUME_METRICS:
+                yield (
+                    f"volume_{name}_{metric}",
+                    f"Volume {name} {label}",
+                    unit,
+                    volume.get(metric),
+                )
+
+    def _statistic_id(self, key):
+        key = re.sub(r"[^a-z0-9_]", "_", key.lower())
+        return f"{DOMAIN}:{self._prefix}_{key}"
+
+    @callback
+    def async_record(self):
+        """Fold the latest coordinator data into the current hour."""
+        if not self.coordinator.last_update_success:
+            return
+
+        hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+        if self._hour is not None and hour != self._hour:
+            self.async_flush()
+        self._hour = hour
+
+        for key, name, unit, value in self._samples():
+            if value is None:
+                continue
+            statistic_id = self._statistic_id(key)
+            self._meta[statistic_id] = (name, unit)
+            bucket = self._buckets.get(statistic_id)
+            if bucket is None:
+                self._buckets[statistic_id] = [1, value, value, value]
+            else:
+                bucket[0] += 1
+                bucket[1] += value
+                bucket[2] = min(bucket[2], value)
+                bucket[3] = max(bucket[3], value)
+
+    @callback
+    def async_suspend(self):
+        """Keep the unfinished hour for the aggregator after a reload."""
+        if self._hour is not None and self._buckets:
+            self.hass.data.setdefault(DATA_STATISTICS, {})[self._entry_id] = (
+                self._hour,
+                self._buckets,
+                self._meta,
+            )
+
+    @callback
+    def async_flush(self):
+        """Import the aggregated hour and start a new one."""
+        if self._hour is None or not self._buckets:
+            return
+
+        for statistic_id, (count, total, minimum, maximum) in self._buckets.items():
+            name, unit = self._meta[statistic_id]
+            metadata = StatisticMetaData(
+                has_mean=True,
+                has_sum=False,
+                name=f"ReadyNAS ({self._host}) {name}",
+                source=DOMAIN,
+                statistic_id=statistic_id,
+                unit_of_measurement=unit,
+            )
+            async_add_external_statistics(
+                self.hass,
+                metadata,
+                [
+                    StatisticData(
+                        start=self._hour,
+                        mean=total / count,
+                        min=minimum,
+                        max=maximum,
+                    )
+                ],
+            )
+
+        _LOGGER.debug(
+            f"📈 Imported {len(self._buckets)} statistics for {self._host} "
+            f"hour {self._hour.isoformat()}"
+        )
+        self._buckets = {}
@@ -0,0 +1,223 @@
+"""OpenMetrics exporter for ReadyNAS snapshots."""
+
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+
+from .const import DOMAIN
+from .pyreadynas import ReadyNASAPI
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# name -> (type, unit, help); the order here is the order families are rendered
+FAMILIES = {
+    "readynas_cpu_temperature_celsius": ("gauge", "celsius", "CPU temperature"),
+    "readynas_fan_speed_rpm": ("gauge", "rpm", "Fan speed"),
+    "readynas_probe_temperature_celsius": (
+        "gauge",
+        "celsius",
+        "Temperature of every enclosure probe",
+    ),
+    "readynas_fan_rpm": ("gauge", "rpm", "Speed of every enclosure fan"),
+    "readynas_psu_status": (
+        "gauge",
+        None,
+        "Power supply status, 1 for the reported status",
+    ),
+    "readynas_disk_temperature_celsius": ("gauge", "celsius", "Disk temperature"),
+    "readynas_disk_status": ("gauge", None, "Disk status, 1 for the reported status"),
+    "readynas_volume_size_bytes": ("gauge", "bytes", "Volume capacity"),
+    "readynas_volume_free_bytes": ("gauge", "bytes", "Volume free space"),
+    "readynas_volume_used_bytes": ("gauge", "bytes", "Volume data used"),
+    "readynas_volume_health": (
+        "gauge",
+        None,
+        "Volume health, 1 for the reported health",
+    ),
+    "readynas_snapshot_timestamp_seconds": (
+        "gauge",
+        "seconds",
+        "Time of the last successful poll",
+    ),
+    "readynas_request_duration_seconds": (
+        "summary",
+        "seconds",
+        "dbbroker request latency",
+    ),
+    "readynas_request_errors": ("counter", None, "Failed dbbroker requests"),
+}
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels):
+    # A label the NAS did not report is left out rather than rendered as "None"
+    return ",".join(
+        f'{key}="{_escape(value)}"'
+        for key, value in labels.items()
+        if value is not None
+    )
+
+
+def render_snapshot(api: ReadyNASAPI):
+    """Render the metric samples of one NAS snapshot, grouped by family."""
+    samples = {name: [] for name in FAMILIES}
+    host = _labels(host=api.host)
+    data = api.snapshot
+
+    if data.get("cpu_temp") is not None:
+        samples["readynas_cpu_temperature_celsius"].append(
+            f"readynas_cpu_temperature_celsius{{{host}}} {data['cpu_temp']}"
+        )
+    if data.get("fan_speed") is not None:
+        samples["readynas_fan_speed_rpm"].append(
+            f"readynas_fan_speed_rpm{{{host}}} {data['fan_speed']}"
+        )
+
+    for probe in data.get("temperatures", []):
+        if probe.get("value") is not None:
+            labels = _labels(
+                host=api.host, probe=probe.get("resource_id"), name=probe.get("name")
+            )
+            samples["readynas_probe_temperature_celsius"].append(
+                f"readynas_probe_temperature_celsius{{{labels}}} {probe['value']}"
+            )
+    for fan in data.get("fans", []):
+        if fan.get("speed") is not None:
+            labels = _labels(
+                host=api.host, fan=fan.get("resource_id"), name=fan.get("name")
+            )
+            samples["readynas_fan_rpm"].append(
+                f"readynas_fan_rpm{{{labels}}} {fan['speed']}"
+            )
+    for psu in data.get("psus", []):
+        labels = _labels(
+            host=api.host, psu=psu.get("resource_id"), status=psu.get("status")
+        )
+        samples["readynas_psu_status"].append(f"readynas_psu_status{{{labels}}} 1")
+
+    for disk in data.get("disks", []):
+        labels = _labels(host=api.host, disk=disk["key"], model=disk.get("model"))
+        if disk.get("temperature") is not None:
+            samples["readynas_disk_temperature_celsius"].append(
+                f"readynas_disk_temperature_celsius{{{labels}}} {disk['temperature']}"
+            )
+        status = _labels(host=api.host, disk=disk["key"], status=disk.get("status"))
+        samples["readynas_disk_status"].append(f"readynas_disk_status{{{status}}} 1")
+
+    for volume in data.get("volumes", []):
+        labels = _labels(host=api.host, volume=volume["name"])
+        for name, key in (
+            ("readynas_volume_size_bytes", "capacity_kb"),
+            ("readynas_volume_free_bytes", "free_kb"),
+            ("readynas_volume_used_bytes", "used_kb"),
+        ):
+            if volume.get(key) is not None:
+                samples[name].append(f"{name}{{{labels}}} {volume[key] * 1024}")
+        health = _labels(
+            host=api.host, volume=volume["name"], health=volume.get("health")
+        )
+        samples["readynas_volume_health"].append(
+            f"readynas_volume_health{{{health}}} 1"
+        )
+
+    if api.snapshot_time is not None:
+        samples["readynas_snapshot_timestamp_seconds"].append(
+            f"readynas_snapshot_timestamp_seconds{{{host}}} {api.snapshot_time:.3f}"
+        )
+
+    return samples
+
+
+def render_request_stats(api: ReadyNASAPI):
+    """Render the request latency counters of one NAS."""
+    samples = {
+        "readynas_request_duration_seconds": [],
+        "readynas_request_errors": [],
+    }
+    for resource, stats in api.request_stats.items():
+        labels = _labels(host=api.host, resource=resource)
+        name = "readynas_request_duration_seconds"
+        samples[name].extend(
+            (
+                f"{name}_count{{{labels}}} {stats['count']}",
+                f"{name}_sum{{{labels}}} {stats['seconds']:.6f}",
+            )
+        )
+        samples["readynas_request_errors"].append(
+            f"readynas_request_errors_total{{{labels}}} {stats['errors']}"
+        )
+    return samples
+
+
+class ReadyNASMetricsView(HomeAssistantView):
+    """Serve every entry's latest snapshot in OpenMetrics text format.
+
+    Nothing here talks to a NAS. Each entry's samples are rendered once per
+    snapshot generation and reused until the next poll, so a scrape only
+    joins cached lines.
+    """
+
+    url = f"/api/{DOMAIN}/metrics"
+    name = f"api:{DOMAIN}:metrics"
+
+    def __init__(self, hass):
+        """Initialize the view."""
+        self.hass = hass
+        # entry_id -> (generation, samples)
+        self._snapshot_cache = {}
+        # entry_id -> (request count, samples)
+        self._stats_cache = {}
+
+    def _cached(self, cache, entry_id, version, render, api):
+        cached = cache.get(entry_id)
+        if cached is None or cached[0] != version:
+            cached = cache[entry_id] = (version, render(api))
+        return cached[1]
+
+    async def get(self, request):
+        """Return the metrics of all loaded ReadyNAS entries."""
+        apis = {
+            entry_id: api
+            for entry_id, api in self.hass.data.get(DOMAIN, {}).items()
+            if isinstance(api, ReadyNASAPI)
+        }
+        for cache in (self._snapshot_cache, self._stats_cache):
+            for entry_id in cache.keys() - apis.keys():
+                del cache[entry_id]
+
+        rendered = []
+        for entry_id, api in apis.items():
+            rendered.append(
+                self._cached(
+                    self._snapshot_cache,
+                    entry_id,
+                    api.generation,
+                    render_snapshot,
+                    api,
+                )
+            )
+            rendered.append(
+                self._cached(
+                    self._stats_cache,
+                    entry_id,
+                    sum(stats["count"] for stats in api.request_stats.values()),
+                    render_request_stats,
+                    api,
+                )
+            )
+
+        lines = []
+        for name, (metric_type, unit, help_text) in FAMILIES.items():
+            lines.append(f"# TYPE {name} {metric_type}")
+            if unit:
+                lines.append(f"# UNIT {name} {unit}")
+            lines.append(f"# HELP {name} {help_text}")
+            for samples in rendered:
+                lines.extend(samples.get(name, ()))
+        lines.append("# EOF\n")
+
+        return web.Response(
+            body="\n".join(lines).encode(), headers={"Content-Type": CONTENT_TYPE}
+        )
@@ -1,54 +1,599 @@
 import asyncio
 import base64
+import hashlib
+import heapq
 import logging
 import re
 import ssl
+import time
 import xml.etree.ElementTree as ET
+from urllib.parse import urlsplit
 
 import aiohttp
 
 _LOGGER = logging.getLogger(__name__)
 
+# SMART counter -> element names used for it by the per-disk resources.
+# The order is the order of the compact per-disk tuple.
+SMART_FIELDS = (
+    ("reallocated_sectors", ("Reallocated_Sectors", "disk_reallocated_sectors")),
+    ("pending_sectors", ("Pending_Sectors", "disk_pending_sectors")),
+    ("uncorrectable_errors", ("Uncorrectable_Errors", "disk_uncorrectable_errors")),
+    ("ata_errors", ("ATA_Errors", "disk_ata_errors")),
+    ("command_timeouts", ("Command_Timeouts", "disk_command_timeouts")),
+    ("power_on_hours", ("Power_On_Hours", "disk_power_on_hours")),
+    ("start_stop_count", ("Start_Stop_Count", "disk_start_stop_count")),
+)
+
+# Linux /proc/stat CPU time fields reported by System_Stats
+CPU_FIELDS = ("user", "nice", "system", "idle", "iowait", "irq", "softirq")
+# Disk I/O counters are in 512 byte sectors regardless of the disk's block size
+SECTOR_SIZE = 512
+# Seconds a resource's last good value may stand in for failed fetches
+RESOURCE_EXPIRY = {
+    "HealthInfo": 300,
+    "Volumes": 900,
+    "SystemInfo": 3600,
+    "FanConfig": 900,
+    "Disk": 3 * 3600,
+}
+# Snapshots requested per Snapshot_Collection transaction
+SNAPSHOT_PAGE_SIZE = 100
+# Shares requested per Share_Collection transaction, and kept per ranking
+SHARE_PAGE_SIZE = 100
+TOP_SHARES = 5
+# Last run outcomes of a backup job that count as a success
+BACKUP_SUCCESS = ("success", "ok", "completed")
+# Seconds allowed to open a connection and between two reads of a response
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 20
+# Seconds a whole health poll may take, kept below the sensor scan interval
+POLL_BUDGET = 25
+# Resources making up a health snapshot
+HEALTH_RESOURCES = ("HealthInfo", "Volumes", "SystemInfo")
+# Snapshot collections and the resource each one comes from
+COLLECTION_RESOURCES = {"disks": "HealthInfo", "volumes": "Volumes"}
+# Seconds the config flow probe may take in total
+PROBE_TIMEOUT = 10
+
+
+def _scaled(factor):
+    """Converter for a number reported in a smaller unit."""
+    return lambda text: round(float(text) * factor, 3)
+
+
+def _integer(text):
+    return int(float(text))
+
+
+# HealthInfo elements collected per kind: element tag -> (collection,
+# {child tag: (field, converter)}). Every element of a kind becomes one
+# record, wherever it sits below its Enclosure_Health; fields the NAS leaves
+# out are None unless HEALTH_DEFAULTS says otherwise.
+HEALTH_SCHEMA = {
+    "Temperature": (
+        "temperatures",
+        {
+            "temp_name": ("name", str),
+            "temp_value": ("value", _integer),
+            "temp_status": ("status", str),
+        },
+    ),
+    "Fan": (
+        "fans",
+        {
+            "fan_name": ("name", str),
+            "fan_speed": ("speed", _integer),
+            "fan_status": ("status", str),
+        },
+    ),
+    "Power_Supply": (
+        "psus",
+        {
+            "psu_name": ("name", str),
+            "psu_status": ("status", str),
+            # millivolts
+            "psu_voltage": ("voltage", _scaled(0.001)),
+        },
+    ),
+    "Disk": (
+        "disks",
+        {
+            "disk_channel": ("channel", str),
+            "disk_model": ("model", str),
+            "disk_temperature": ("temperature", _integer),
+            "disk_status": ("status", str),
+            "disk_capacity": ("capacity", _integer),
+        },
+    ),
+}
+HEALTH_DEFAULTS = {"disks": {"model": "Unknown", "status": "Unknown"}}
+
+
+def collection_current(snapshot, collection):
+    """Whether a snapshot holds a fresh copy of a collection.
+
+    A collection that is missing because its resource failed, or that is
+    served from the stale cache, says nothing about what exists on the NAS,
+    so its absence must not be taken as a removal.
+    """
+    snapshot = snapshot or {}
+    resource = COLLECTION_RESOURCES[collection]
+    return (
+        collection in snapshot
+        and resource not in snapshot.get("stale", {})
+        and resource not in snapshot.get("unavailable", ())
+    )
+
+
+def _round(value, digits=1):
+    return round(value, digits) if value is not None else None
+
+
+def summarize_disks(disks):
+    """Return enclosure-wide disk aggregates for one snapshot."""
+    temperatures = [
+        (disk["temperature"], disk["key"])
+        for disk in disks
+        if disk.get("temperature") is not None
+    ]
+    hottest = max(temperatures, key=lambda item: item[0]) if temperatures else None
+    not_online = [
+        disk["key"] for disk in disks if str(disk.get("status")).upper() != "ONLINE"
+    ]
+    return {
+        "disk_temp_max": hottest[0] if hottest else None,
+        "disk_temp_avg": round(
+            sum(temperature for temperature, _ in temperatures) / len(temperatures), 1
+        )
+        if temperatures
+        else None,
+        "hottest_disk": hottest[1] if hottest else None,
+        "disks_not_online": len(not_online),
+        "not_online_keys": not_online,
+    }
+
+
+def _push_top(heap, size, value, item):
+    """Keep the ``size`` largest values of a stream in a min-heap.
+
+    The share name breaks ties, so the item dicts are never compared.
+    """
+    entry = (value, item["name"], item)
+    if len(heap) < size:
+        heapq.heappush(heap, entry)
+    elif entry[:2] > heap[0][:2]:
+        heapq.heapreplace(heap, entry)
+
+
+def _ranked(heap):
+    """Return the items of a top heap, largest first."""
+    entries = sorted(heap, key=lambda entry: entry[:2], reverse=True)
+    return [item for _, _, item in entries]
+
+
+class HealthSchema:
+    """A field schema compiled for single-pass extraction.
+
+    ``parse`` visits every element of the tree once. An element whose tag
+    is in the schema opens a record, and descendants whose tags are among
+    its fields fill that record in. Records carry the element's resource-id
+    and the resource-id of the Enclosure_Health they were found under.
+    """
+
+    CONTEXT = "Enclosure_Health"
+
+    def __init__(self, schema, defaults=None):
+        """Compile a schema into tag lookups and record templates."""
+        defaults = defaults or {}
+        self.collections = [collection for collection, _ in schema.values()]
+        self._kinds = {}
+        for tag, (collection, fields) in schema.items():
+            template = {field: None for field, _ in fields.values()}
+            template.update(defaults.get(collection, {}))
+            self._kinds[tag] = (collection, fields, template)
+
+    def parse(self, root):
+        """Return {collection: [record, ...]} in document order."""
+        result = {collection: [] for collection in self.collections}
+        # (element, enclosure resource-id, (record, fields) being filled)
+        stack = [(root, None, None)]
+        while stack:
+            element, enclosure, owner = stack.pop()
+            if element.tag == self.CONTEXT:
+                enclosure = element.get("resource-id")
+            kind = self._kinds.get(element.tag)
+            if kind is not None:
+                collection, fields, template = kind
+                record = {
+                    **template,
+                    "resource_id": element.get("resource-id"),
+                    "enclosure": enclosure,
+                }
+                result[collection].append(record)
+                owner = (record, fields)
+            elif owner is not None:
+                field = owner[1].get(element.tag)
+                if field is not None and element.text and element.text.strip():
+                    name, convert = field
+                    try:
+                        owner[0][name] = convert(element.text.strip())
+                    except ValueError:
+                        pass
+            stack.extend((child, enclosure, owner) for child in reversed(element))
+        return result
+
+
+HEALTH_PARSER = HealthSchema(HEALTH_SCHEMA, HEALTH_DEFAULTS)
+
+
+class CounterRates:
+    """Turn monotonic counters into per-second rates between two samples.
+
+    A counter that went backwards is treated as a wrap (32-bit while the old
+    value fits in 32 bits, 64-bit otherwise). If the NAS uptime went
+    backwards it rebooted, every counter restarted and no rate is produced
+    until the next sample.
+    """
+
+    def __init__(self):
+        self._previous = {}
+        self._time = None
+        self._uptime = None
+
+    def update(self, counters, uptime=None, now=None):
+        """Store a sample and return the rates since the previous one."""
+        now = time.monotonic() if now is None else now
+        previous, previous_time, previous_uptime = (
+            self._previous,
+            self._time,
+            self._uptime,
+        )
+        self._previous, self._time, self._uptime = counters, now, uptime
+
+        if previous_time is None or now <= previous_time:
+            return {}
+        if (
+            uptime is not None
+            and previous_uptime is not None
+            and uptime < previous_uptime
+        ):
+            _LOGGER.debug("🔄 NAS uptime went backwards, resetting counters")
+            return {}
+
+        elapsed = now - previous_time
+        rates = {}
+        for key, value in counters.items():
+            old = previous.get(key)
+            if old is None:
+                continue
+            delta = value - old
+            if delta < 0:
+                delta += 2**32 if old < 2**32 else 2**64
+            rates[key] = delta / elapsed
+        return rates
+
+
+# Element and attribute name parts whose values identify a unit
+_SERIAL_NAMES = {"serial", "sn", "wwn"}
+_MAC_NAMES = {"mac", "macaddr", "hwaddr"}
+_MAC_RE = re.compile(r"\b[0-9A-Fa-f]{2}(?:[:-][0-9A-Fa-f]{2}){5}\b")
+_MAC_PLACEHOLDER = "02:00:00:00:"
+
+
+def _identifying(name):
+    """Placeholder kind for an element or attribute name, None if harmless."""
+    parts = set(name.rsplit("}", 1)[-1].lower().split("_"))
+    if parts & _MAC_NAMES:
+        return "mac"
+    if parts & _SERIAL_NAMES:
+        return "serial"
+    return None
+
+
+def request_signature(xml_payload):
+    """Stable key of an NML request, ignoring its transaction and op ids."""
+    try:
+        root = ET.fromstring(xml_payload)
+    except ET.ParseError:
+        return hashlib.sha1(xml_payload.strip().encode()).hexdigest()[:12]
+
+    ops = []
+    for op in root.iter():
+        if op.get("resource-type") is None:
+            continue
+        attributes = sorted(
+            (name, value) for name, value in op.attrib.items() if name != "id"
+        )
+        body = "".join(ET.tostring(child, encoding="unicode") for child in op)
+        ops.append((op.tag.rsplit("}", 1)[-1], attributes, re.sub(r"\s+", "", body)))
+    return hashlib.sha1(repr(ops).encode()).hexdigest()[:12]
+
+
+class FixtureRecorder:
+    """Write sanitized dbbroker request/response pairs to a directory.
+
+    Secrets (password, auth header, CSRF token) are blanked, and serial
+    numbers and MAC addresses are swapped for placeholders that stay
+    consistent across all fixtures written by one recorder, so a disk keeps
+    the same serial in its health and SMART responses.
+    """
+
+    def __init__(self, directory):
+        import os
+
+        self.directory = directory
+        self._placeholders = {}
+        os.makedirs(directory, exist_ok=True)
+
+    def _placeholder(self, value, kind):
+        key = (kind, value)
+        if key not in self._placeholders:
+            number = sum(1 for k in self._placeholders if k[0] == kind) + 1
+            self._placeholders[key] = (
+                f"{_MAC_PLACEHOLDER}{number >> 8 & 0xFF:02x}:{number & 0xFF:02x}"
+                if kind == "mac"
+                else f"SERIAL{number:04d}"
+            )
+        return self._placeholders[key]
+
+    def sanitize(self, text, secrets=()):
+        """Return text with secrets, serials and MAC addresses scrubbed."""
+        for secret in secrets:
+            if secret:
+                text = text.replace(secret, "REDACTED")
+
+        def _value(name, value):
+            kind = _identifying(name)
+            if kind is None or not value.strip():
+                return None
+            if kind == "mac":
+                value = value.strip().lower()
+            return self._placeholder(value.strip(), kind)
+
+        def _element(match):
+            tag, attributes, value = match.groups()
+            placeholder = _value(tag, value)
+            if placeholder is None:
+                return match.group(0)
+            return f"<{tag}{attributes}>{placeholder}</{tag}>"
+
+        def _attribute(match):
+            name, value = match.groups()
+            placeholder = _value(name, value)
+            if placeholder is None:
+                return match.group(0)
+            return f'{name}="{placeholder}"'
+
+        def _mac(match):
+            value = match.group(0).lower()
+            if value.startswith(_MAC_PLACEHOLDER):
+                return value
+            return self._placeholder(value, "mac")
+
+        text = re.sub(r"<([\w:.-]+)([^<>]*)>([^<]*)</\1>", _element, text)
+        text = re.sub(r'([\w:.-]+)="([^"]*)"', _attribute, text)
+        # MAC addresses also turn up in free text such as log messages
+        return _MAC_RE.sub(_mac, text)
+
+    async def record(self, resource, xml_payload, response_text, secrets=()):
+        """Store one exchange as ``<resource>-<signature>.json``."""
+        import json
+        import os
+
+        fixture = {
+            "resource": resource,
+            "request": self.sanitize(xml_payload, secrets),
+            "response": self.sanitize(response_text, secrets),
+        }
+        path = os.path.join(
+            self.directory, f"{resource}-{request_signature(xml_payload)}.json"
+        )
+
+        def _write():
+            with open(path, "w", encoding="utf-8") as handle:
+                json.dump(fixture, handle, indent=2)
+
+        await asyncio.get_running_loop().run_in_executor(None, _write)
+
+
+class ReplayTransport:
+    """Answer dbbroker requests from fixtures written by FixtureRecorder."""
+
+    def __init__(self, directory):
+        import json
+        import os
+
+        self.directory = directory
+        self.fixtures = {}
+        for filename in sorted(os.listdir(directory)):
+            if not filename.endswith(".json"):
+                continue
+            with open(os.path.join(directory, filename), encoding="utf-8") as handle:
+                fixture = json.load(handle)
+            self.fixtures[request_signature(fixture["request"])] = fixture["response"]
+
+    async def post(self, xml_payload, resource):
+        """Return the recorded response text, or None without a fixture."""
+        response_text = self.fixtures.get(request_signature(xml_payload))
+        if response_text is None:
+            _LOGGER.error(f"❌ No {resource} fixture in {self.directory}")
+        return response_text
+
 
 class ReadyNASAPI:
-    def __init__(self, host, username, password, use_ssl=False, ignore_ssl_errors=True):
-        """Initialize API connection with optional SSL settings."""
+    def __init__(
+        self,
+        host,
+        username,
+        password,
+        use_ssl=False,
+        ignore_ssl_errors=True,
+        cert_fingerprint=None,
+    ):
+        """Initialize API connection with optional SSL settings.
+
+        With a certificate fingerprint (SHA-256, hex) only that certificate
+        is accepted, whatever ignore_ssl_errors says.
+        """
         self.host = host
         self.username = username
         self.password = password
         self.use_ssl = use_ssl
         self.ignore_ssl_errors = ignore_ssl_errors
+        self.cert_fingerprint = cert_fingerprint
+        # ssl argument shared by every request, see _ssl_setting
+        self._ssl = self._ssl_setting()
 
         # Store protocol for consistent use
         self.protocol = "https" if self.use_ssl else "http"
         self.url = f"{self.protocol}://{self.host}/dbbroker"
         self.admin_url = f"{self.protocol}://{self.host}/admin/"
         self.csrf_token = None
+        # Pooled session whose cookie jar holds the NAS login, see _get_session
         self.session = None
+        # Whether the last login set a session cookie, so dbbroker requests
+        # can skip the Basic credentials (and the NAS its PAM check)
+        self._cookie_auth = False
+        # Logins (credential checks) made, for benchmarks and diagnostics
+        self.logins = 0
+
+        # Latest health snapshot, bumped generation on every successful poll
+        self.snapshot = {}
+        self.snapshot_time = None
+        self.generation = 0
+        # resource -> {"count", "errors", "seconds"} for every dbbroker request
+        self.request_stats = {}
+        self._rates = CounterRates()
+        # resource -> (last good parsed value, time it was fetched)
+        self._last_good = {}
+        # resource -> time of the last good value while serving it stale
+        self.stale = {}
+        self._csrf_lock = asyncio.Lock()
+        self._poll_lock = asyncio.Lock()
+        # Optional FixtureRecorder capturing traffic, and a ReplayTransport
+        # answering requests instead of the NAS
+        self.recorder = None
+        self.transport = None
+        # resource -> alternative telemetry transport (e.g. SNMP) reading it
+        self.telemetry = {}
+        # disk key -> last dbbroker disk dict, and collection -> last dbbroker
+        # temperature probes and fans, which telemetry readings overlay
+        self._disk_inventory = None
+        self._probe_inventory = {}
+
+    def _ssl_setting(self):
+        """Return the ssl argument for aiohttp, built once per API.
+
+        A pinned certificate is checked by its fingerprint, which also
+        accepts the NAS's self-signed certificate. Otherwise verification is
+        either off or left to aiohttp's default context. aiohttp builds each
+        of those contexts once per process, so no request builds its own.
+        """
+        if self.cert_fingerprint:
+            return aiohttp.Fingerprint(
+                bytes.fromhex(self.cert_fingerprint.replace(":", ""))
+            )
+        return not self.ignore_ssl_errors
+
+    async def pin_certificate(self, timeout=PROBE_TIMEOUT):
+        """Trust the certificate the NAS presents now (trust on first use).
+
+        Returns its SHA-256 fingerprint as hex, which later requests then
+        require, or None if no TLS connection could be made.
+        """
+        url = urlsplit(self.admin_url)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        try:
+            async with asyncio.timeout(timeout):
+                _, writer = await asyncio.open_connection(
+                    url.hostname, url.port or 443, ssl=context
+                )
+        except (OSError, TimeoutError) as e:
+            _LOGGER.debug(f"🔍 Could not read the certificate of {self.host}: {e}")
+            return None
+        try:
+            certificate = writer.get_extra_info("ssl_object").getpeercert(
+                binary_form=True
+            )
+        finally:
+            writer.close()
+
+        self.cert_fingerprint = hashlib.sha256(certificate).hexdigest()
+        self._ssl = self._ssl_setting()
+        _LOGGER.info(f"✅ Pinned certificate {self.cert_fingerprint} of {self.host}")
+        return self.cert_fingerprint
 
     async def _encode_credentials(self):
         """Encode username and password for Basic Authentication."""
         credentials = f"{self.username}:{self.password}"
         return base64.b64encode(credentials.encode()).decode()
 
-    async def _get_csrf_token(self):
-        """Fetch CSRF token asynchronously."""
-        _LOGGER.debug("🔍 Fetching CSRF token...")
-
-        headers = {
-            "Authorization": f"Basic {await self._encode_credentials()}",
-            "User-Agent": "HomeAssistant-ReadyNAS",
-        }
+    def _get_session(self):
+        """Return the pooled session, creating it on first use."""
+        if self.session is None or self.session.closed:
+            # unsafe keeps cookies from hosts given as an IP address
+            self.session = aiohttp.ClientSession(
+                cookie_jar=aiohttp.CookieJar(unsafe=True)
+            )
+        return self.session
+
+    async def close(self):
+        """Close the pooled session and forget the login."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        self.csrf_token = None
+        self._cookie_auth = False
+
+    @staticmethod
+    def _remaining(deadline):
+        """Seconds left until a loop-time deadline, None without one."""
+        if deadline is None:
+            return None
+        return deadline - asyncio.get_running_loop().time()
+
+    def _timeout(self, timeout, deadline):
+        """Client timeout for one request, capped by the remaining budget."""
+        remaining = self._remaining(deadline)
+        if remaining is not None:
+            timeout = min(timeout, remaining)
+        return aiohttp.ClientTimeout(
+            total=timeout, sock_connect=CONNECT_TIMEOUT, sock_read=READ_TIMEOUT
+        )
+
+    async def _get_csrf_token(self, deadline=None):
+        """Log in and fetch the CSRF token asynchronously.
+
+        The admin page is the only request that sends the credentials. Any
+        session cookie it sets is kept in the pooled session's jar and sent
+        with later dbbroker requests instead. Logins are serialized, and a
+        caller that waited for another login gets the token it fetched rather
+        than clearing the session that login just set up.
+        """
+        async with self._csrf_lock:
+            if self.csrf_token:
+                return self.csrf_token
+            _LOGGER.debug("🔍 Fetching CSRF token...")
 
-        ssl_context = ssl.SSLContext()
-        if self.ignore_ssl_errors:
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
+            headers = {
+                "Authorization": f"Basic {await self._encode_credentials()}",
+                "User-Agent": "HomeAssistant-ReadyNAS",
+            }
 
-        async with aiohttp.ClientSession() as session:
+            session = self._get_session()
+            # Start from a clean login rather than a session the NAS dropped
+            session.cookie_jar.clear()
+            self._cookie_auth = False
             try:
+                self.logins += 1
                 async with session.get(
-                    self.admin_url, headers=headers, ssl=ssl_context
+                    self.admin_url,
+                    headers=headers,
+                    ssl=self._ssl,
+                    timeout=self._timeout(30, deadline),
                 ) as response:
                     if response.status == 401:
                         _LOGGER.error("❌ 401 Unauthorized - Check username/password.")
@@ -61,29 +606,166 @@ class ReadyNASAPI:
                     )
                     if match:
                         self.csrf_token = match.group(1)
+                        self._cookie_auth = len(session.cookie_jar) > 0
                         # print(f"✅ CSRF Token Retrieved: {self.csrf_token}")
                         return self.csrf_token
                     else:
                         _LOGGER.error("❌ CSRF token not found in response!")
                         return None
-            except aiohttp.ClientError as e:
+            except aiohttp.ServerFingerprintMismatch as e:
+                _LOGGER.error(
+                    f"❌ {self.host} presented a different certificate than the pinned "
+                    f"one ({e.got.hex()}). Re-add the NAS if this change is expected."
+                )
+                return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 _LOGGER.error(f"❌ Error fetching CSRF token: {e}")
                 return None
 
-    async def get_health_info(self):
-        """Retrieve system health info asynchronously."""
+    async def probe(self, timeout=PROBE_TIMEOUT):
+        """Quickly check the NAS can be set up with these settings.
+
+        A TCP connect and an authenticated admin page load run concurrently
+        under one deadline, without retries. Returns None when the NAS
+        answered with a CSRF token (which is kept), otherwise one of
+        "cannot_connect", "timeout", "ssl_error", "invalid_auth" or
+        "not_readynas".
+        """
+        url = urlsplit(self.admin_url)
+        port = url.port or (443 if url.scheme == "https" else 80)
+        headers = {
+            "Authorization": f"Basic {await self._encode_credentials()}",
+            "User-Agent": "HomeAssistant-ReadyNAS",
+        }
+
+        async def _connect():
+            _, writer = await asyncio.open_connection(url.hostname, port)
+            writer.close()
+
+        async def _admin():
+            async with aiohttp.ClientSession() as session:
+                async with session.get(
+                    self.admin_url,
+                    headers=headers,
+                    ssl=self._ssl if url.scheme == "https" else False,
+                    allow_redirects=False,
+                ) as response:
+                    location = response.headers.get("Location", "")
+                    return response.status, location, await response.text()
+
+        connect = asyncio.ensure_future(_connect())
+        admin = asyncio.ensure_future(_admin())
+        try:
+            async with asyncio.timeout(timeout):
+                # A refused or unresolvable host fails the connect first
+                await asyncio.wait((connect, admin), return_when=asyncio.FIRST_COMPLETED)
+                if connect.done() and connect.exception() is not None:
+                    _LOGGER.debug(f"🔍 Probe connect failed: {connect.exception()}")
+                    return "cannot_connect"
+                status, location, text = await admin
+        except TimeoutError:
+            return "timeout"
+        except (aiohttp.ClientSSLError, aiohttp.ServerFingerprintMismatch) as e:
+            _LOGGER.debug(f"🔍 Probe TLS failed: {e}")
+            return "ssl_error"
+        except (aiohttp.ClientError, OSError) as e:
+            _LOGGER.debug(f"🔍 Probe request failed: {e}")
+            return "cannot_connect"
+        finally:
+            connect.cancel()
+            admin.cancel()
+
+        if status in (401, 403):
+            return "invalid_auth"
+        if url.scheme == "http" and (
+            (status in (301, 302, 307, 308) and location.lower().startswith("https"))
+            or (status == 400 and "https" in text.lower())
+        ):
+            # A redirect to the TLS port, or plain HTTP sent to it
+            return "ssl_error"
+        match = re.search(r'csrfInsert\("csrfpId", "([^"]+)"\);', text)
+        if status != 200 or match is None:
+            return "not_readynas"
+        self.csrf_token = match.group(1)
+        return None
+
+    async def get_health_info(self, budget=POLL_BUDGET):
+        """Retrieve system health info asynchronously.
+
+        The health, volume and OS requests run concurrently and share one
+        budget. Whatever is still running when it runs out is cancelled and
+        falls back to its last good value as stale. A call made while the
+        previous poll is still running returns the current snapshot instead
+        of starting another one.
+        """
         _LOGGER.debug("🚀 DEBUG: Entering `get_health_info()` function")
 
+        if self._poll_lock.locked():
+            _LOGGER.warning("⏳ Previous poll still running, skipping this one")
+            return self.snapshot
+
+        async with self._poll_lock:
+            return await self._poll_health(budget)
+
+    async def refresh(self, resources, budget=POLL_BUDGET):
+        """Re-fetch only the given health resources and return a new snapshot.
+
+        The other resources keep their last good values. Unlike a regular
+        poll this waits for a running poll to finish rather than skipping,
+        since the caller knows something changed after that poll began.
+        """
+        async with self._poll_lock:
+            return await self._poll_health(budget, resources)
+
+    async def _poll_health(self, budget, resources=HEALTH_RESOURCES):
+        """Run one health poll within the given number of seconds."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + budget
+        fetchers = {
+            "HealthInfo": self._get_basic_health,
+            "Volumes": self.get_volume_info,
+            "SystemInfo": self.get_os_info,
+        }
+        tasks = {
+            resource: asyncio.ensure_future(fetchers[resource](deadline=deadline))
+            for resource in resources
+            if resource in fetchers
+        }
+        if not tasks:
+            # Nothing to re-fetch, and asyncio.wait() rejects an empty set
+            return self.snapshot
+        try:
+            _, pending = await asyncio.wait(tasks.values(), timeout=budget)
+        finally:
+            for task in tasks.values():
+                task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+
+        results = {}
+        for resource, task in tasks.items():
+            if task.cancelled():
+                _LOGGER.warning(f"⏱️ {resource} missed the poll deadline")
+                results[resource] = self._serve_stale(resource)
+            elif task.exception() is not None:
+                raise task.exception()
+            else:
+                results[resource] = task.result()
+        for resource in HEALTH_RESOURCES:
+            if resource not in results:
+                cached = self._last_good.get(resource)
+                results[resource] = cached[0] if cached else None
+
         # Get basic health info first
         health_data = {}
 
         # Get disk and system info
-        basic_health = await self._get_basic_health()
+        basic_health = results["HealthInfo"]
         if basic_health:
             health_data.update(basic_health)
 
         # Get volume info
-        volume_data = await self.get_volume_info()
+        volume_data = results["Volumes"]
         if volume_data:
             _LOGGER.debug(f"📊 Volume data retrieved: {volume_data}")
             health_data["volumes"] = volume_data
@@ -91,112 +773,366 @@ class ReadyNASAPI:
             _LOGGER.error("❌ No volume data retrieved!")
 
         # Get OS Data
-        os_data = await self.get_os_info()
+        os_data = results["SystemInfo"]
         if os_data:
             _LOGGER.debug(f"📊 OS_Data data retrieved: {os_data}")
             health_data["os_data"] = os_data
         else:
             _LOGGER.error("❌ No os_data data retrieved!")
 
+        if "disks" in health_data:
+            health_data["enclosure"] = summarize_disks(health_data["disks"])
+
+        system_stats = health_data.pop("system_stats", None)
+        if "HealthInfo" in self.stale or "HealthInfo" not in tasks:
+            # Cached counters would read as zero rates, keep the last ones
+            if "performance" in self.snapshot:
+                health_data["performance"] = self.snapshot["performance"]
+        elif system_stats is not None:
+            uptime = (os_data or {}).get("uptime")
+            try:
+                uptime = float(uptime)
+            except (TypeError, ValueError):
+                uptime = None
+            health_data["performance"] = self._performance(system_stats, uptime)
+
+        now = time.time()
+        stale = {
+            resource: round(now - since)
+            for resource, since in self.stale.items()
+            if resource in HEALTH_RESOURCES
+        }
+        if stale:
+            health_data["stale"] = stale
+
+        # A resource with neither a fresh nor an unexpired value leaves its
+        # keys out. Name it, so its entities go unavailable rather than
+        # looking removed.
+        unavailable = [resource for resource in HEALTH_RESOURCES if not results[resource]]
+        if unavailable and health_data:
+            health_data["unavailable"] = unavailable
+
+        if health_data:
+            self.snapshot = health_data
+            self.snapshot_time = time.time()
+            self.generation += 1
+
         return health_data
 
+    def _record_request(self, resource, seconds, ok):
+        """Account a dbbroker request against its resource."""
+        stats = self.request_stats.get(resource)
+        if stats is None:
+            stats = self.request_stats[resource] = {
+                "count": 0,
+                "errors": 0,
+                "seconds": 0.0,
+            }
+        stats["count"] += 1
+        stats["seconds"] += seconds
+        if not ok:
+            stats["errors"] += 1
+
     async def parse_health_info(self, xml_data):
-        """Parse ReadyNAS XML health data and extract key metrics asynchronously."""
+        """Parse ReadyNAS XML health data in one pass over the tree.
+
+        Every temperature probe, fan, power supply and disk of every
+        enclosure is kept. ``cpu_temp`` and ``fan_speed`` are the first
+        probe and fan, as the single sensors always reported.
+        """
+        parsed_data = HEALTH_PARSER.parse(ET.fromstring(xml_data))
+
+        enclosures = []
+        for index, disk in enumerate(parsed_data["disks"]):
+            if disk["enclosure"] not in enclosures:
+                enclosures.append(disk["enclosure"])
+            disk["key"] = self._disk_key(disk, index, enclosures)
+            del disk["channel"]
+
+        temperatures = parsed_data["temperatures"]
+        fans = parsed_data["fans"]
+        parsed_data["cpu_temp"] = temperatures[0]["value"] if temperatures else None
+        parsed_data["fan_speed"] = fans[0]["speed"] if fans else None
+        return parsed_data
+
+    @staticmethod
+    def _disk_key(disk, index, enclosures):
+        """Return a stable key for a disk record.
+
+        The bay (channel) survives a hot-swap, the resource-id is the next best
+        thing and the list position is only used when the NAS reports neither.
+        Bays of expansion enclosures are prefixed with the enclosure id, so
+        they don't collide with the head unit's.
+        """
+        channel = disk["channel"]
+        if channel:
+            if enclosures.index(disk["enclosure"]) > 0:
+                return f"{disk['enclosure']}-{channel}"
+            return channel
+        if disk["resource_id"]:
+            return disk["resource_id"]
+        return str(index)
+
+    async def get_smart_info(self, resource_ids):
+        """Fetch SMART counters for the given disks in one transaction.
+
+        Returns a dict of resource-id -> tuple of counters ordered as
+        SMART_FIELDS, with None for counters the NAS does not report.
+        """
+        _LOGGER.debug("🚀 DEBUG: Entering `get_smart_info()` function")
+        if not resource_ids:
+            return {}
+
+        gets = "".join(
+            f'<xs:get id="njl_id_{3000 + i}" resource-id="{resource_id}" resource-type="Disk"/>'
+            for i, resource_id in enumerate(resource_ids)
+        )
+        xml_payload = f"""<?xml version="1.0" encoding="UTF-8"?>
+            <xs:nml xmlns:xs="http://www.netgear.com/protocol/transaction/NMLSchema-0.9" xmlns="urn:netgear:nas:readynasd" src="dpv_1740071202000" dst="nas">
+                <xs:transaction id="njl_id_2999">{gets}</xs:transaction>
+            </xs:nml>"""
+
+        return await self._fetch(xml_payload, "Disk", self.parse_smart_info)
+
+    async def parse_smart_info(self, xml_data):
+        """Parse per-disk resources into compact SMART counter tuples."""
         root = ET.fromstring(xml_data)
+        smart = {}
 
-        parsed_data = {"fan_speed": None, "cpu_temp": None, "disks": []}
-
-        for enclosure in root.findall(".//Enclosure_Health"):
-            temp_element = enclosure.find(".//Temperature")
-            if temp_element is not None:
-                parsed_data["cpu_temp"] = int(temp_element.find("temp_value").text)
-
-            fan_element = enclosure.find(".//Fan")
-            if fan_element is not None:
-                parsed_data["fan_speed"] = int(fan_element.find("fan_speed").text)
-
-            for disk in enclosure.findall(".//Disk"):
-                disk_data = {
-                    "model": disk.find("disk_model").text
-                    if disk.find("disk_model") is not None
-                    else "Unknown",
-                    "temperature": int(disk.find("disk_temperature").text)
-                    if disk.find("disk_temperature") is not None
-                    else None,
-                    "status": disk.find("disk_status").text
-                    if disk.find("disk_status") is not None
-                    else "Unknown",
-                    "capacity": int(disk.find("disk_capacity").text)
-                    if disk.find("disk_capacity") is not None
-                    else None,
-                }
-                parsed_data["disks"].append(disk_data)
+        for disk in root.iter("Disk"):
+            resource_id = disk.get("resource-id")
+            if not resource_id or resource_id in smart:
+                continue
+            counters = []
+            for _, names in SMART_FIELDS:
+                value = None
+                for name in names:
+                    text = disk.findtext(f".//{name}")
+                    if text is not None and text.strip().lstrip("-").isdigit():
+                        value = int(text)
+                        break
+                counters.append(value)
+            smart[resource_id] = tuple(counters)
+
+        return smart
+
+    async def get_snapshots(self, volume, page_size=SNAPSHOT_PAGE_SIZE):
+        """List the snapshots of a volume, one page per transaction.
+
+        Returns a dict of snapshot id -> (created epoch, size in bytes), or
+        None if a page could not be fetched. Paging stops at a short page or
+        at a page that brings no new ids, which also covers firmware that
+        ignores the paging attributes and returns everything at once.
+        """
+        _LOGGER.debug(f"🚀 DEBUG: Listing snapshots of volume {volume}")
+        snapshots = {}
+        start = 0
+        while True:
+            xml_payload = f"""<?xml version="1.0" encoding="UTF-8"?>
+                <xs:nml xmlns:xs="http://www.netgear.com/protocol/transaction/NMLSchema-0.9" xmlns="urn:netgear:nas:readynasd" src="dpv_1740071202000" dst="nas">
+                    <xs:transaction id="njl_id_3101">
+                        <xs:get id="njl_id_3100" resource-id="{volume}" resource-type="Snapshot_Collection" start="{start}" count="{page_size}"/>
+                    </xs:transaction>
+                </xs:nml>"""
 
-        return parsed_data
+            response_text = await self._post_nml(xml_payload, resource="Snapshots")
+            if response_text is None:
+                return None
 
-    async def get_os_info(self):
-        """Get OS data from the NAS."""
-        _LOGGER.debug("🚀 DEBUG: Entering `get_os_info()` function")
+            try:
+                page = self.parse_snapshot_page(response_text)
+            except ET.ParseError as e:
+                _LOGGER.error(f"❌ XML parsing error: {e}")
+                return None
 
-        if not self.csrf_token:
-            _LOGGER.debug("🔍 No CSRF token found, fetching a new one...")
-            if not await self._get_csrf_token():
-                print("❌ Failed to get CSRF token")
+            new = page.keys() - snapshots.keys()
+            snapshots.update(page)
+            if len(page) < page_size or not new:
+                return snapshots
+            start += len(page)
+
+    @staticmethod
+    def parse_snapshot_page(xml_data):
+        """Extract (created, size) per snapshot without keeping the tree.
+
+        Each Snapshot element is cleared as soon as it has been read, so a
+        page of hundreds of snapshots never lives in memory as a whole.
+        """
+        parser = ET.XMLPullParser(events=("end",))
+        parser.feed(xml_data)
+        parser.close()
+
+        page = {}
+        for _, element in parser.read_events():
+            if element.tag != "Snapshot":
+                continue
+            snapshot_id = element.get("resource-id") or element.findtext(
+                "Snapshot_Name"
+            )
+            if snapshot_id:
+                try:
+                    created = int(element.findtext("Timestamp", "0"))
+                    size = int(element.findtext("Size", "0"))
+                except ValueError:
+                    created, size = 0, 0
+                page[snapshot_id] = (created, size)
+            element.clear()
+        return page
+
+    async def get_top_shares(
+        self, count=TOP_SHARES, previous=None, page_size=SHARE_PAGE_SIZE
+    ):
+        """Rank every share by usage and by growth, keeping the top ``count``.
+
+        Shares are listed one page per transaction and streamed through two
+        bounded min-heaps, so at most ``count`` shares per ranking are kept
+        however many the NAS has. Growth is measured against ``previous``
+        (share name -> used bytes of the last listing) and only ranked when
+        it is given. Returns the share count and space totals, both rankings
+        and the used bytes per share for the next call, or None if a page
+        could not be fetched.
+        """
+        _LOGGER.debug("🚀 DEBUG: Listing shares")
+        usage = {}
+        totals = {"count": 0, "used_bytes": 0, "quota_bytes": 0}
+        by_usage, by_growth = [], []
+        start = 0
+        while True:
+            xml_payload = f"""<?xml version="1.0" encoding="UTF-8"?>
+                <xs:nml xmlns:xs="http://www.netgear.com/protocol/transaction/NMLSchema-0.9" xmlns="urn:netgear:nas:readynasd" src="dpv_1740071202000" dst="nas">
+                    <xs:transaction id="njl_id_3201">
+                        <xs:get id="njl_id_3200" resource-id="Shares" resource-type="Share_Collection" start="{start}" count="{page_size}"/>
+                    </xs:transaction>
+                </xs:nml>"""
 
-        headers = {
-            "X-Requested-With": "XMLHttpRequest",
-            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-            "Authorization": f"Basic {await self._encode_credentials()}",
-            "csrfpId": self.csrf_token,
+            response_text = await self._post_nml(xml_payload, resource="Shares")
+            if response_text is None:
+                return None
+
+            listed = new = 0
+            try:
+                for share in self.parse_share_page(response_text):
+                    listed += 1
+                    # Firmware ignoring the paging attributes repeats shares
+                    if share["name"] in usage:
+                        continue
+                    new += 1
+                    usage[share["name"]] = share["used_bytes"]
+                    totals["count"] += 1
+                    totals["used_bytes"] += share["used_bytes"]
+                    totals["quota_bytes"] += share["quota_bytes"] or 0
+                    _push_top(by_usage, count, share["used_bytes"], share)
+                    if previous is not None:
+                        share["growth_bytes"] = share["used_bytes"] - previous.get(
+                            share["name"], 0
+                        )
+                        _push_top(by_growth, count, share["growth_bytes"], share)
+            except ET.ParseError as e:
+                _LOGGER.error(f"❌ XML parsing error: {e}")
+                return None
+
+            if listed < page_size or not new:
+                break
+            start += listed
+
+        return {
+            **totals,
+            "top_usage": _ranked(by_usage),
+            "top_growth": _ranked(by_growth),
+            "usage": usage,
         }
 
-        xml_payload = """<?xml version="1.0" encoding="UTF-8"?>             <xs:nml xmlns:xs="http://www.netgear.com/protocol/transaction/NMLSchema-0.9" xmlns="urn:netgear:nas:readynasd" src="dpv_1740683609000" dst="nas">                <xs:transaction id="njl_id_265">                    <xs:get id="njl_id_264" resource-id="SystemInfo" resource-type="SystemInfo"></xs:get>                </xs:transaction>            </xs:nml>"""
+    @staticmethod
+    def parse_share_page(xml_data):
+        """Yield the shares of a page without keeping the tree.
 
-        ssl_context = ssl.SSLContext()
-        if self.ignore_ssl_errors:
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
+        Usage is reported in KB (DataUsedKB) and the quota in MB, 0 meaning
+        no quota. Each Share element is cleared once it has been read.
+        """
+        parser = ET.XMLPullParser(events=("end",))
+        parser.feed(xml_data)
+        parser.close()
 
-        async with aiohttp.ClientSession() as session:
-            try:
-                _LOGGER.debug(f"🌐 Making request to URL: {self.url}")
-                async with session.post(
-                    self.url,
-                    headers=headers,
-                    data=xml_payload,
-                    ssl=ssl_context,
-                    timeout=30,
-                ) as response:
-                    _LOGGER.debug(f"📡 Response status: {response.status}")
+        for _, element in parser.read_events():
+            if element.tag != "Share":
+                continue
+            name = element.findtext("Share_Name") or element.get("resource-id")
+            if name:
+                try:
+                    used_kb = int(float(element.findtext("DataUsedKB", "0")))
+                    quota_mb = int(float(element.findtext("Quota", "0")))
+                except ValueError:
+                    used_kb, quota_mb = 0, 0
+                yield {
+                    "name": name,
+                    "volume": element.findtext("Volume"),
+                    "used_bytes": used_kb * 1024,
+                    "quota_bytes": quota_mb * 1024 * 1024 or None,
+                }
+            element.clear()
 
-                    # Add 403 handling
-                    if response.status in (401, 403):
-                        _LOGGER.error(
-                            f"❌ {response.status} Error - Session/CSRF expired, retrying..."
-                        )
-                        self.csrf_token = None
+    async def get_backup_jobs(self):
+        """List the backup jobs (rsync, cloud and USB) in one transaction.
 
-                    response_text = await response.text()
-                    if not response_text or response_text.isspace():
-                        _LOGGER.error("❌ Empty response received!")
+        Returns a dict of job id -> job, or None if the jobs could not be
+        listed. Times are epoch seconds, None when the NAS reports none.
+        """
+        _LOGGER.debug("🚀 DEBUG: Listing backup jobs")
+        xml_payload = """<?xml version="1.0" encoding="UTF-8"?>
+            <xs:nml xmlns:xs="http://www.netgear.com/protocol/transaction/NMLSchema-0.9" xmlns="urn:netgear:nas:readynasd" src="dpv_1740071202000" dst="nas">
+                <xs:transaction id="njl_id_3301">
+                    <xs:get id="njl_id_3300" resource-id="BackupJobs" resource-type="BackupJob_Collection"/>
+                </xs:transaction>
+            </xs:nml>"""
 
-                    _LOGGER.debug(f"📜 Full XML Response: {response_text}")
+        response_text = await self._post_nml(xml_payload, resource="Backups")
+        if response_text is None:
+            return None
 
-                    try:
-                        data = await self.parse_os_info(response_text)
-                        if data:
-                            return data
-                    except ET.ParseError as e:
-                        _LOGGER.error(f"❌ XML parsing error: {e}")
-                        _LOGGER.error(
-                            f"❌ Problematic XML content: {response_text[:200]}..."
-                        )
+        try:
+            return self.parse_backup_jobs(response_text)
+        except ET.ParseError as e:
+            _LOGGER.error(f"❌ XML parsing error: {e}")
+            return None
 
-            except aiohttp.ClientError as e:
-                _LOGGER.error(f"❌ Error fetching ReadyNAS health info: {e}")
+    @staticmethod
+    def parse_backup_jobs(xml_data):
+        """Extract the state and last run of every BackupJob element."""
 
-        _LOGGER.error("❌ All retry attempts failed")
-        return None
+        def _number(element, tag):
+            try:
+                return _integer(element.findtext(tag))
+            except (TypeError, ValueError):
+                return None
+
+        jobs = {}
+        for element in ET.fromstring(xml_data).iter("BackupJob"):
+            job_id = element.get("resource-id")
+            if not job_id:
+                continue
+            running = (element.findtext("Status") or "").strip().lower() == "running"
+            jobs[job_id] = {
+                "name": element.findtext("Job_Name") or job_id,
+                "type": (element.findtext("Job_Type") or "unknown").lower(),
+                "running": running,
+                "progress": _number(element, "Progress") if running else None,
+                "result": (element.findtext("Last_Run_Status") or "").lower() or None,
+                "started": _number(element, "Last_Run_Start") or None,
+                "finished": _number(element, "Last_Run_End") or None,
+                "bytes": _number(element, "Bytes_Transferred"),
+                "next_run": _number(element, "Next_Run") or None,
+            }
+        return jobs
+
+    async def get_os_info(self, deadline=None):
+        """Get OS data from the NAS."""
+        _LOGGER.debug("🚀 DEBUG: Entering `get_os_info()` function")
+
+        xml_payload = """<?xml version="1.0" encoding="UTF-8"?>             <xs:nml xmlns:xs="http://www.netgear.com/protocol/transaction/NMLSchema-0.9" xmlns="urn:netgear:nas:readynasd" src="dpv_1740683609000" dst="nas">                <xs:transaction id="njl_id_265">                    <xs:get id="njl_id_264" resource-id="SystemInfo" resource-type="SystemInfo"></xs:get>                </xs:transaction>            </xs:nml>"""
+
+        return await self._fetch(
+            xml_payload, "SystemInfo", self.parse_os_info, deadline
+        )
 
     async def parse_os_info(self, xml_data):
         """Parse ReadyNAS XML OS data and extract key metrics asynchronously."""
@@ -216,178 +1152,208 @@ class ReadyNASAPI:
 
         return os_data
 
-    async def _get_basic_health(self):
+    async def _get_basic_health(self, deadline=None):
         """Get basic health information from the NAS."""
         _LOGGER.debug("🚀 DEBUG: Entering `_get_basic_health()` function")
-        # print(f"🌐 Using {self.protocol.upper()} protocol")
-
-        # Add retry logic
-        retries = 3
-        while retries > 0:
-            if not self.csrf_token:
-                _LOGGER.debug("🔍 No CSRF token found, fetching a new one...")
-                if not await self._get_csrf_token():
-                    print("❌ Failed to get CSRF token")
-                    retries -= 1
-                    continue
 
-            headers = {
-                "X-Requested-With": "XMLHttpRequest",
-                "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-                "Authorization": f"Basic {await self._encode_credentials()}",
-                "csrfpId": self.csrf_token,
-            }
-
-            xml_payload = """<?xml version="1.0" encoding="UTF-8"?>
+        xml_payload = """<?xml version="1.0" encoding="UTF-8"?>
             <xs:nml xmlns:xs="http://www.netgear.com/protocol/transaction/NMLSchema-0.9" xmlns="urn:netgear:nas:readynasd" src="dpv_1739644512000" dst="nas">
                 <xs:transaction id="njl_id_2912">
                     <xs:get id="njl_id_2911" resource-id="HealthInfo" resource-type="Health_Collection" />
+                    <xs:get id="njl_id_2913" resource-id="SystemStats" resource-type="System_Stats" />
                 </xs:transaction>
             </xs:nml>"""
 
-            ssl_context = ssl.SSLContext()
-            if self.ignore_ssl_errors:
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-
-            async with aiohttp.ClientSession() as session:
-                try:
-                    _LOGGER.debug(f"🌐 Making request to URL: {self.url}")
-                    async with session.post(
-                        self.url,
-                        headers=headers,
-                        data=xml_payload,
-                        ssl=ssl_context,
-                        timeout=30,
-                    ) as response:
-                        _LOGGER.debug(f"📡 Response status: {response.status}")
-
-                        # Add 403 handling
-                        if response.status in (401, 403):
-                            _LOGGER.error(
-                                f"❌ {response.status} Error - Session/CSRF expired, retrying..."
-                            )
-                            self.csrf_token = None
-                            retries -= 1
-                            continue
-                        response_text = await response.text()
-                        if not response_text or response_text.isspace():
-                            _LOGGER.error("❌ Empty response received!")
-                            retries -= 1
-                            await asyncio.sleep(1)  # Wait before retry
-                            continue
-
-                        _LOGGER.debug(f"📜 Full XML Response: {response_text}")
+        transport = self.telemetry.get("HealthInfo")
+        if transport is not None and self._disk_inventory is not None:
+            health = await self._fetch_telemetry(transport, "HealthInfo", deadline)
+            if health is not None:
+                return health
+            # Telemetry failed or saw a new disk, fall back to dbbroker
+
+        health = await self._fetch(
+            xml_payload, "HealthInfo", self._parse_health_and_stats, deadline
+        )
+        if health and "HealthInfo" not in self.stale:
+            self._disk_inventory = {disk["key"]: disk for disk in health["disks"]}
+            self._probe_inventory = {
+                collection: health.get(collection, [])
+                for collection in ("temperatures", "fans", "psus")
+            }
+        return health
+
+    async def _fetch_telemetry(self, transport, resource, deadline=None):
+        """Read HealthInfo through a telemetry transport.
+
+        The transport only supplies temperatures, fan speed, disk state and
+        counters. Disk, probe and fan identity (resource id, name, model,
+        capacity) comes from the last dbbroker reading, so None is returned
+        for a disk that reading did not know about or a probe or fan count
+        that changed, as well as when the transport failed.
+        """
+        start = time.monotonic()
+        try:
+            telemetry = await transport.fetch(resource, deadline)
+        except Exception as e:
+            _LOGGER.error(f"❌ Telemetry transport failed for {resource}: {e}")
+            telemetry = None
+        self._record_request(
+            f"{resource}:telemetry", time.monotonic() - start, telemetry is not None
+        )
+        if telemetry is None:
+            return None
+
+        disks = []
+        for reading in telemetry["disks"]:
+            known = self._disk_inventory.get(reading["key"])
+            if known is None:
+                _LOGGER.debug(f"🔍 Disk {reading['key']} not in inventory yet")
+                return None
+            disks.append(
+                {
+                    **known,
+                    "status": reading["status"],
+                    "temperature": reading["temperature"],
+                }
+            )
 
-                        try:
-                            data = await self.parse_health_info(response_text)
-                            if data:
-                                return data
-                        except ET.ParseError as e:
-                            _LOGGER.error(f"❌ XML parsing error: {e}")
-                            _LOGGER.error(
-                                f"❌ Problematic XML content: {response_text[:200]}..."
-                            )
+        health = {
+            **telemetry,
+            "disks": disks,
+            "psus": self._probe_inventory.get("psus", []),
+        }
+        for collection, field in (("temperatures", "value"), ("fans", "speed")):
+            known = self._probe_inventory.get(collection, [])
+            readings = telemetry.get(collection, [])
+            if len(readings) != len(known):
+                _LOGGER.debug(f"🔍 {collection} changed since the inventory")
+                return None
+            health[collection] = [
+                {**probe, field: reading} for probe, reading in zip(known, readings)
+            ]
+        self._last_good[resource] = (health, time.time())
+        self.stale.pop(resource, None)
+        return health
+
+    async def _parse_health_and_stats(self, xml_data):
+        """Parse the health and statistics parts of one batched response."""
+        health = await self.parse_health_info(xml_data)
+        if health:
+            health["system_stats"] = await self.parse_system_stats(xml_data)
+        return health
+
+    async def parse_system_stats(self, xml_data):
+        """Parse the System_Stats resource into gauges and raw counters.
+
+        Counters are keyed by tuples such as ("net", "eth0", "rx_bytes") and
+        are turned into rates by CounterRates, gauges are used as they are.
+        """
+        root = ET.fromstring(xml_data)
+        stats = {
+            "counters": {},
+            "memory_percent": None,
+            "load_1m": None,
+            "interfaces": [],
+            "disks": [],
+        }
 
-                    retries -= 1
-                    await asyncio.sleep(1)  # Wait before retry
+        def _int(element, name):
+            text = element.findtext(name)
+            try:
+                return int(text)
+            except (TypeError, ValueError):
+                return None
 
-                except aiohttp.ClientError as e:
-                    _LOGGER.error(f"❌ Error fetching ReadyNAS health info: {e}")
-                    retries -= 1
-                    await asyncio.sleep(1)  # Wait before retry
+        cpu = root.find(".//System_Stats/CPU")
+        if cpu is not None:
+            for field in CPU_FIELDS:
+                value = _int(cpu, field)
+                if value is not None:
+                    stats["counters"][("cpu", field)] = value
+
+        memory = root.find(".//System_Stats/Memory")
+        if memory is not None:
+            total = _int(memory, "total_kb")
+            available = _int(memory, "available_kb")
+            if total and available is not None:
+                stats["memory_percent"] = round((total - available) / total * 100, 1)
+
+        load = root.findtext(".//System_Stats/Load/load_1m")
+        if load is not None:
+            try:
+                stats["load_1m"] = float(load)
+            except ValueError:
+                pass
+
+        for kind, tag, fields in (
+            ("net", "Interface", ("rx_bytes", "tx_bytes")),
+            ("disk", "Disk_IO", ("reads", "writes", "sectors_read", "sectors_written")),
+        ):
+            for element in root.findall(f".//System_Stats/{tag}"):
+                name = element.get("name")
+                if not name:
                     continue
+                stats["interfaces" if kind == "net" else "disks"].append(name)
+                for field in fields:
+                    value = _int(element, field)
+                    if value is not None:
+                        stats["counters"][(kind, name, field)] = value
+
+        return stats
+
+    def _performance(self, system_stats, uptime):
+        """Convert one System_Stats sample into rates and gauges."""
+        rates = self._rates.update(system_stats["counters"], uptime)
+
+        cpu = [rates[("cpu", field)] for field in CPU_FIELDS if ("cpu", field) in rates]
+        cpu_total = sum(cpu)
+        idle = rates.get(("cpu", "idle"), 0) + rates.get(("cpu", "iowait"), 0)
+        performance = {
+            "cpu_percent": round((cpu_total - idle) / cpu_total * 100, 1)
+            if cpu_total
+            else None,
+            "memory_percent": system_stats["memory_percent"],
+            "load_1m": system_stats["load_1m"],
+            "interfaces": {},
+            "disks": {},
+        }
 
-            _LOGGER.error(f"⚠️ Retry attempt {3 - retries} failed")
+        for name in system_stats["interfaces"]:
+            performance["interfaces"][name] = {
+                "rx_bytes_per_s": _round(rates.get(("net", name, "rx_bytes"))),
+                "tx_bytes_per_s": _round(rates.get(("net", name, "tx_bytes"))),
+            }
+        for name in system_stats["disks"]:
+            read = rates.get(("disk", name, "sectors_read"))
+            written = rates.get(("disk", name, "sectors_written"))
+            performance["disks"][name] = {
+                "read_iops": _round(rates.get(("disk", name, "reads"))),
+                "write_iops": _round(rates.get(("disk", name, "writes"))),
+                "read_bytes_per_s": _round(
+                    read * SECTOR_SIZE if read is not None else None
+                ),
+                "write_bytes_per_s": _round(
+                    written * SECTOR_SIZE if written is not None else None
+                ),
+            }
 
-        _LOGGER.error("❌ All retry attempts failed")
-        return None
+        return performance
 
-    # Add this method to the ReadyNASAPI class
-    async def get_volume_info(self):
+    async def get_volume_info(self, deadline=None):
         """Retrieve volume info asynchronously."""
         _LOGGER.debug("🚀 DEBUG: Entering `get_volume_info()` function")
         _LOGGER.debug(f"🌐 Using {self.protocol.upper()} protocol")
 
-        retries = 3
-        while retries > 0:
-            if not self.csrf_token:
-                _LOGGER.info("🔍 No CSRF token found, fetching a new one...")
-                if not await self._get_csrf_token():
-                    _LOGGER.error("❌ Failed to get CSRF token")
-                    retries -= 1
-                    continue
-
-            headers = {
-                "X-Requested-With": "XMLHttpRequest",
-                "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-                "Authorization": f"Basic {await self._encode_credentials()}",
-                "csrfpId": self.csrf_token,
-            }
-
-            xml_payload = """<?xml version="1.0" encoding="UTF-8"?>
+        xml_payload = """<?xml version="1.0" encoding="UTF-8"?>
             <xs:nml xmlns:xs="http://www.netgear.com/protocol/transaction/NMLSchema-0.9" xmlns="urn:netgear:nas:readynasd" src="dpv_1740071202000" dst="nas">
                 <xs:transaction id="njl_id_281">
                     <xs:get id="njl_id_280" resource-id="Volumes" resource-type="Volume_Collection"/>
                 </xs:transaction>
             </xs:nml>"""
 
-            ssl_context = ssl.SSLContext()
-            if self.ignore_ssl_errors:
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-
-            async with aiohttp.ClientSession() as session:
-                try:
-                    _LOGGER.debug(f"🌐 Making request to URL: {self.url}")
-                    async with session.post(
-                        self.url,
-                        headers=headers,
-                        data=xml_payload,
-                        ssl=ssl_context,
-                        timeout=30,
-                    ) as response:
-                        _LOGGER.debug(f"📡 Response status: {response.status}")
-
-                        # Add 403 handling
-                        if response.status in (401, 403):
-                            _LOGGER.error(
-                                f"❌ {response.status} Error - Session/CSRF expired, retrying..."
-                            )
-                            self.csrf_token = None
-                            retries -= 1
-                            continue
-
-                        response_text = await response.text()
-                        if not response_text or response_text.isspace():
-                            _LOGGER.error("❌ Empty response received!")
-                            retries -= 1
-                            await asyncio.sleep(1)
-                            continue
-
-                        _LOGGER.debug(f"📜 Full XML Response: {response_text}")
-
-                        try:
-                            data = await self.parse_volume_info(response_text)
-                            if data:
-                                return data
-                        except ET.ParseError as e:
-                            _LOGGER.error(f"❌ XML parsing error: {e}")
-                            _LOGGER.error(
-                                f"❌ Problematic XML content: {response_text[:200]}..."
-                            )
-
-                    retries -= 1
-                    await asyncio.sleep(1)
-
-                except aiohttp.ClientError as e:
-                    _LOGGER.error(f"❌ Error fetching ReadyNAS volume info: {e}")
-                    retries -= 1
-                    await asyncio.sleep(1)
-                    continue
-
-        _LOGGER.error("❌ All retry attempts failed")
-        return None
+        return await self._fetch(
+            xml_payload, "Volumes", self.parse_volume_info, deadline
+        )
 
     async def parse_volume_info(self, xml_data):
         """Parse ReadyNAS XML volume data and extract metrics asynchronously."""
@@ -399,6 +1365,9 @@ class ReadyNASAPI:
             if props is not None:
                 volume_data = {
                     "name": props.findtext("Volume_Name", "Unknown"),
+                    "capacity_kb": int(float(props.findtext("Capacity", "0"))),
+                    "free_kb": int(float(props.findtext("Free", "0"))),
+                    "used_kb": int(float(props.findtext("DataUsedKB", "0"))),
                     "raid_level": props.findtext("RAID_Level", "Unknown"),
                     "health": props.findtext("Health", "Unknown"),
                     "capacity_gb": round(
@@ -408,7 +1377,7 @@ class ReadyNASAPI:
                         float(props.findtext("Free", "0")) / (1024 * 1024), 2
                     ),
                     "used_gb": round(
-                        float(props.findtext("DataUsedKB", "0")) / 1024, 2
+                        float(props.findtext("DataUsedKB", "0")) / (1024 * 1024), 2
                     ),
                     "encryption_enabled": props.find("Encryption").get("enabled", "0")
                     == "1",
@@ -441,21 +1410,16 @@ class ReadyNASAPI:
 
         return volumes
 
-    async def shutdown_nas(self):
+    async def ensure_csrf_token(self, deadline=None):
+        """Return the CSRF token, fetching it only when none is cached."""
+        if self.csrf_token:
+            return self.csrf_token
+        return await self._get_csrf_token(deadline)
+
+    async def shutdown_nas(self, timeout=30, retries=3):
         """Shutdown the NAS system."""
         _LOGGER.debug("🚀 DEBUG: Entering `shutdown_nas()` function")
 
-        if not self.csrf_token:
-            _LOGGER.debug("🔍 No CSRF token found, fetching a new one...")
-            await self._get_csrf_token()
-
-        headers = {
-            "X-Requested-With": "XMLHttpRequest",
-            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-            "Authorization": f"Basic {await self._encode_credentials()}",
-            "csrfpId": self.csrf_token,
-        }
-
         xml_payload = """<?xml version="1.0" encoding="UTF-8"?>
         <xs:nml xmlns:xs="http://www.netgear.com/protocol/transaction/NMLSchema-0.9" xmlns="urn:netgear:nas:readynasd" src="dpv_1584484996000" dst="nas">
             <xs:transaction id="njl_id_1628">
@@ -465,150 +1429,468 @@ class ReadyNASAPI:
             </xs:transaction>
         </xs:nml>"""
 
-        ssl_context = ssl.SSLContext()
-        if self.ignore_ssl_errors:
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-
-        async with aiohttp.ClientSession() as session:
+        if (
+            await self._post_nml(
+                xml_payload, timeout=timeout, retries=retries, resource="Shutdown"
+            )
+            is None
+        ):
+            _LOGGER.error("❌ Failed to send shutdown command")
+            return False
+
+        _LOGGER.info("✅ Shutdown command sent successfully")
+        return True
+
+    async def wait_until_offline(self, interval=2, connect_timeout=2):
+        """Wait until the NAS stops accepting connections on its web port.
+
+        Only a refused or timed out connection counts as offline. Any other
+        error (a name that does not resolve, say) proves nothing about the
+        NAS, so it is logged and the check repeated until the caller's
+        deadline.
+        """
+        url = urlsplit(self.admin_url)
+        port = url.port or (443 if url.scheme == "https" else 80)
+        while True:
             try:
-                async with session.post(
-                    self.url, headers=headers, data=xml_payload, ssl=ssl_context
-                ) as response:
-                    if response.status == 401:
-                        _LOGGER.error(
-                            "❌ 401 Unauthorized - Session expired, retrying..."
-                        )
-                        await self._get_csrf_token()
-                        return False
+                _, writer = await asyncio.wait_for(
+                    asyncio.open_connection(url.hostname, port), connect_timeout
+                )
+            except (ConnectionRefusedError, asyncio.TimeoutError):
+                _LOGGER.info(f"✅ {self.host} no longer answering")
+                return
+            except OSError as e:
+                _LOGGER.warning(f"⚠️ Could not check whether {self.host} is down: {e}")
+            else:
+                writer.close()
+            await asyncio.sleep(interval)
+
+    async def get_fan_mode(self, deadline=None):
+        """Get current fan mode."""
+        _LOGGER.debug("🚀 DEBUG: Entering `get_fan_mode()` function")
 
-                    if response.status == 200:
-                        _LOGGER.info("✅ Shutdown command sent successfully")
-                        return True
-                    else:
-                        _LOGGER.error(
-                            f"❌ Failed to send shutdown command. Status: {response.status}"
-                        )
-                        return False
+        xml_payload = """<?xml version="1.0" encoding="UTF-8"?>
+                <xs:nml xmlns:xs="http://www.netgear.com/protocol/transaction/NMLSchema-0.9" xmlns="urn:netgear:nas:readynasd" src="dpv_1740323925000" dst="nas">
+                    <xs:transaction id="njl_id_2153">
+                        <xs:get id="njl_id_2152" resource-id="FanConfig" resource-type="System">
+                    </xs:get>
+                    </xs:transaction>
+                </xs:nml>"""
 
-            except aiohttp.ClientError as e:
-                _LOGGER.error(f"❌ Error sending shutdown command: {e}")
-                return False
+        fan_mode = await self._fetch(
+            xml_payload, "FanConfig", self.parse_fan_mode, deadline
+        )
+        return fan_mode or "unknown"
 
-    async def get_fan_mode(self):
-        """Get current fan mode."""
-        _LOGGER.debug("🚀 DEBUG: Entering `get_fan_mode()` function")
+    async def parse_fan_mode(self, xml_data):
+        """Parse the fan mode from a FanConfig response."""
+        root = ET.fromstring(xml_data)
+        fan_config = root.find(".//FanConfig")
+        if fan_config is None:
+            _LOGGER.error("❌ No fan config found in response")
+            return "unknown"
+        return fan_config.get("mode", "unknown")
 
-        # Add retry logic
-        retries = 3
+    async def set_fan_mode(self, mode):
+        """Set fan mode to cool, balanced, or quiet.
+
+        The set and a confirming get are sent in one transaction, so the mode
+        the NAS reports back is known without a second round trip. Returns the
+        confirmed mode, or None if the request failed.
+        """
+        if mode not in ["cool", "balanced", "quiet"]:
+            raise ValueError("Invalid fan mode. Must be 'cool', 'balanced', or 'quiet'")
+
+        xml_payload = f"""<?xml version="1.0" encoding="UTF-8"?>
+            <xs:nml xmlns:xs="http://www.netgear.com/protocol/transaction/NMLSchema-0.9" xmlns="urn:netgear:nas:readynasd" src="dpv_1740323925000" dst="nas">
+                <xs:transaction id="njl_id_2347">
+                    <xs:set id="njl_id_2346" resource-id="FanConfig" resource-type="System"><FanConfig mode="{mode}"/></xs:set>
+                    <xs:get id="njl_id_2348" resource-id="FanConfig" resource-type="System"></xs:get>
+                </xs:transaction>
+            </xs:nml>"""
+
+        response_text = await self._post_nml(xml_payload, resource="FanConfig")
+        if response_text is None:
+            return None
+
+        try:
+            root = ET.fromstring(response_text)
+        except ET.ParseError as e:
+            _LOGGER.error(f"❌ XML parsing error: {e}")
+            return None
+
+        # The set echoes nothing useful, the get carries the applied mode
+        fan_configs = root.findall(".//FanConfig")
+        if not fan_configs:
+            _LOGGER.error("❌ No fan config found in response")
+            return None
+        confirmed = fan_configs[-1].get("mode", "unknown")
+        _LOGGER.debug(f"🌀 Fan mode requested {mode}, NAS reports {confirmed}")
+        return confirmed
+
+    async def _fetch(self, xml_payload, resource, parser, deadline=None):
+        """POST a transaction and parse the response, retrying bad payloads.
+
+        Successful results are kept per resource. While that last good value
+        is younger than the resource's expiry a failure costs one attempt and
+        returns the cached value, marking the resource stale until a later
+        call succeeds.
+        """
+        cached = self._last_good.get(resource)
+        expiry = RESOURCE_EXPIRY.get(resource)
+        usable = (
+            cached is not None
+            and expiry is not None
+            and time.time() - cached[1] < expiry
+        )
+        retries = 1 if usable else 3
+
+        data = await self._fetch_uncached(
+            xml_payload, resource, parser, retries, deadline
+        )
+        if data:
+            self._last_good[resource] = (data, time.time())
+            self.stale.pop(resource, None)
+            return data
+
+        return self._serve_stale(resource)
+
+    def _serve_stale(self, resource):
+        """Return the resource's last good value if not expired, marking it stale."""
+        cached = self._last_good.get(resource)
+        expiry = RESOURCE_EXPIRY.get(resource)
+        if cached is not None and expiry is not None:
+            age = time.time() - cached[1]
+            if age < expiry:
+                _LOGGER.warning(
+                    f"⚠️ {resource} failed, serving the value from {age:.0f}s ago"
+                )
+                self.stale[resource] = cached[1]
+                return cached[0]
+
+        self.stale.pop(resource, None)
+        return None
+
+    async def _fetch_uncached(
+        self, xml_payload, resource, parser, retries, deadline=None
+    ):
+        """POST a transaction and parse the response, retrying bad payloads."""
         while retries > 0:
+            response_text = await self._post_nml(
+                xml_payload, retries=retries, resource=resource, deadline=deadline
+            )
+            if response_text is None:
+                return None
+
+            _LOGGER.debug(f"📜 Full XML Response: {response_text}")
+
+            try:
+                data = await parser(response_text)
+                if data:
+                    return data
+            except ET.ParseError as e:
+                _LOGGER.error(f"❌ XML parsing error: {e}")
+                _LOGGER.error(f"❌ Problematic XML content: {response_text[:200]}...")
+
+            retries -= 1
+            if retries > 0 and not await self._backoff(deadline):
+                break
+
+        _LOGGER.error(f"❌ All retry attempts for {resource} failed")
+        return None
+
+    async def _backoff(self, deadline, delay=1):
+        """Sleep before a retry, False if the deadline leaves no room for one."""
+        remaining = self._remaining(deadline)
+        if remaining is not None and remaining <= delay:
+            return False
+        await asyncio.sleep(delay)
+        return True
+
+    async def _post_nml(
+        self,
+        xml_payload,
+        timeout=30,
+        retries=3,
+        resource="Transaction",
+        deadline=None,
+    ):
+        """POST an NML transaction to dbbroker and return the response text.
+
+        A CSRF token is fetched when missing or rejected, and failed attempts
+        are retried. Requests ride on the session cookie of the last login
+        when the NAS set one, so the credentials are only sent again after a
+        401 or 403. Every attempt gets separate connect and read timeouts and
+        none outlives the loop-time deadline, if given. Returns None once all
+        retries or the time budget are used up.
+        """
+        relogged_in = False
+        while retries > 0:
+            remaining = self._remaining(deadline)
+            if remaining is not None and remaining <= 0:
+                _LOGGER.error(f"❌ {resource} ran out of time")
+                return None
+
+            if self.transport is not None:
+                start = time.monotonic()
+                response_text = await self.transport.post(xml_payload, resource)
+                self._record_request(
+                    resource, time.monotonic() - start, response_text is not None
+                )
+                return response_text
+
             if not self.csrf_token:
+                # Concurrent requests share the token the first one fetches
                 _LOGGER.debug("🔍 No CSRF token found, fetching a new one...")
-                if not await self._get_csrf_token():
+                await self._get_csrf_token(deadline)
+                if not self.csrf_token:
                     _LOGGER.error("❌ Failed to get CSRF token")
                     retries -= 1
                     continue
 
-            xml_payload = """<?xml version="1.0" encoding="UTF-8"?>
-                <xs:nml xmlns:xs="http://www.netgear.com/protocol/transaction/NMLSchema-0.9" xmlns="urn:netgear:nas:readynasd" src="dpv_1740323925000" dst="nas">
-                    <xs:transaction id="njl_id_2153">
-                        <xs:get id="njl_id_2152" resource-id="FanConfig" resource-type="System">
-                    </xs:get>
-                    </xs:transaction>
-                </xs:nml>"""
-
             headers = {
                 "X-Requested-With": "XMLHttpRequest",
                 "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-                "Authorization": f"Basic {await self._encode_credentials()}",
                 "csrfpId": self.csrf_token,
             }
+            if not self._cookie_auth:
+                # No session cookie to ride on, authenticate every request
+                headers["Authorization"] = (
+                    f"Basic {await self._encode_credentials()}"
+                )
 
-            ssl_context = ssl.SSLContext()
-            if self.ignore_ssl_errors:
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-
+            start = time.monotonic()
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        self.url,
-                        headers=headers,
-                        data=xml_payload,
-                        ssl=ssl_context,
-                        timeout=30,
-                    ) as response:
-                        _LOGGER.debug(f"📡 Response status: {response.status}")
-
-                        if response.status in (401, 403):
+                async with self._get_session().post(
+                    self.url,
+                    headers=headers,
+                    data=xml_payload,
+                    ssl=self._ssl,
+                    timeout=self._timeout(timeout, deadline),
+                ) as response:
+                    _LOGGER.debug(f"📡 Response status: {response.status}")
+
+                    if response.status in (401, 403):
+                        # The first rejection is usually just an expired session
+                        if relogged_in:
                             _LOGGER.error(
-                                f"❌ {response.status} Error - Session/CSRF expired, retrying..."
+                                f"❌ {response.status} Error - {resource} rejected "
+                                f"again after logging in, retrying..."
+                            )
+                        else:
+                            _LOGGER.debug(
+                                f"🔍 {response.status} - Session/CSRF expired, "
+                                f"logging in again..."
                             )
+                        self._record_request(
+                            resource, time.monotonic() - start, False
+                        )
+                        # Log in again before the next attempt, unless a
+                        # concurrent request already did. An expired session
+                        # cookie is routine and costs no retry, once.
+                        if self.csrf_token == headers["csrfpId"]:
                             self.csrf_token = None
+                        if "Authorization" in headers or relogged_in:
                             retries -= 1
-                            continue
+                        relogged_in = True
+                        continue
 
-                        response_text = await response.text()
-                        if not response_text or response_text.isspace():
-                            _LOGGER.error("❌ Empty response received!")
-                            retries -= 1
-                            await asyncio.sleep(1)
-                            continue
-
-                        try:
-                            root = ET.fromstring(response_text)
-                            fan_config = root.find(".//FanConfig")
-                            if fan_config is not None:
-                                return fan_config.get("mode", "unknown")
-                            _LOGGER.error("❌ No fan config found in response")
-                            return "unknown"
-                        except ET.ParseError as e:
-                            _LOGGER.error(f"❌ XML parsing error: {e}")
-                            _LOGGER.debug(
-                                f"📜 Problematic XML content: {response_text[:200]}..."
+                    response_text = await response.text()
+                    if response.status == 200 and response_text.strip():
+                        self._record_request(
+                            resource, time.monotonic() - start, True
+                        )
+                        if self.recorder is not None:
+                            await self.recorder.record(
+                                resource,
+                                xml_payload,
+                                response_text,
+                                secrets=(
+                                    self.password,
+                                    await self._encode_credentials(),
+                                    self.csrf_token,
+                                ),
                             )
+                        return response_text
 
-            except aiohttp.ClientError as e:
-                _LOGGER.error(f"❌ Error fetching fan mode: {e}")
-                retries -= 1
-                await asyncio.sleep(1)
-                continue
+                    _LOGGER.error(
+                        f"❌ Unexpected response. Status: {response.status}"
+                    )
+
+            except aiohttp.ServerFingerprintMismatch as e:
+                # Retrying cannot help, the certificate is not the pinned one
+                _LOGGER.error(f"❌ Certificate mismatch posting to ReadyNAS: {e}")
+                self._record_request(resource, time.monotonic() - start, False)
+                return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                _LOGGER.error(f"❌ Error posting to ReadyNAS: {e}")
+
+            self._record_request(resource, time.monotonic() - start, False)
 
             retries -= 1
-            await asyncio.sleep(1)
+            if retries > 0 and not await self._backoff(deadline):
+                break
 
         _LOGGER.error("❌ All retry attempts failed")
-        return "unknown"
+        return None
 
-    async def set_fan_mode(self, mode):
-        """Set fan mode to cool, balanced, or quiet."""
-        if mode not in ["cool", "balanced", "quiet"]:
-            raise ValueError("Invalid fan mode. Must be 'cool', 'balanced', or 'quiet'")
 
-        xml_payload = f"""<?xml version="1.0" encoding="UTF-8"?>
-            <xs:nml xmlns:xs="http://www.netgear.com/protocol/transaction/NMLSchema-0.9" xmlns="urn:netgear:nas:readynasd" src="dpv_1740323925000" dst="nas">
-                <xs:transaction id="njl_id_2347">
-                    <xs:set id="njl_id_2346" resource-id="FanConfig" resource-type="System"><FanConfig mode="{mode}"/></xs:set>
-                </xs:transaction>
-            </xs:nml>"""
+BENCH_RESOURCES = {
+    "HealthInfo": "_get_basic_health",
+    "Volumes": "get_volume_info",
+    "SystemInfo": "get_os_info",
+    "FanConfig": "get_fan_mode",
+}
 
-        headers = {
-            "X-Requested-With": "XMLHttpRequest",
-            "Content-Type": "application/x-www-form-urlencoded; charset=UTF-8",
-            "Authorization": f"Basic {await self._encode_credentials()}",
-            "csrfpId": self.csrf_token,
+
+async def _poll(apis, output):
+    """Poll every host concurrently and print one snapshot per host."""
+    import json
+
+    async def _one(api):
+        start = time.monotonic()
+        data = await api.get_health_info()
+        return {
+            "host": api.host,
+            "ok": bool(data),
+            "seconds": round(time.monotonic() - start, 3),
+            "data": data,
         }
 
-        ssl_context = ssl.SSLContext()
-        if self.ignore_ssl_errors:
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.url,
-                headers=headers,
-                data=xml_payload,
-                ssl=ssl_context,
-            ) as response:
-                return response.status == 200
+    results = await asyncio.gather(*(_one(api) for api in apis))
+    if output == "ndjson":
+        for result in results:
+            print(json.dumps(result))
+    else:
+        print(json.dumps(results, indent=2))
+    return all(result["ok"] for result in results)
+
+
+async def _bench(apis, iterations):
+    """Time every resource on every host and print latency percentiles."""
+    import json
+    import statistics
+
+    async def _one(api):
+        samples = {resource: [] for resource in BENCH_RESOURCES}
+        failures = {resource: 0 for resource in BENCH_RESOURCES}
+        for _ in range(iterations):
+            for resource, method in BENCH_RESOURCES.items():
+                start = time.monotonic()
+                result = await getattr(api, method)()
+                # A stale value stands in for a failed request, time none of it
+                if result in (None, "unknown") or resource in api.stale:
+                    failures[resource] += 1
+                else:
+                    samples[resource].append(time.monotonic() - start)
+
+        report = {}
+        for resource, values in samples.items():
+            if len(values) > 1:
+                cuts = statistics.quantiles(values, n=100, method="inclusive")
+                p50, p90, p99 = cuts[49], cuts[89], cuts[98]
+            else:
+                p50 = p90 = p99 = values[0] if values else None
+            report[resource] = {
+                "ok": len(values),
+                "failed": failures[resource],
+                "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+                "p90_ms": round(p90 * 1000, 1) if p90 is not None else None,
+                "p99_ms": round(p99 * 1000, 1) if p99 is not None else None,
+                "max_ms": round(max(values) * 1000, 1) if values else None,
+            }
+        return {"host": api.host, "iterations": iterations, "resources": report}
+
+    results = await asyncio.gather(*(_one(api) for api in apis))
+    print(json.dumps(results, indent=2))
+    return all(
+        stats["failed"] == 0
+        for result in results
+        for stats in result["resources"].values()
+    )
+
+
+def main(argv=None):
+    """Command line entry point: ``python -P pyreadynas.py poll|bench HOST...``."""
+    import argparse
+    import os
+
+    parser = argparse.ArgumentParser(
+        prog="pyreadynas", description="Poll or benchmark ReadyNAS units."
+    )
+    parser.add_argument("command", choices=("poll", "bench"))
+    parser.add_argument("hosts", nargs="+", metavar="HOST")
+    parser.add_argument(
+        "-u", "--username", default=os.environ.get("READYNAS_USERNAME", "admin")
+    )
+    parser.add_argument(
+        "-p",
+        "--password",
+        default=os.environ.get("READYNAS_PASSWORD"),
+        help="defaults to $READYNAS_PASSWORD",
+    )
+    parser.add_argument("--no-ssl", action="store_true", help="use plain HTTP")
+    parser.add_argument(
+        "--verify-ssl", action="store_true", help="verify the NAS certificate"
+    )
+    parser.add_argument(
+        "--fingerprint",
+        metavar="SHA256",
+        help="only accept the NAS certificate with this SHA-256 fingerprint",
+    )
+    parser.add_argument("-o", "--output", choices=("json", "ndjson"), default="json")
+    parser.add_argument(
+        "-n", "--iterations", type=int, default=10, help="bench iterations"
+    )
+    parser.add_argument(
+        "--record",
+        metavar="DIR",
+        help="write sanitized request/response fixtures to DIR/HOST",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="DIR",
+        help="answer requests from the fixtures in DIR/HOST instead of the NAS",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.record and args.replay:
+        parser.error("--record and --replay are mutually exclusive")
+    if args.replay:
+        args.password = args.password or ""
+    if args.password is None:
+        parser.error("a password is required (-p or $READYNAS_PASSWORD)")
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.CRITICAL)
+
+    apis = [
+        ReadyNASAPI(
+            host,
+            args.username,
+            args.password,
+            use_ssl=not args.no_ssl,
+            ignore_ssl_errors=not args.verify_ssl,
+            cert_fingerprint=args.fingerprint,
+        )
+        for host in args.hosts
+    ]
+    for api in apis:
+        if args.record:
+            api.recorder = FixtureRecorder(os.path.join(args.record, api.host))
+        if args.replay:
+            api.transport = ReplayTransport(os.path.join(args.replay, api.host))
+
+    async def _run():
+        try:
+            if args.command == "poll":
+                return await _poll(apis, args.output)
+            return await _bench(apis, args.iterations)
+        finally:
+            await asyncio.gather(*(api.close() for api in apis))
+
+    return 0 if asyncio.run(_run()) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
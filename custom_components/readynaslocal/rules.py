@@ -0,0 +1,179 @@
+"""Problem rules evaluated against every volume and disk of a snapshot.
+
+The options flow compiles the configured thresholds into plain rule specs
+that are stored with the entry. RuleEngine builds each spec's comparison
+once and evaluates all rules in one pass per snapshot, keeping the state
+of every (rule, target) pair so threshold rules only clear once the value
+is back past the hysteresis margin.
+"""
+
+import operator
+
+from .const import (
+    CONF_DISK_HEALTHY,
+    CONF_DISK_TEMPERATURE,
+    CONF_RULE_HYSTERESIS,
+    CONF_VOLUME_FREE_GB,
+    CONF_VOLUME_HEALTHY,
+    CONF_VOLUME_USED_PERCENT,
+)
+
+DEFAULT_RULE_OPTIONS = {
+    CONF_VOLUME_USED_PERCENT: 90,
+    CONF_VOLUME_FREE_GB: 0,
+    CONF_DISK_TEMPERATURE: 50,
+    CONF_VOLUME_HEALTHY: "REDUNDANT",
+    CONF_DISK_HEALTHY: "ONLINE",
+    CONF_RULE_HYSTERESIS: 5,
+}
+
+# (rule id, option, name, scope, metric, problem when above the threshold),
+# a threshold of 0 disables the rule
+THRESHOLD_RULES = (
+    (
+        "used_space",
+        CONF_VOLUME_USED_PERCENT,
+        "Used Space",
+        "volume",
+        "used_percentage",
+        True,
+    ),
+    ("free_space", CONF_VOLUME_FREE_GB, "Free Space", "volume", "free_gb", False),
+    ("temperature", CONF_DISK_TEMPERATURE, "Temperature", "disk", "temperature", True),
+)
+# (rule id, option, name, scope, metric), a problem when the value is not
+# in the comma separated allowed set; an empty set disables the rule
+ALLOWED_RULES = (
+    ("health", CONF_VOLUME_HEALTHY, "Health", "volume", "health"),
+    ("status", CONF_DISK_HEALTHY, "Status", "disk", "status"),
+)
+
+# Snapshot list and identifying field of each scope
+SCOPES = {"volume": ("volumes", "name"), "disk": ("disks", "key")}
+
+
+def compile_rules(options):
+    """Return the rule specs for a set of options, defaults filling the gaps."""
+    options = {**DEFAULT_RULE_OPTIONS, **options}
+    margin = float(options[CONF_RULE_HYSTERESIS]) / 100
+    specs = []
+
+    for rule_id, option, name, scope, metric, above in THRESHOLD_RULES:
+        threshold = float(options[option])
+        if threshold <= 0:
+            continue
+        clear = threshold * (1 - margin if above else 1 + margin)
+        specs.append(
+            {
+                "id": f"{scope}_{rule_id}",
+                "name": name,
+                "scope": scope,
+                "metric": metric,
+                "above": above,
+                "on": threshold,
+                "off": round(clear, 2),
+            }
+        )
+
+    for rule_id, option, name, scope, metric in ALLOWED_RULES:
+        allowed = sorted(
+            {value.strip().upper() for value in str(options[option]).split(",")} - {""}
+        )
+        if not allowed:
+            continue
+        specs.append(
+            {
+                "id": f"{scope}_{rule_id}",
+                "name": name,
+                "scope": scope,
+                "metric": metric,
+                "allowed": allowed,
+            }
+        )
+    return specs
+
+
+class Rule:
+    """One compiled rule spec."""
+
+    def __init__(self, spec):
+        """Build the comparison for a spec."""
+        self.spec = spec
+        self.id = spec["id"]
+        self.name = spec["name"]
+        self.scope = spec["scope"]
+        self.metric = spec["metric"]
+
+        if "allowed" in spec:
+            allowed = frozenset(spec["allowed"])
+            self._check = lambda value, active: str(value).upper() not in allowed
+            return
+
+        on, off = spec["on"], spec["off"]
+        trip, clear = (
+            (operator.ge, operator.lt) if spec["above"] else (operator.le, operator.gt)
+        )
+
+        def _check(value, active):
+            if active:
+                return not clear(value, off)
+            return trip(value, on)
+
+        self._check = _check
+
+    def evaluate(self, value, active):
+        """Return whether the rule is in problem state, None without a value."""
+        if value is None:
+            return None
+        try:
+            return self._check(value, active)
+        except TypeError:
+            return None
+
+    def attributes(self):
+        """Return the thresholds as entity attributes."""
+        if "allowed" in self.spec:
+            return {"allowed": self.spec["allowed"]}
+        clear = "clear_below" if self.spec["above"] else "clear_above"
+        return {"threshold": self.spec["on"], clear: self.spec["off"]}
+
+
+class RuleEngine:
+    """Evaluate every rule against every volume and disk once per snapshot."""
+
+    def __init__(self, specs):
+        """Initialize the engine from compiled rule specs."""
+        self.rules = [Rule(spec) for spec in specs]
+        # (rule id, target) -> (problem, value) for the last evaluated snapshot
+        self.results = {}
+        self._data = None
+
+    @staticmethod
+    def targets(data, scope):
+        """Return {target key: item} of a scope in a snapshot."""
+        collection, field = SCOPES[scope]
+        return {
+            str(item[field]): item
+            for item in (data or {}).get(collection) or []
+            if item.get(field) is not None
+        }
+
+    def evaluate(self, data):
+        """Evaluate a snapshot, reusing the result when it was seen already."""
+        if data is self._data:
+            return self.results
+        self._data = data
+
+        results = {}
+        targets = {scope: self.targets(data, scope) for scope in SCOPES}
+        for rule in self.rules:
+            for key, item in targets[rule.scope].items():
+                value = item.get(rule.metric)
+                previous = self.results.get((rule.id, key), (None, None))[0]
+                problem = rule.evaluate(value, bool(previous))
+                if problem is None:
+                    # Keep the last state through a missing reading
+                    problem = previous
+                results[(rule.id, key)] = (problem, value)
+        self.results = results
+        return results
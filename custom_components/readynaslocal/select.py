@@ -1,11 +1,13 @@
 """Select entities for ReadyNAS integration."""
 
+import asyncio
 import logging
 from datetime import timedelta
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
@@ -14,6 +16,7 @@ from homeassistant.helpers.update_coordinator import (
 )
 
 from .const import DOMAIN
+from .pyreadynas import POLL_BUDGET
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,7 +44,9 @@ async def async_setup_entry(
         "manufacturer": "NETGEAR",
         "model": "ReadyNAS",
     }
-    async_add_entities([ReadyNASFanMode(coordinator, entry, api, device_info)], True)
+    # The coordinator has just been refreshed, an update before add would
+    # fetch the fan mode a second time
+    async_add_entities([ReadyNASFanMode(coordinator, entry, api, device_info)])
 
 
 async def async_update_data(hass: HomeAssistant, entry: ConfigEntry, api):
@@ -53,7 +58,9 @@ async def async_update_data(hass: HomeAssistant, entry: ConfigEntry, api):
         api.url = f"{api.protocol}://{api.host}/dbbroker"
         api.admin_url = f"{api.protocol}://{api.host}/admin/"
 
-        fan_mode = await api.get_fan_mode()
+        fan_mode = await api.get_fan_mode(
+            deadline=asyncio.get_running_loop().time() + POLL_BUDGET
+        )
         return {"fan_mode": fan_mode}
     except Exception as err:
         _LOGGER.error("Error updating ReadyNAS data: %s", err)
@@ -85,5 +92,24 @@ class ReadyNASFanMode(CoordinatorEntity, SelectEntity):
 
     async def async_select_option(self, option: str) -> None:
         """Change the fan mode."""
-        await self._api.set_fan_mode(option)
-        await self.coordinator.async_request_refresh()
+        previous = self.coordinator.data
+
+        # Show the new mode straight away, the set transaction confirms it
+        self.coordinator.async_set_updated_data(
+            {**(previous or {}), "fan_mode": option}
+        )
+
+        confirmed = await self._api.set_fan_mode(option)
+        if confirmed != option:
+            _LOGGER.error(
+                "Fan mode change to %s not confirmed (NAS reports %s), rolling back",
+                option,
+                confirmed,
+            )
+            if confirmed in self._attr_options:
+                self.coordinator.async_set_updated_data(
+                    {**(previous or {}), "fan_mode": confirmed}
+                )
+            else:
+                self.coordinator.async_set_updated_data(previous)
+            raise HomeAssistantError(f"Failed to set fan mode to {option}")
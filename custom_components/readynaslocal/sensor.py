@@ -2,6 +2,7 @@
 
 import logging
 import time
+from collections import deque
 from datetime import datetime, timedelta, timezone
 
 from homeassistant.components.sensor import (
@@ -10,15 +11,49 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry  # Add this import
-from homeassistant.core import HomeAssistant  # Add this import
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
 from homeassistant.helpers.entity import (
     DeviceInfo,
     EntityCategory,  # Add this import at the top
 )
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
 
-from .const import DOMAIN  # Add DOMAIN import
-from .pyreadynas import ReadyNASAPI
+from .const import (  # Add DOMAIN import
+    BACKUP_ACTIVE_INTERVAL,
+    BACKUP_HISTORY,
+    BACKUP_IDLE_INTERVAL,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_TOP_SHARES,
+    DEFAULT_TOP_SHARES,
+    DOMAIN,
+    EVENT_BACKUP_COMPLETED,
+    EVENT_BACKUP_FAILED,
+    EVENT_SNAPSHOT_CREATED,
+    EVENT_SNAPSHOT_DELETED,
+    SIGNAL_ALERT,
+    SIGNAL_SNAPSHOT,
+    SHARE_SCAN_INTERVAL,
+    SMART_SCAN_INTERVAL,
+    SNAPSHOT_SCAN_INTERVAL,
+    STATISTICS_SENSOR_KEYS,
+    STATISTICS_VOLUME_METRICS,
+)
+from .pyreadynas import (
+    BACKUP_SUCCESS,
+    HEALTH_RESOURCES,
+    SMART_FIELDS,
+    ReadyNASAPI,
+    collection_current,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -51,19 +86,40 @@ async def async_setup_entry(
         "serial_number": coordinator.data.get("os_data", {}).get("serial_number"),
     }
 
+    statistics_mode = entry.options.get(CONF_LONG_TERM_STATISTICS, False)
+
     # Add basic sensors
-    entities.append(
-        ReadyNASSensor(coordinator, "cpu_temp", "CPU Temperature", "°C", device_info)
-    )
-    entities.append(
-        ReadyNASSensor(
-            coordinator=coordinator,
-            sensor_key="fan_speed",
-            name="Fan Speed",
-            unit="RPM",  # Changed to RPM
-            device_info=device_info,
+    if statistics_mode:
+        # Temperatures, fan speeds, volume usage and performance rates go to
+        # long-term statistics instead
+        from .long_term_statistics import ReadyNASStatistics
+
+        statistics = ReadyNASStatistics(hass, coordinator, host, entry.entry_id)
+        entry.async_on_unload(coordinator.async_add_listener(statistics.async_record))
+        entry.async_on_unload(statistics.async_suspend)
+
+        registry = er.async_get(hass)
+        for sensor_key in STATISTICS_SENSOR_KEYS:
+            entity_id = registry.async_get_entity_id(
+                "sensor", DOMAIN, f"readynas_{host}_{sensor_key}"
+            )
+            if entity_id:
+                registry.async_remove(entity_id)
+    else:
+        entities.append(
+            ReadyNASSensor(
+                coordinator, "cpu_temp", "CPU Temperature", "°C", device_info
+            )
+        )
+        entities.append(
+            ReadyNASSensor(
+                coordinator=coordinator,
+                sensor_key="fan_speed",
+                name="Fan Speed",
+                unit="RPM",  # Changed to RPM
+                device_info=device_info,
+            )
         )
-    )
     # Add the os info sensors
     for os_key, os_value in coordinator.data.get("os_data", {}).items():
         if os_key == "mac_address":
@@ -89,66 +145,719 @@ async def async_setup_entry(
                     device_info=device_info,
                 )
             )
-    # Add disk sensors - one per disk with attributes
-    for idx, disk in enumerate(coordinator.data.get("disks", [])):
-        entities.append(
-            ReadyNASDiskSensor(
-                coordinator=coordinator, disk_index=idx, device_info=device_info
+    # Numeric sensors that change every poll, which statistics mode imports
+    # as long-term statistics instead of creating
+    high_frequency = []
+    # Enclosure aggregates are computed by the API once per snapshot
+    if "enclosure" in coordinator.data:
+        for key, name, device_class, unit, icon in ENCLOSURE_METRICS:
+            (high_frequency if unit is not None else entities).append(
+                ReadyNASEnclosureSensor(
+                    coordinator, key, name, device_class, unit, icon, device_info
+                )
+            )
+    # Extra temperature probes, fans and power supplies of larger units and
+    # expansion enclosures
+    for collection, field, prefix, device_class, unit, icon in PROBE_METRICS:
+        skip = 1 if collection in ("temperatures", "fans") else 0
+        for index, probe in enumerate(coordinator.data.get(collection, [])):
+            if index < skip:
+                continue
+            (high_frequency if unit is not None else entities).append(
+                ReadyNASProbeSensor(
+                    coordinator,
+                    collection,
+                    field,
+                    index,
+                    f"{prefix} {probe.get('name') or index + 1}",
+                    device_class,
+                    unit,
+                    icon,
+                    device_info,
+                )
             )
+    # Performance rates are computed by the API from the batched statistics
+    performance = coordinator.data.get("performance")
+    if performance is not None:
+        for key, name, unit, icon in PERFORMANCE_METRICS:
+            high_frequency.append(
+                ReadyNASPerformanceSensor(
+                    coordinator, (key,), name, unit, icon, device_info
+                )
+            )
+        for interface in performance["interfaces"]:
+            for key, name, unit, icon in INTERFACE_METRICS:
+                high_frequency.append(
+                    ReadyNASPerformanceSensor(
+                        coordinator,
+                        ("interfaces", interface, key),
+                        f"{interface} {name}",
+                        unit,
+                        icon,
+                        device_info,
+                    )
+                )
+        for disk in performance["disks"]:
+            for key, name, unit, icon in DISK_IO_METRICS:
+                high_frequency.append(
+                    ReadyNASPerformanceSensor(
+                        coordinator,
+                        ("disks", disk, key),
+                        f"{disk} {name}",
+                        unit,
+                        icon,
+                        device_info,
+                    )
+                )
+    if statistics_mode:
+        # Drop the entities these had before statistics mode was enabled
+        registry = er.async_get(hass)
+        for entity in high_frequency:
+            entity_id = registry.async_get_entity_id("sensor", DOMAIN, entity.unique_id)
+            if entity_id:
+                registry.async_remove(entity_id)
+    else:
+        entities.extend(high_frequency)
+
+    # SMART counters change slowly, so they are polled on their own tier
+    smart_coordinator = DataUpdateCoordinator(
+        hass,
+        _LOGGER,
+        name=f"ReadyNAS {host} SMART",
+        update_method=lambda: async_update_smart_data(coordinator, api),
+        update_interval=SMART_SCAN_INTERVAL,
+    )
+
+    # Snapshot listings are large and change rarely, another slow tier
+    snapshot_tracker = ReadyNASSnapshotTracker(hass, coordinator, api)
+    snapshot_coordinator = DataUpdateCoordinator(
+        hass,
+        _LOGGER,
+        name=f"ReadyNAS {host} snapshots",
+        update_method=snapshot_tracker.async_update,
+        update_interval=SNAPSHOT_SCAN_INTERVAL,
+    )
+
+    # Shares can number in the thousands, so only the top ones of each
+    # ranking get sensors, listed on a third slow tier
+    top_shares = entry.options.get(CONF_TOP_SHARES, DEFAULT_TOP_SHARES)
+    share_coordinator = None
+    if top_shares:
+        share_tracker = ReadyNASShareTracker(api, top_shares)
+        share_coordinator = DataUpdateCoordinator(
+            hass,
+            _LOGGER,
+            name=f"ReadyNAS {host} shares",
+            update_method=share_tracker.async_update,
+            update_interval=SHARE_SCAN_INTERVAL,
         )
+        for key, name, device_class, unit, icon in SHARE_TOTAL_METRICS:
+            entities.append(
+                ReadyNASShareTotalSensor(
+                    share_coordinator, key, name, device_class, unit, icon, device_info
+                )
+            )
+        for ranking, name in SHARE_RANKINGS:
+            entities.extend(
+                ReadyNASShareSensor(share_coordinator, ranking, name, rank, device_info)
+                for rank in range(1, top_shares + 1)
+            )
 
-    # Add volume sensors
-    for volume in coordinator.data.get("volumes", []):
-        entities.append(
-            ReadyNASVolumeSensor(
-                coordinator=coordinator,
-                volume_name=volume["name"],
-                device_info=device_info,
+    # Backup jobs are polled fast only while one runs, so the tier moves its
+    # own interval after every listing
+    backup_tracker = ReadyNASBackupTracker(hass, api)
+
+    async def async_update_backups():
+        jobs = await backup_tracker.async_update()
+        backup_coordinator.update_interval = backup_tracker.next_interval()
+        return jobs
+
+    backup_coordinator = DataUpdateCoordinator(
+        hass,
+        _LOGGER,
+        name=f"ReadyNAS {host} backups",
+        update_method=async_update_backups,
+        update_interval=BACKUP_IDLE_INTERVAL,
+    )
+
+    # Disk and volume sensors are reconciled against the live topology
+    topology = ReadyNASTopology(
+        hass,
+        coordinator,
+        async_add_entities,
+        device_info,
+        statistics_mode,
+        smart_coordinator=smart_coordinator,
+        snapshot_coordinator=snapshot_coordinator,
+        backup_coordinator=backup_coordinator,
+    )
+    entities.extend(topology.async_build_initial())
+
+    _LOGGER.info(f"🚀 Registering {len(entities)} sensors for {host}")
+    # Every tier already has its data or a background first refresh, an
+    # update before add would poll each one again during setup
+    async_add_entities(entities)
+
+    entry.async_on_unload(coordinator.async_add_listener(topology.async_reconcile))
+    entry.async_on_unload(
+        backup_coordinator.async_add_listener(topology.async_reconcile_backups)
+    )
+
+    @callback
+    def async_share_snapshot():
+        """Hand each good snapshot to the binary sensor rules."""
+        if coordinator.last_update_success and coordinator.data:
+            async_dispatcher_send(
+                hass, SIGNAL_SNAPSHOT.format(entry.entry_id), coordinator.data
+            )
+
+    entry.async_on_unload(coordinator.async_add_listener(async_share_snapshot))
+
+    async def async_handle_alert(resources):
+        """Refresh only what a syslog alert reported as changed."""
+        if resources & set(HEALTH_RESOURCES):
+            data = await api.refresh(resources)
+            if data:
+                coordinator.async_set_updated_data(data)
+        if "Disk" in resources:
+            await smart_coordinator.async_request_refresh()
+        if "Backups" in resources:
+            await backup_coordinator.async_request_refresh()
+
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_ALERT.format(entry.entry_id), async_handle_alert
+        )
+    )
+
+    # Don't hold up setup for the slow tier, its sensors fill in when it lands
+    entry.async_create_background_task(
+        hass, smart_coordinator.async_refresh(), f"readynas_{host}_smart_refresh"
+    )
+    entry.async_create_background_task(
+        hass,
+        snapshot_coordinator.async_refresh(),
+        f"readynas_{host}_snapshot_refresh",
+    )
+    entry.async_create_background_task(
+        hass, backup_coordinator.async_refresh(), f"readynas_{host}_backup_refresh"
+    )
+    if share_coordinator is not None:
+        entry.async_create_background_task(
+            hass, share_coordinator.async_refresh(), f"readynas_{host}_share_refresh"
+        )
+
+
+class ReadyNASSnapshotTracker:
+    """List snapshots per volume and fire events for the ones that changed.
+
+    Only snapshot ids with their creation time and size are kept between
+    listings. The first listing of a volume is the baseline and fires no
+    events.
+    """
+
+    def __init__(self, hass, coordinator, api: ReadyNASAPI):
+        """Initialize the tracker."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.api = api
+        # volume -> {snapshot id: (created, size)}
+        self._known = {}
+
+    async def async_update(self):
+        """Fetch every volume's snapshots and summarise them."""
+        volumes = [
+            volume["name"]
+            for volume in (self.coordinator.data or {}).get("volumes", [])
+        ]
+        summary = {}
+        for volume in volumes:
+            snapshots = await self.api.get_snapshots(volume)
+            if snapshots is None:
+                raise UpdateFailed(f"Failed to list snapshots of volume {volume}")
+
+            previous = self._known.get(volume)
+            if previous is not None:
+                for snapshot_id in snapshots.keys() - previous.keys():
+                    self._fire(EVENT_SNAPSHOT_CREATED, volume, snapshot_id, snapshots)
+                for snapshot_id in previous.keys() - snapshots.keys():
+                    self._fire(EVENT_SNAPSHOT_DELETED, volume, snapshot_id, previous)
+            self._known[volume] = snapshots
+
+            latest = max((created for created, _ in snapshots.values()), default=0)
+            summary[volume] = {
+                "count": len(snapshots),
+                "latest": datetime.fromtimestamp(latest, timezone.utc)
+                if latest
+                else None,
+                "size_bytes": sum(size for _, size in snapshots.values()),
+            }
+
+        for volume in self._known.keys() - set(volumes):
+            del self._known[volume]
+        return summary
+
+    def _fire(self, event_type, volume, snapshot_id, snapshots):
+        created, size = snapshots[snapshot_id]
+        self.hass.bus.async_fire(
+            event_type,
+            {
+                "host": self.api.host,
+                "volume": volume,
+                "snapshot": snapshot_id,
+                "created": datetime.fromtimestamp(created, timezone.utc).isoformat()
+                if created
+                else None,
+                "size_bytes": size,
+            },
+        )
+
+
+class ReadyNASShareTracker:
+    """Rank shares by usage and by growth since the previous listing.
+
+    Between listings only the rankings and one used-bytes figure per share,
+    the baseline for growth, are kept. The first listing has no baseline
+    and ranks usage only.
+    """
+
+    def __init__(self, api: ReadyNASAPI, count):
+        """Initialize the tracker."""
+        self.api = api
+        self.count = count
+        self._usage = None
+        self._listed_at = None
+
+    async def async_update(self):
+        """List the shares and return the totals and rankings."""
+        shares = await self.api.get_top_shares(self.count, self._usage)
+        if shares is None:
+            raise UpdateFailed("Failed to list shares")
+
+        now = time.time()
+        shares["interval_seconds"] = (
+            round(now - self._listed_at) if self._listed_at is not None else None
+        )
+        self._usage = shares.pop("usage")
+        self._listed_at = now
+        return shares
+
+
+class ReadyNASBackupTracker:
+    """Follow the backup jobs and fire an event for every run that ends.
+
+    A run is recorded when a job's last run end time changes. Each job keeps
+    its last BACKUP_HISTORY runs as (finished, succeeded, duration, bytes)
+    tuples in a fixed-size deque. The first listing of a job seeds its
+    history with the run the NAS reports and fires no event.
+    """
+
+    def __init__(self, hass, api: ReadyNASAPI):
+        """Initialize the tracker."""
+        self.hass = hass
+        self.api = api
+        # job id -> deque of runs, oldest first
+        self._history = {}
+        self._jobs = {}
+
+    async def async_update(self):
+        """List the backup jobs and record the runs that ended since the last."""
+        jobs = await self.api.get_backup_jobs()
+        if jobs is None:
+            raise UpdateFailed("Failed to list backup jobs")
+
+        for job_id, job in jobs.items():
+            started, finished = job["started"], job["finished"]
+            job["duration_seconds"] = (
+                finished - started
+                if started and finished and finished >= started
+                else None
+            )
+            job["status"] = "running" if job["running"] else job["result"]
+            job["last_run"] = (
+                datetime.fromtimestamp(finished, timezone.utc) if finished else None
             )
+
+            history = self._history.get(job_id)
+            if history is None:
+                history = self._history[job_id] = deque(maxlen=BACKUP_HISTORY)
+            if finished and (not history or history[-1][0] != finished):
+                succeeded = job["result"] in BACKUP_SUCCESS
+                history.append(
+                    (finished, succeeded, job["duration_seconds"], job["bytes"])
+                )
+                if job_id in self._jobs:
+                    self._fire(job_id, job, succeeded)
+            job["history"] = history
+
+        for job_id in self._history.keys() - jobs.keys():
+            del self._history[job_id]
+        self._jobs = jobs
+        return jobs
+
+    def next_interval(self, now=None):
+        """Return how long to wait before listing the jobs again."""
+        if any(job["running"] for job in self._jobs.values()):
+            return BACKUP_ACTIVE_INTERVAL
+
+        now = time.time() if now is None else now
+        upcoming = [
+            job["next_run"]
+            for job in self._jobs.values()
+            if job["next_run"] and job["next_run"] > now
+        ]
+        if not upcoming:
+            return BACKUP_IDLE_INTERVAL
+        # Wake up once the next scheduled run is under way
+        wait = timedelta(seconds=min(upcoming) - now) + BACKUP_ACTIVE_INTERVAL
+        return min(wait, BACKUP_IDLE_INTERVAL)
+
+    def _fire(self, job_id, job, succeeded):
+        self.hass.bus.async_fire(
+            EVENT_BACKUP_COMPLETED if succeeded else EVENT_BACKUP_FAILED,
+            {
+                "host": self.api.host,
+                "job": job_id,
+                "name": job["name"],
+                "type": job["type"],
+                "result": job["result"],
+                "started": datetime.fromtimestamp(
+                    job["started"], timezone.utc
+                ).isoformat()
+                if job["started"]
+                else None,
+                "finished": job["last_run"].isoformat(),
+                "duration_seconds": job["duration_seconds"],
+                "bytes": job["bytes"],
+            },
         )
 
-        # Add volume metric sensors
-        volume_metrics = [
-            (
-                "capacity_gb",
-                "Capacity",
-                SensorDeviceClass.DATA_SIZE,
-                "GB",
-                "mdi:database",
-            ),
-            (
-                "free_gb",
-                "Free Space",
-                SensorDeviceClass.DATA_SIZE,
-                "GB",
-                "mdi:database-check",
-            ),
-            (
-                "used_gb",
-                "Used Space",
-                SensorDeviceClass.DATA_SIZE,
-                "GB",
-                "mdi:database-export",
-            ),
-            ("used_percentage", "Used Percentage", None, "%", "mdi:percent"),
-            ("raid_level", "RAID Level", None, None, "mdi:nas"),
+
+async def async_update_smart_data(coordinator, api: ReadyNASAPI):
+    """Fetch SMART counters for the disks of the latest health update."""
+    disks = (coordinator.data or {}).get("disks", [])
+    keys = {
+        disk["resource_id"]: disk["key"] for disk in disks if disk.get("resource_id")
+    }
+
+    smart = await api.get_smart_info(list(keys))
+    if smart is None:
+        raise UpdateFailed("Failed to fetch SMART counters")
+
+    return {
+        keys[resource_id]: counters
+        for resource_id, counters in smart.items()
+        if resource_id in keys
+    }
+
+
+VOLUME_METRICS = [
+    (
+        "capacity_gb",
+        "Capacity",
+        SensorDeviceClass.DATA_SIZE,
+        "GB",
+        "mdi:database",
+    ),
+    (
+        "free_gb",
+        "Free Space",
+        SensorDeviceClass.DATA_SIZE,
+        "GB",
+        "mdi:database-check",
+    ),
+    (
+        "used_gb",
+        "Used Space",
+        SensorDeviceClass.DATA_SIZE,
+        "GB",
+        "mdi:database-export",
+    ),
+    ("used_percentage", "Used Percentage", None, "%", "mdi:percent"),
+    ("raid_level", "RAID Level", None, None, "mdi:nas"),
+]
+
+
+SNAPSHOT_METRICS = [
+    ("count", "Snapshots", None, None),
+    ("latest", "Latest Snapshot", SensorDeviceClass.TIMESTAMP, None),
+    ("size_bytes", "Snapshot Space", SensorDeviceClass.DATA_SIZE, "B"),
+]
+
+BACKUP_METRICS = [
+    ("status", "Status", None, None, "mdi:backup-restore"),
+    ("last_run", "Last Run", SensorDeviceClass.TIMESTAMP, None, "mdi:calendar-clock"),
+    (
+        "duration_seconds",
+        "Last Run Duration",
+        SensorDeviceClass.DURATION,
+        "s",
+        "mdi:timer-outline",
+    ),
+    (
+        "bytes",
+        "Last Run Transferred",
+        SensorDeviceClass.DATA_SIZE,
+        "B",
+        "mdi:swap-horizontal",
+    ),
+]
+
+SHARE_TOTAL_METRICS = [
+    ("count", "Shares", None, None, "mdi:folder-multiple"),
+    ("used_bytes", "Share Space Used", SensorDeviceClass.DATA_SIZE, "B", "mdi:folder"),
+    (
+        "quota_bytes",
+        "Share Quotas",
+        SensorDeviceClass.DATA_SIZE,
+        "B",
+        "mdi:folder-lock",
+    ),
+]
+
+# (ranking, entity name prefix), each with one sensor per rank
+SHARE_RANKINGS = [
+    ("top_usage", "Largest Share"),
+    ("top_growth", "Fastest Growing Share"),
+]
+
+PERFORMANCE_METRICS = [
+    ("cpu_percent", "CPU Usage", "%", "mdi:cpu-64-bit"),
+    ("memory_percent", "Memory Usage", "%", "mdi:memory"),
+    ("load_1m", "Load (1m)", None, "mdi:gauge"),
+]
+
+INTERFACE_METRICS = [
+    ("rx_bytes_per_s", "Receive", "B/s", "mdi:download-network"),
+    ("tx_bytes_per_s", "Transmit", "B/s", "mdi:upload-network"),
+]
+
+ENCLOSURE_METRICS = [
+    (
+        "disk_temp_max",
+        "Max Disk Temperature",
+        SensorDeviceClass.TEMPERATURE,
+        "°C",
+        "mdi:thermometer-high",
+    ),
+    (
+        "disk_temp_avg",
+        "Average Disk Temperature",
+        SensorDeviceClass.TEMPERATURE,
+        "°C",
+        "mdi:thermometer",
+    ),
+    ("hottest_disk", "Hottest Disk", None, None, "mdi:harddisk"),
+    ("disks_not_online", "Disks Not Online", None, None, "mdi:harddisk-remove"),
+]
+
+# (collection, value field, name prefix, device class, unit, icon) of the
+# per-probe sensors. The first temperature probe and fan are already the
+# CPU Temperature and Fan Speed sensors.
+PROBE_METRICS = [
+    (
+        "temperatures",
+        "value",
+        "Temperature",
+        SensorDeviceClass.TEMPERATURE,
+        "°C",
+        "mdi:thermometer",
+    ),
+    ("fans", "speed", "Fan", None, "RPM", "mdi:fan"),
+    ("psus", "status", "Power Supply", None, None, "mdi:power-plug"),
+]
+
+DISK_IO_METRICS = [
+    ("read_iops", "Read IOPS", "IOPS", "mdi:harddisk"),
+    ("write_iops", "Write IOPS", "IOPS", "mdi:harddisk"),
+    ("read_bytes_per_s", "Read Throughput", "B/s", "mdi:harddisk"),
+    ("write_bytes_per_s", "Write Throughput", "B/s", "mdi:harddisk"),
+]
+
+
+class ReadyNASTopology:
+    """Track disks and volumes and add or remove their entities on change."""
+
+    def __init__(
+        self,
+        hass,
+        coordinator,
+        async_add_entities,
+        device_info,
+        statistics_mode=False,
+        smart_coordinator=None,
+        snapshot_coordinator=None,
+        backup_coordinator=None,
+    ):
+        """Initialize the topology tracker."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.smart_coordinator = smart_coordinator
+        self.snapshot_coordinator = snapshot_coordinator
+        self.backup_coordinator = backup_coordinator
+        self._async_add_entities = async_add_entities
+        self._device_info = device_info
+        self._statistics_mode = statistics_mode
+        self._statistics_metrics = {
+            metric for metric, _, _ in STATISTICS_VOLUME_METRICS
+        }
+        # Topology key -> unique ids of the entities created for it
+        self._disks = {}
+        self._volumes = {}
+        self._jobs = {}
+
+    def _current_disks(self):
+        return [disk["key"] for disk in (self.coordinator.data or {}).get("disks", [])]
+
+    def _current_volumes(self):
+        return [
+            volume["name"]
+            for volume in (self.coordinator.data or {}).get("volumes", [])
+        ]
+
+    def _current_jobs(self):
+        return list(self.backup_coordinator.data or {})
+
+    def _build_disk(self, disk_key):
+        entities = [
+            ReadyNASDiskSensor(
+                coordinator=self.coordinator,
+                disk_key=disk_key,
+                include_temperature=not self._statistics_mode,
+                device_info=self._device_info,
+            )
         ]
+        if self.smart_coordinator is not None:
+            entities.extend(
+                ReadyNASDiskSmartSensor(
+                    coordinator=self.smart_coordinator,
+                    disk_key=disk_key,
+                    index=index,
+                    field=field,
+                    device_info=self._device_info,
+                )
+                for index, (field, _) in enumerate(SMART_FIELDS)
+            )
+        self._disks[disk_key] = [entity.unique_id for entity in entities]
+        return entities
 
-        for metric, name, device_class, unit, icon in volume_metrics:
+    def _build_volume(self, volume_name):
+        entities = [
+            ReadyNASVolumeSensor(
+                coordinator=self.coordinator,
+                volume_name=volume_name,
+                device_info=self._device_info,
+            )
+        ]
+        for metric, name, device_class, unit, icon in VOLUME_METRICS:
+            if self._statistics_mode and metric in self._statistics_metrics:
+                self._async_remove(
+                    [
+                        f"readynas_{self.coordinator.config_entry.data['host']}"
+                        f"_volume_{volume_name}_{metric}"
+                    ]
+                )
+                continue
             entities.append(
                 ReadyNASVolumeMetricSensor(
-                    coordinator=coordinator,
-                    volume_name=volume["name"],
+                    coordinator=self.coordinator,
+                    volume_name=volume_name,
                     metric=metric,
                     name=name,
                     device_class=device_class,
                     unit=unit,
                     icon=icon,
-                    device_info=device_info,
+                    device_info=self._device_info,
                 )
             )
-    _LOGGER.info(f"🚀 Registering {len(entities)} sensors for {host}")
-    async_add_entities(entities, True)
+        if self.snapshot_coordinator is not None:
+            entities.extend(
+                ReadyNASSnapshotSensor(
+                    coordinator=self.snapshot_coordinator,
+                    volume_name=volume_name,
+                    metric=metric,
+                    name=name,
+                    device_class=device_class,
+                    unit=unit,
+                    device_info=self._device_info,
+                )
+                for metric, name, device_class, unit in SNAPSHOT_METRICS
+            )
+        self._volumes[volume_name] = [entity.unique_id for entity in entities]
+        return entities
+
+    def _build_job(self, job_id):
+        entities = [
+            ReadyNASBackupSensor(
+                coordinator=self.backup_coordinator,
+                job_id=job_id,
+                metric=metric,
+                name=name,
+                device_class=device_class,
+                unit=unit,
+                icon=icon,
+                device_info=self._device_info,
+            )
+            for metric, name, device_class, unit, icon in BACKUP_METRICS
+        ]
+        self._jobs[job_id] = [entity.unique_id for entity in entities]
+        return entities
+
+    def async_build_initial(self):
+        """Build entities for the topology seen on the first refresh."""
+        entities = []
+        for disk_key in self._current_disks():
+            entities.extend(self._build_disk(disk_key))
+        for volume_name in self._current_volumes():
+            entities.extend(self._build_volume(volume_name))
+        return entities
+
+    def _async_remove(self, unique_ids):
+        registry = er.async_get(self.hass)
+        for unique_id in unique_ids:
+            entity_id = registry.async_get_entity_id("sensor", DOMAIN, unique_id)
+            if entity_id:
+                registry.async_remove(entity_id)
+
+    @callback
+    def async_reconcile(self):
+        """Diff the topology of the latest update against the known one."""
+        data = self.coordinator.data
+        if not self.coordinator.last_update_success or not data:
+            return
+        # A collection the poll could not fetch fresh is unknown, not empty;
+        # its entities go unavailable and are kept
+        kinds = [
+            (known, current(), build)
+            for collection, known, current, build in (
+                ("disks", self._disks, self._current_disks, self._build_disk),
+                ("volumes", self._volumes, self._current_volumes, self._build_volume),
+            )
+            if collection_current(data, collection)
+        ]
+        self._async_diff(*kinds)
+
+    @callback
+    def async_reconcile_backups(self):
+        """Diff the backup jobs of the latest listing against the known ones."""
+        if not self.backup_coordinator.last_update_success:
+            return
+        self._async_diff((self._jobs, self._current_jobs(), self._build_job))
+
+    def _async_diff(self, *kinds):
+        """Add entities for new keys and remove those of vanished ones."""
+        new_entities = []
+        for known, current, build in kinds:
+            current = set(current)
+            for key in current - known.keys():
+                _LOGGER.info(f"➕ Adding entities for {key}")
+                new_entities.extend(build(key))
+            for key in known.keys() - current:
+                _LOGGER.info(f"➖ Removing entities for {key}")
+                self._async_remove(known.pop(key))
+
+        if new_entities:
+            self._async_add_entities(new_entities)
 
 
 async def async_update_data(hass: HomeAssistant, entry: ConfigEntry, api: ReadyNASAPI):
@@ -184,18 +893,52 @@ async def async_update_data(hass: HomeAssistant, entry: ConfigEntry, api: ReadyN
         raise UpdateFailed(f"Failed to fetch ReadyNAS data: {str(err)}") from err
 
 
-class ReadyNASDiskSensor(SensorEntity):
+# Seconds the derived boot time may wander (polling jitter, clock steps)
+# before it is treated as a reboot and recomputed
+BOOT_TIME_TOLERANCE = 60
+_NOT_BUILT = object()
+
+
+class CachedAttributesMixin:
+    """Build ``extra_state_attributes`` once per coordinator snapshot.
+
+    Every poll hands the coordinator a new data dict, so the attributes are
+    rebuilt when that dict changes and the same dict is returned for every
+    other state write in between.
+    """
+
+    _attributes_data = _NOT_BUILT
+    _attributes = None
+
+    def _build_attributes(self, data):
+        """Return the attributes for one snapshot, none unless overridden."""
+        return None
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes of the current snapshot."""
+        data = self.coordinator.data
+        if data is not self._attributes_data:
+            self._attributes_data = data
+            self._attributes = self._build_attributes(data)
+        return self._attributes
+
+
+class ReadyNASDiskSensor(CachedAttributesMixin, SensorEntity):
     """Representation of a ReadyNAS disk sensor with attributes."""
 
     _attr_has_entity_name = True
 
-    def __init__(self, coordinator, disk_index, device_info=None):
+    def __init__(
+        self, coordinator, disk_key, device_info=None, include_temperature=True
+    ):
         """Initialize the disk sensor."""
         self.coordinator = coordinator
-        self.disk_index = disk_index
-        self._attr_name = f"Disk {disk_index + 1}"
+        self.disk_key = disk_key
+        self._include_temperature = include_temperature
+        self._attr_name = disk_name(disk_key)
         self._attr_unique_id = (
-            f"readynas_{coordinator.config_entry.data['host']}_disk_{disk_index}"
+            f"readynas_{coordinator.config_entry.data['host']}_disk_{disk_key}"
         )
         self._attr_device_info = DeviceInfo(**device_info) if device_info else None
         self._attr_native_unit_of_measurement = None  # Remove unit for string state
@@ -203,25 +946,31 @@ class ReadyNASDiskSensor(SensorEntity):
         self._attr_state_class = None  # Add this line
         self._attr_icon = "mdi:harddisk"  # Add this line
 
+    def _disk_data(self):
+        """Return the data for this disk from the latest update."""
+        if not self.coordinator.data:
+            return None
+        for disk in self.coordinator.data.get("disks", []):
+            if disk["key"] == self.disk_key:
+                return disk
+        return None
+
     @property
     def native_value(self):
         """Return the state of the disk."""
-        if not self.coordinator.data or self.disk_index >= len(
-            self.coordinator.data["disks"]
-        ):
+        disk_data = self._disk_data()
+        if disk_data is None:
             return None
-        return self.coordinator.data["disks"][self.disk_index]["status"]
+        return disk_data["status"]
 
-    @property
-    def extra_state_attributes(self):
+    def _build_attributes(self, data):
         """Return the state attributes."""
-        if not self.coordinator.data or self.disk_index >= len(
-            self.coordinator.data["disks"]
-        ):
+        disk_data = self._disk_data()
+        if disk_data is None:
             return {}
 
-        disk_data = self.coordinator.data["disks"][self.disk_index]
-        capacity_gb = disk_data.get("capacity", 0) / (1024 * 1024 * 1024)  # bytes to GB
+        # bytes to GB
+        capacity_gb = (disk_data.get("capacity") or 0) / (1024 * 1024 * 1024)
 
         # Convert to TB if over 1024 GB
         if capacity_gb > 1024:
@@ -231,11 +980,14 @@ class ReadyNASDiskSensor(SensorEntity):
             capacity = round(capacity_gb, 2)
             capacity_unit = "GB"
 
-        return {
-            "temperature": disk_data.get("temperature"),
+        attributes = {
             "model": disk_data.get("model", "Unknown"),
             f"capacity_{capacity_unit.lower()}": capacity,
         }
+        if self._include_temperature:
+            attributes["temperature"] = disk_data.get("temperature")
+        attributes.update(stale_attributes(self.coordinator, "HealthInfo"))
+        return attributes
 
     @property
     def should_poll(self):
@@ -245,7 +997,7 @@ class ReadyNASDiskSensor(SensorEntity):
     @property
     def available(self):
         """Return if entity is available."""
-        return self.coordinator.last_update_success
+        return resource_available(self.coordinator, "HealthInfo")
 
     async def async_added_to_hass(self):
         """Register callbacks."""
@@ -254,7 +1006,387 @@ class ReadyNASDiskSensor(SensorEntity):
         )
 
 
-class ReadyNASSensor(SensorEntity):
+# SMART fields that are a current count of bad sectors rather than a
+# lifetime counter, both drop again once the sectors are remapped
+GAUGE_SMART_FIELDS = ("pending_sectors", "uncorrectable_errors")
+
+
+class ReadyNASDiskSmartSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor for one SMART counter of a disk."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:harddisk-plus"
+
+    def __init__(self, coordinator, disk_key, index, field, device_info=None):
+        """Initialize the SMART sensor."""
+        super().__init__(coordinator)
+        self.disk_key = disk_key
+        self._index = index
+        self._attr_name = f"{disk_name(disk_key)} {field.replace('_', ' ').title()}"
+        self._attr_unique_id = (
+            f"readynas_{coordinator.config_entry.data['host']}_disk_{disk_key}_{field}"
+        )
+        self._attr_device_info = DeviceInfo(**device_info) if device_info else None
+        if field == "power_on_hours":
+            self._attr_native_unit_of_measurement = "h"
+        self._attr_state_class = (
+            SensorStateClass.MEASUREMENT
+            if field in GAUGE_SMART_FIELDS
+            else SensorStateClass.TOTAL_INCREASING
+        )
+        self._attr_native_value = self._counter()
+        self._published = (self._attr_native_value, self.available)
+
+    def _counter(self):
+        counters = (self.coordinator.data or {}).get(self.disk_key)
+        return counters[self._index] if counters else None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write state when this counter or availability changed."""
+        self._attr_native_value = self._counter()
+        published = (self._attr_native_value, self.available)
+        if published == self._published:
+            return
+        self._published = published
+        self.async_write_ha_state()
+
+
+class ReadyNASSnapshotSensor(CoordinatorEntity, SensorEntity):
+    """Sensor summarising the snapshots of a volume."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:camera-burst"
+
+    def __init__(
+        self, coordinator, volume_name, metric, name, device_class, unit, device_info
+    ):
+        """Initialize the snapshot sensor."""
+        super().__init__(coordinator)
+        self._volume_name = volume_name
+        self._metric = metric
+        self._attr_name = f"Volume {volume_name} {name}"
+        self._attr_unique_id = (
+            f"readynas_{coordinator.config_entry.data['host']}"
+            f"_volume_{volume_name}_snapshot_{metric}"
+        )
+        self._attr_device_info = DeviceInfo(**device_info) if device_info else None
+        self._attr_device_class = device_class
+        self._attr_native_unit_of_measurement = unit
+        if device_class == SensorDeviceClass.DATA_SIZE:
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+            self._attr_suggested_unit_of_measurement = "GB"
+        elif metric == "count":
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def native_value(self):
+        """Return the snapshot summary value."""
+        summary = (self.coordinator.data or {}).get(self._volume_name)
+        return summary.get(self._metric) if summary else None
+
+
+class ReadyNASBackupSensor(CachedAttributesMixin, CoordinatorEntity, SensorEntity):
+    """Sensor for the state or last run of a backup job."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self, coordinator, job_id, metric, name, device_class, unit, icon, device_info
+    ):
+        """Initialize the backup sensor."""
+        super().__init__(coordinator)
+        self._job_id = job_id
+        self._metric = metric
+        job_name = (coordinator.data or {}).get(job_id, {}).get("name", job_id)
+        self._attr_name = f"Backup {job_name} {name}"
+        self._attr_unique_id = (
+            f"readynas_{coordinator.config_entry.data['host']}_backup_{job_id}_{metric}"
+        )
+        self._attr_device_info = DeviceInfo(**device_info) if device_info else None
+        self._attr_device_class = device_class
+        self._attr_native_unit_of_measurement = unit
+        self._attr_icon = icon
+        if device_class == SensorDeviceClass.DATA_SIZE:
+            self._attr_suggested_unit_of_measurement = "GB"
+
+    def _job(self):
+        return (self.coordinator.data or {}).get(self._job_id)
+
+    @property
+    def native_value(self):
+        """Return the job's state or last run value."""
+        job = self._job()
+        return job.get(self._metric) if job else None
+
+    def _build_attributes(self, data):
+        """Return the job details and run history on the status sensor."""
+        job = self._job()
+        if job is None or self._metric != "status":
+            return None
+        runs = [
+            {
+                "finished": datetime.fromtimestamp(finished, timezone.utc).isoformat(),
+                "succeeded": succeeded,
+                "duration_seconds": duration,
+                "bytes": transferred,
+            }
+            for finished, succeeded, duration, transferred in reversed(job["history"])
+        ]
+        return {
+            "job": self._job_id,
+            "type": job["type"],
+            "progress": job["progress"],
+            "result": job["result"],
+            "next_run": datetime.fromtimestamp(
+                job["next_run"], timezone.utc
+            ).isoformat()
+            if job["next_run"]
+            else None,
+            "success_rate": round(
+                sum(run["succeeded"] for run in runs) / len(runs) * 100, 1
+            )
+            if runs
+            else None,
+            "history": runs,
+        }
+
+
+class ReadyNASShareTotalSensor(CoordinatorEntity, SensorEntity):
+    """Sensor for a total across every share."""
+
+    _attr_has_entity_name = True
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self, coordinator, key, name, device_class, unit, icon, device_info=None
+    ):
+        """Initialize the share total sensor."""
+        super().__init__(coordinator)
+        self._key = key
+        self._attr_name = name
+        self._attr_unique_id = (
+            f"readynas_{coordinator.config_entry.data['host']}_shares_{key}"
+        )
+        self._attr_device_info = DeviceInfo(**device_info) if device_info else None
+        self._attr_device_class = device_class
+        self._attr_native_unit_of_measurement = unit
+        self._attr_icon = icon
+        if device_class == SensorDeviceClass.DATA_SIZE:
+            self._attr_suggested_unit_of_measurement = "GB"
+
+    @property
+    def native_value(self):
+        """Return the total."""
+        return (self.coordinator.data or {}).get(self._key)
+
+
+class ReadyNASShareSensor(CachedAttributesMixin, CoordinatorEntity, SensorEntity):
+    """Sensor for the share at one rank of a ranking.
+
+    The entity stands for the rank, not the share, so shares moving in and
+    out of the top don't add or remove entities. The share's name is an
+    attribute.
+    """
+
+    _attr_has_entity_name = True
+    _attr_device_class = SensorDeviceClass.DATA_SIZE
+    _attr_native_unit_of_measurement = "B"
+    _attr_suggested_unit_of_measurement = "GB"
+    _attr_icon = "mdi:folder-account"
+
+    def __init__(self, coordinator, ranking, name, rank, device_info=None):
+        """Initialize the share rank sensor."""
+        super().__init__(coordinator)
+        self._ranking = ranking
+        self._rank = rank
+        self._field = "growth_bytes" if ranking == "top_growth" else "used_bytes"
+        self._attr_name = f"{name} {rank}"
+        self._attr_unique_id = (
+            f"readynas_{coordinator.config_entry.data['host']}_share_{ranking}_{rank}"
+        )
+        self._attr_device_info = DeviceInfo(**device_info) if device_info else None
+        if ranking == "top_usage":
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    def _share(self):
+        ranked = (self.coordinator.data or {}).get(self._ranking) or []
+        return ranked[self._rank - 1] if self._rank <= len(ranked) else None
+
+    @property
+    def native_value(self):
+        """Return the share's used bytes, or its growth for the growth ranking."""
+        share = self._share()
+        return share.get(self._field) if share else None
+
+    def _build_attributes(self, data):
+        """Return which share holds the rank and its quota."""
+        share = self._share()
+        if share is None:
+            return None
+        attributes = {
+            "share": share["name"],
+            "volume": share["volume"],
+            "used_bytes": share["used_bytes"],
+            "quota_bytes": share["quota_bytes"],
+        }
+        if share["quota_bytes"]:
+            attributes["quota_used_percent"] = round(
+                share["used_bytes"] / share["quota_bytes"] * 100, 1
+            )
+        if "growth_bytes" in share:
+            attributes["growth_bytes"] = share["growth_bytes"]
+            attributes["interval_seconds"] = data.get("interval_seconds")
+        return attributes
+
+
+class ReadyNASPerformanceSensor(CachedAttributesMixin, CoordinatorEntity, SensorEntity):
+    """Sensor for a CPU, memory, network or disk I/O rate of the NAS."""
+
+    _attr_has_entity_name = True
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator, path, name, unit, icon, device_info=None):
+        """Initialize the performance sensor."""
+        super().__init__(coordinator)
+        self._path = path
+        self._attr_name = name
+        self._attr_unique_id = (
+            f"readynas_{coordinator.config_entry.data['host']}_"
+            f"performance_{'_'.join(path)}"
+        )
+        self._attr_device_info = DeviceInfo(**device_info) if device_info else None
+        self._attr_native_unit_of_measurement = unit
+        self._attr_icon = icon
+        if unit == "B/s":
+            self._attr_device_class = SensorDeviceClass.DATA_RATE
+            self._attr_suggested_unit_of_measurement = "MB/s"
+
+    def _build_attributes(self, data):
+        """Return the staleness of the health data, if any."""
+        return stale_attributes(self.coordinator, "HealthInfo") or None
+
+    @property
+    def native_value(self):
+        """Return the latest rate, None until two samples have been taken."""
+        value = (self.coordinator.data or {}).get("performance")
+        for key in self._path:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+
+
+class ReadyNASEnclosureSensor(CachedAttributesMixin, CoordinatorEntity, SensorEntity):
+    """Sensor for a disk aggregate across the whole enclosure."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self, coordinator, key, name, device_class, unit, icon, device_info=None
+    ):
+        """Initialize the enclosure sensor."""
+        super().__init__(coordinator)
+        self._key = key
+        self._attr_name = name
+        self._attr_unique_id = (
+            f"readynas_{coordinator.config_entry.data['host']}_enclosure_{key}"
+        )
+        self._attr_device_info = DeviceInfo(**device_info) if device_info else None
+        self._attr_device_class = device_class
+        self._attr_native_unit_of_measurement = unit
+        self._attr_icon = icon
+        if key != "hottest_disk":
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    def _enclosure(self):
+        return (self.coordinator.data or {}).get("enclosure") or {}
+
+    @property
+    def native_value(self):
+        """Return the aggregate, the hottest disk by name."""
+        value = self._enclosure().get(self._key)
+        if self._key == "hottest_disk" and value is not None:
+            return disk_name(value)
+        return value
+
+    def _build_attributes(self, data):
+        """Return the hottest temperature or the disks that are not online."""
+        enclosure = self._enclosure()
+        attributes = dict(stale_attributes(self.coordinator, "HealthInfo"))
+        if self._key == "hottest_disk":
+            attributes["temperature"] = enclosure.get("disk_temp_max")
+        elif self._key == "disks_not_online":
+            attributes["disks"] = [
+                disk_name(key) for key in enclosure.get("not_online_keys", [])
+            ]
+        return attributes or None
+
+
+class ReadyNASProbeSensor(CachedAttributesMixin, CoordinatorEntity, SensorEntity):
+    """Sensor for one temperature probe, fan or power supply."""
+
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator,
+        collection,
+        field,
+        index,
+        name,
+        device_class,
+        unit,
+        icon,
+        device_info=None,
+    ):
+        """Initialize the probe sensor."""
+        super().__init__(coordinator)
+        self._collection = collection
+        self._field = field
+        self._index = index
+        probe = coordinator.data[collection][index]
+        self._resource_id = probe.get("resource_id")
+        self._attr_name = name
+        self._attr_unique_id = (
+            f"readynas_{coordinator.config_entry.data['host']}_{collection}_"
+            f"{self._resource_id or index}"
+        )
+        self._attr_device_info = DeviceInfo(**device_info) if device_info else None
+        self._attr_device_class = device_class
+        self._attr_native_unit_of_measurement = unit
+        self._attr_icon = icon
+        if unit is not None:
+            self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    def _probe(self):
+        probes = (self.coordinator.data or {}).get(self._collection) or []
+        if self._resource_id is not None:
+            for probe in probes:
+                if probe.get("resource_id") == self._resource_id:
+                    return probe
+            return None
+        return probes[self._index] if self._index < len(probes) else None
+
+    @property
+    def native_value(self):
+        """Return the reading of the probe."""
+        probe = self._probe()
+        return probe.get(self._field) if probe else None
+
+    def _build_attributes(self, data):
+        """Return the probe's reported status and enclosure."""
+        probe = self._probe() or {}
+        attributes = dict(stale_attributes(self.coordinator, "HealthInfo"))
+        for key in ("status", "voltage", "enclosure"):
+            if key != self._field and probe.get(key) is not None:
+                attributes[key] = probe[key]
+        return attributes or None
+
+
+class ReadyNASSensor(CachedAttributesMixin, SensorEntity):
     """Representation of a ReadyNAS sensor."""
 
     _attr_has_entity_name = True  # Add this line
@@ -299,7 +1431,7 @@ class ReadyNASSensor(SensorEntity):
     @property
     def available(self):
         """Return if entity is available."""
-        return self.coordinator.last_update_success
+        return resource_available(self.coordinator, "HealthInfo")
 
     @property
     def native_value(self):
@@ -360,6 +1492,10 @@ class ReadyNASSensor(SensorEntity):
         )
         return self.coordinator.data[self.sensor_key]
 
+    def _build_attributes(self, data):
+        """Return the staleness of the health data, if any."""
+        return stale_attributes(self.coordinator, "HealthInfo") or None
+
     async def async_added_to_hass(self):
         """Register callbacks."""
         self.async_on_remove(
@@ -367,7 +1503,7 @@ class ReadyNASSensor(SensorEntity):
         )
 
 
-class ReadyNASVolumeSensor(SensorEntity):
+class ReadyNASVolumeSensor(CachedAttributesMixin, SensorEntity):
     """Representation of a ReadyNAS volume sensor."""
 
     _attr_has_entity_name = True
@@ -408,17 +1544,17 @@ class ReadyNASVolumeSensor(SensorEntity):
     @property
     def available(self):
         """Return if entity is available."""
-        return self.coordinator.last_update_success
+        return resource_available(self.coordinator, "Volumes")
 
-    @property
-    def extra_state_attributes(self):
+    def _build_attributes(self, data):
         """Return the state attributes."""
-        if not self.coordinator.data or "volumes" not in self.coordinator.data:
+        if not data or "volumes" not in data:
             return {}
 
-        for volume in self.coordinator.data["volumes"]:
+        for volume in data["volumes"]:
             if volume["name"] == self._volume_name:
                 return {
+                    **stale_attributes(self.coordinator, "Volumes"),
                     "capacity_gb": round(volume["capacity_gb"], 2),
                     "free_gb": round(volume["free_gb"], 2),
                     "used_gb": round(volume["used_gb"], 2),
@@ -438,7 +1574,7 @@ class ReadyNASVolumeSensor(SensorEntity):
         )
 
 
-class ReadyNASSystemOSInfoSensor(SensorEntity):
+class ReadyNASSystemOSInfoSensor(CachedAttributesMixin, SensorEntity):
     """Representation of a ReadyNAS system OS info sensor."""
 
     _attr_has_entity_name = True
@@ -455,6 +1591,9 @@ class ReadyNASSystemOSInfoSensor(SensorEntity):
         )
         self._attr_device_info = DeviceInfo(**device_info) if device_info else None
         self._attr_native_unit_of_measurement = unit if unit else None
+        # Boot time is derived once per boot, not on every state write
+        self._boot_timestamp = None
+        self._boot_time = None
 
         # ✅ Assign correct `device_class` based on sensor key
         if "model" in sensor_key:
@@ -492,7 +1631,7 @@ class ReadyNASSystemOSInfoSensor(SensorEntity):
     @property
     def available(self):
         """Return if entity is available."""
-        return self.coordinator.last_update_success
+        return resource_available(self.coordinator, "SystemInfo")
 
     @property
     def native_value(self):
@@ -522,22 +1661,32 @@ class ReadyNASSystemOSInfoSensor(SensorEntity):
 
         return os_data.get(self.sensor_key)
 
-    @property
-    def extra_state_attributes(self):
+    def _build_attributes(self, data):
         """Return additional attributes."""
-        if self.sensor_key == "uptime":
-            uptime_seconds = self.coordinator.data.get("os_data", {}).get("uptime")
-            if uptime_seconds:
+        if self.sensor_key == "uptime" and data:
+            uptime_seconds = data.get("os_data", {}).get("uptime")
+            try:
+                uptime = float(uptime_seconds)
+            except (TypeError, ValueError):
+                uptime = None
+            if uptime:
                 # Calculate boot timestamp by subtracting uptime from current time
-                current_time = datetime.now(timezone.utc)
-                boot_timestamp = current_time.timestamp() - float(uptime_seconds)
-                boot_time = datetime.fromtimestamp(boot_timestamp, timezone.utc)
+                boot_timestamp = time.time() - uptime
+                if (
+                    self._boot_timestamp is None
+                    or abs(boot_timestamp - self._boot_timestamp) > BOOT_TIME_TOLERANCE
+                ):
+                    self._boot_timestamp = boot_timestamp
+                    self._boot_time = datetime.fromtimestamp(
+                        boot_timestamp, timezone.utc
+                    ).isoformat()
 
                 return {
-                    "boot_time": boot_time.isoformat(),
+                    "boot_time": self._boot_time,
                     "uptime_seconds": uptime_seconds,
+                    **stale_attributes(self.coordinator, "SystemInfo"),
                 }
-        return None
+        return stale_attributes(self.coordinator, "SystemInfo") or None
 
     async def async_added_to_hass(self):
         """Register callbacks."""
@@ -546,6 +1695,24 @@ class ReadyNASSystemOSInfoSensor(SensorEntity):
         )
 
 
+def disk_name(disk_key):
+    """Return the display name of a disk, counting numbered bays from 1."""
+    return f"Disk {int(disk_key) + 1}" if disk_key.isdigit() else f"Disk {disk_key}"
+
+
+def resource_available(coordinator, resource):
+    """Whether the latest update has a value, fresh or stale, for a resource."""
+    return coordinator.last_update_success and resource not in (
+        coordinator.data or {}
+    ).get("unavailable", ())
+
+
+def stale_attributes(coordinator, resource):
+    """Return ``stale_seconds`` while a resource is served from its last good value."""
+    stale = (coordinator.data or {}).get("stale", {})
+    return {"stale_seconds": stale[resource]} if resource in stale else {}
+
+
 def format_uptime(seconds):
     """Format uptime into human readable string."""
     try:
@@ -570,7 +1737,7 @@ def format_uptime(seconds):
         return None
 
 
-class ReadyNASVolumeMetricSensor(SensorEntity):
+class ReadyNASVolumeMetricSensor(CachedAttributesMixin, SensorEntity):
     """Representation of a ReadyNAS volume metric sensor."""
 
     _attr_has_entity_name = True
@@ -615,20 +1782,11 @@ class ReadyNASVolumeMetricSensor(SensorEntity):
                 if value is None:
                     return None
 
-                # Handle percentage specifically
                 if self._metric == "used_percentage":
-                    converted = round(value / 1000, 1)
-                    _LOGGER.debug(f"Converting percentage {value} to {converted}%")
-                    return converted
+                    return round(value, 1)
 
                 # Handle data size metrics
                 if self._metric in ["used_gb", "free_gb", "capacity_gb"]:
-                    # Convert KB to GB if needed
-                    if self._metric == "used_gb":
-                        # Convert KB to GB
-                        value = value / (1024)  # KB to GB
-                        _LOGGER.debug(f"Converted KB to GB: {value}")
-
                     # Now handle GB to TB conversion if needed
                     if value >= 1000:  # If 1000GB or more, show as TB
                         self._attr_native_unit_of_measurement = "TB"
@@ -652,7 +1810,11 @@ class ReadyNASVolumeMetricSensor(SensorEntity):
     @property
     def available(self):
         """Return if entity is available."""
-        return self.coordinator.last_update_success
+        return resource_available(self.coordinator, "Volumes")
+
+    def _build_attributes(self, data):
+        """Return the staleness of the volume data, if any."""
+        return stale_attributes(self.coordinator, "Volumes") or None
 
     async def async_added_to_hass(self):
         """Register callbacks."""
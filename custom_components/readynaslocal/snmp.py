@@ -0,0 +1,339 @@
+"""SNMP telemetry transport for ReadyNASAPI.
+
+Temperatures, fan speed, disk state and the performance counters can be read
+with one or two GETBULK requests instead of an authenticated dbbroker POST.
+The values come from the NETGEAR READYNASOS-MIB and the net-snmp UCD and
+IF-MIB tables the NAS agent also serves. Everything else (volumes, system
+info, control operations) stays on dbbroker.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import re
+
+_LOGGER = logging.getLogger(__name__)
+
+# Resources this transport can serve
+SNMP_RESOURCES = ("HealthInfo",)
+
+# READYNASOS-MIB (enterprises.4526.22) table columns
+_READYNAS = (1, 3, 6, 1, 4, 1, 4526, 22)
+DISK_STATE = _READYNAS + (3, 1, 9)
+DISK_TEMPERATURE = _READYNAS + (3, 1, 10)
+FAN_RPM = _READYNAS + (4, 1, 2)
+TEMPERATURE_VALUE = _READYNAS + (5, 1, 2)
+
+# IF-MIB ifXTable columns
+IF_NAME = (1, 3, 6, 1, 2, 1, 31, 1, 1, 1, 1)
+IF_HC_IN_OCTETS = (1, 3, 6, 1, 2, 1, 31, 1, 1, 1, 6)
+IF_HC_OUT_OCTETS = (1, 3, 6, 1, 2, 1, 31, 1, 1, 1, 10)
+
+# UCD-DISKIO-MIB diskIOTable columns, the byte counters are 64-bit
+_DISKIO = (1, 3, 6, 1, 4, 1, 2021, 13, 15, 1, 1)
+DISKIO_DEVICE = _DISKIO + (2,)
+DISKIO_READS = _DISKIO + (5,)
+DISKIO_WRITES = _DISKIO + (6,)
+DISKIO_READ_BYTES = _DISKIO + (12,)
+DISKIO_WRITTEN_BYTES = _DISKIO + (13,)
+
+COLUMNS = (
+    DISK_STATE,
+    DISK_TEMPERATURE,
+    FAN_RPM,
+    TEMPERATURE_VALUE,
+    IF_NAME,
+    IF_HC_IN_OCTETS,
+    IF_HC_OUT_OCTETS,
+    DISKIO_DEVICE,
+    DISKIO_READS,
+    DISKIO_WRITES,
+    DISKIO_READ_BYTES,
+    DISKIO_WRITTEN_BYTES,
+)
+
+# UCD-SNMP-MIB scalars, requested as GETBULK non-repeaters so the OID
+# without the trailing .0 is asked for and its instance comes back
+_UCD = (1, 3, 6, 1, 4, 1, 2021)
+CPU_COUNTERS = {
+    "user": _UCD + (11, 50),
+    "nice": _UCD + (11, 51),
+    "system": _UCD + (11, 52),
+    "idle": _UCD + (11, 53),
+    "iowait": _UCD + (11, 54),
+    "irq": _UCD + (11, 56),
+    "softirq": _UCD + (11, 61),
+}
+MEM_TOTAL = _UCD + (4, 5)
+MEM_AVAILABLE = _UCD + (4, 6)
+MEM_BUFFER = _UCD + (4, 14)
+MEM_CACHED = _UCD + (4, 15)
+# laLoad column, whose first row is the 1 minute average
+LOAD_1M = _UCD + (10, 1, 3)
+
+SCALARS = (
+    *CPU_COUNTERS.values(),
+    MEM_TOTAL,
+    MEM_AVAILABLE,
+    MEM_BUFFER,
+    MEM_CACHED,
+    LOAD_1M,
+)
+
+# Whole disks only, partitions and md arrays are left to dbbroker naming
+_WHOLE_DISK_RE = re.compile(r"^sd[a-z]+$")
+SECTOR_SIZE = 512
+
+
+def pysnmp_available():
+    """Return whether pysnmp is installed, without importing it."""
+    return importlib.util.find_spec("pysnmp") is not None
+
+
+def _int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def build_telemetry(scalars, columns):
+    """Map raw SNMP values onto the HealthInfo snapshot model.
+
+    ``scalars`` maps a requested scalar OID to its value and ``columns``
+    maps a column OID to {row index: value}. Disks are keyed like the
+    dbbroker disk_channel, which counts bays from 0 where diskNumber counts
+    from 1.
+    """
+    temperatures = columns.get(TEMPERATURE_VALUE, {})
+    fans = columns.get(FAN_RPM, {})
+    states = columns.get(DISK_STATE, {})
+    disk_temperatures = columns.get(DISK_TEMPERATURE, {})
+
+    telemetry = {
+        "cpu_temp": _int(temperatures[min(temperatures)]) if temperatures else None,
+        "fan_speed": _int(fans[min(fans)]) if fans else None,
+        # Every probe and fan in row order, matched to dbbroker's by position
+        "temperatures": [_int(value) for _, value in sorted(temperatures.items())],
+        "fans": [_int(value) for _, value in sorted(fans.items())],
+        "disks": [
+            {
+                "key": str(index[0] - 1),
+                "status": str(state),
+                "temperature": _int(disk_temperatures.get(index)),
+            }
+            for index, state in sorted(states.items())
+        ],
+    }
+
+    stats = {
+        "counters": {},
+        "memory_percent": None,
+        "load_1m": None,
+        "interfaces": [],
+        "disks": [],
+    }
+    for field, oid in CPU_COUNTERS.items():
+        value = _int(scalars.get(oid))
+        if value is not None:
+            stats["counters"][("cpu", field)] = value
+
+    total = _int(scalars.get(MEM_TOTAL))
+    available = sum(
+        _int(scalars.get(oid)) or 0 for oid in (MEM_AVAILABLE, MEM_BUFFER, MEM_CACHED)
+    )
+    if total:
+        stats["memory_percent"] = round((total - available) / total * 100, 1)
+
+    try:
+        stats["load_1m"] = float(scalars.get(LOAD_1M))
+    except (TypeError, ValueError):
+        pass
+
+    for index, name in sorted(columns.get(IF_NAME, {}).items()):
+        name = str(name)
+        if name == "lo":
+            continue
+        stats["interfaces"].append(name)
+        for field, oid in (
+            ("rx_bytes", IF_HC_IN_OCTETS),
+            ("tx_bytes", IF_HC_OUT_OCTETS),
+        ):
+            value = _int(columns.get(oid, {}).get(index))
+            if value is not None:
+                stats["counters"][("net", name, field)] = value
+
+    for index, name in sorted(columns.get(DISKIO_DEVICE, {}).items()):
+        name = str(name)
+        if not _WHOLE_DISK_RE.match(name):
+            continue
+        stats["disks"].append(name)
+        for field, oid, scale in (
+            ("reads", DISKIO_READS, 1),
+            ("writes", DISKIO_WRITES, 1),
+            ("sectors_read", DISKIO_READ_BYTES, SECTOR_SIZE),
+            ("sectors_written", DISKIO_WRITTEN_BYTES, SECTOR_SIZE),
+        ):
+            value = _int(columns.get(oid, {}).get(index))
+            if value is not None:
+                stats["counters"][("disk", name, field)] = value // scale
+
+    telemetry["system_stats"] = stats
+    return telemetry
+
+
+class ReadyNASSNMP:
+    """Read ReadyNAS telemetry over SNMP v2c or v3 (authPriv with SHA/AES)."""
+
+    def __init__(
+        self,
+        host,
+        port=161,
+        version="2c",
+        community="public",
+        username=None,
+        auth_key=None,
+        priv_key=None,
+        timeout=2,
+        retries=1,
+        max_repetitions=25,
+    ):
+        """Initialize the transport; nothing is imported or opened yet."""
+        self.host = host
+        self.port = port
+        self.version = version
+        self.community = community
+        self.username = username
+        self.auth_key = auth_key
+        self.priv_key = priv_key
+        self.timeout = timeout
+        self.retries = retries
+        self.max_repetitions = max_repetitions
+        self._hlapi = None
+        self._engine = None
+        self._auth = None
+        self._exceptions = ()
+
+    def _load(self):
+        """Import pysnmp and build the engine, both block on disk I/O."""
+        from pysnmp.hlapi.v3arch import asyncio as hlapi
+        from pysnmp.proto import rfc1905
+
+        # noSuchObject, noSuchInstance and endOfMibView markers
+        self._exceptions = (
+            rfc1905.noSuchObject.tagSet,
+            rfc1905.noSuchInstance.tagSet,
+            rfc1905.endOfMibView.tagSet,
+        )
+
+        if self.version == "3":
+            auth = hlapi.UsmUserData(
+                self.username,
+                authKey=self.auth_key,
+                privKey=self.priv_key,
+                authProtocol=hlapi.usmHMACSHAAuthProtocol
+                if self.auth_key
+                else hlapi.usmNoAuthProtocol,
+                privProtocol=hlapi.usmAesCfb128Protocol
+                if self.priv_key
+                else hlapi.usmNoPrivProtocol,
+            )
+        else:
+            auth = hlapi.CommunityData(self.community, mpModel=1)
+        return hlapi, hlapi.SnmpEngine(), auth
+
+    def close(self):
+        """Close the engine's UDP transport, if one was opened."""
+        if self._engine is not None:
+            self._engine.close_dispatcher()
+            self._engine = None
+
+    def _timeout(self, loop, deadline):
+        """Return the per-attempt timeout that keeps a request in the deadline."""
+        if deadline is None:
+            return self.timeout
+        return min(self.timeout, (deadline - loop.time()) / (self.retries + 1))
+
+    async def fetch(self, resource, deadline=None):
+        """Return the telemetry for a resource, or None if the agent failed."""
+        loop = asyncio.get_running_loop()
+        if self._engine is None:
+            self._hlapi, self._engine, self._auth = await loop.run_in_executor(
+                None, self._load
+            )
+        hlapi = self._hlapi
+
+        timeout = self._timeout(loop, deadline)
+        if timeout <= 0:
+            return None
+        target = await hlapi.UdpTransportTarget.create(
+            (self.host, self.port), timeout=timeout, retries=self.retries
+        )
+
+        scalars = {}
+        columns = {column: {} for column in COLUMNS}
+        cursors = {column: column for column in COLUMNS}
+        pending = list(COLUMNS)
+        first = True
+        while pending:
+            # Every round, and every retry within it, has to fit the deadline
+            if not first:
+                target.timeout = self._timeout(loop, deadline)
+                if target.timeout <= 0:
+                    _LOGGER.debug(
+                        f"🔍 SNMP {resource} walk of {self.host} ran out of time"
+                    )
+                    return None
+            requested = list(SCALARS) if first else []
+            var_binds = [
+                hlapi.ObjectType(hlapi.ObjectIdentity(oid))
+                for oid in requested + [cursors[column] for column in pending]
+            ]
+            error, status, _, table = await hlapi.bulk_cmd(
+                self._engine,
+                self._auth,
+                target,
+                hlapi.ContextData(),
+                len(requested),
+                self.max_repetitions,
+                *var_binds,
+                lookupMib=False,
+            )
+            if error or status:
+                _LOGGER.error(
+                    f"❌ SNMP {resource} request to {self.host} failed: "
+                    f"{error or status.prettyPrint()}"
+                )
+                return None
+
+            for oid, (name, value) in zip(requested, table[: len(requested)]):
+                # Non-repeaters are GETNEXTs, an agent without the scalar
+                # answers with whatever OID follows it
+                if (
+                    value.tagSet not in self._exceptions
+                    and tuple(name)[: len(oid)] == oid
+                ):
+                    scalars[oid] = value
+
+            finished = set()
+            received = {column: 0 for column in pending}
+            for position, (name, value) in enumerate(table[len(requested) :]):
+                column = pending[position % len(pending)]
+                if column in finished:
+                    continue
+                name = tuple(name)
+                if value.tagSet in self._exceptions or name[: len(column)] != column:
+                    finished.add(column)
+                    continue
+                columns[column][name[len(column) :]] = value
+                cursors[column] = name
+                received[column] += 1
+            # A column with a full set of repetitions may have more rows
+            pending = [
+                column
+                for column in pending
+                if column not in finished and received[column] >= self.max_repetitions
+            ]
+            first = False
+
+        return build_telemetry(scalars, columns)
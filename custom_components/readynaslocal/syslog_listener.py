@@ -0,0 +1,231 @@
+"""Syslog listener turning ReadyNAS alerts into events and targeted refreshes."""
+
+import asyncio
+import logging
+import re
+import socket
+import time
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import DATA_SYSLOG, EVENT_ALERT, SIGNAL_ALERT
+
+_LOGGER = logging.getLogger(__name__)
+
+SEVERITIES = (
+    "emergency",
+    "alert",
+    "critical",
+    "error",
+    "warning",
+    "notice",
+    "info",
+    "debug",
+)
+
+# (category, pattern, resources to refresh), the first matching rule wins.
+# "Disk" stands for the per-disk SMART counters and "Backups" for the backup
+# jobs; backup alerts come first as they often name a USB disk.
+ALERT_RULES = (
+    ("backup", re.compile(r"\bbackup\b", re.I), ("Backups",)),
+    ("resync", re.compile(r"resync", re.I), ("Volumes",)),
+    ("disk", re.compile(r"\bdisks?\b", re.I), ("HealthInfo", "Volumes", "Disk")),
+    ("volume", re.compile(r"\bvolumes?\b", re.I), ("Volumes",)),
+    ("fan", re.compile(r"\bfans?\b", re.I), ("HealthInfo",)),
+    ("temperature", re.compile(r"temperature", re.I), ("HealthInfo",)),
+    ("power", re.compile(r"\b(power supply|psu|ups)\b", re.I), ("HealthInfo",)),
+)
+
+# Seconds alerts for one NAS are collected before refreshing, so a burst of
+# messages about one failure costs a single refresh
+ALERT_COALESCE = 1.0
+# Minimum seconds between re-resolving hosts after mail from an unknown source
+RESOLVE_INTERVAL = 60
+
+_PRI_RE = re.compile(r"^<(\d{1,3})>")
+_RFC5424_RE = re.compile(r"^1 \S+ \S+ \S+ \S+ \S+ (?:-|(?:\[.*?\])+)\s?(.*)$", re.S)
+_RFC3164_RE = re.compile(
+    r"^[A-Z][a-z]{2} [ \d]\d \d\d:\d\d:\d\d \S+ (?:[^\s:]+: )?(.*)$", re.S
+)
+
+
+def parse_syslog(data):
+    """Return (severity, message) of an RFC 3164 or 5424 datagram, or None."""
+    text = data.decode("utf-8", "replace").strip()
+    match = _PRI_RE.match(text)
+    if match is None:
+        return None
+    severity = SEVERITIES[int(match.group(1)) % 8]
+    message = text[match.end() :]
+    for pattern in (_RFC5424_RE, _RFC3164_RE):
+        header = pattern.match(message)
+        if header:
+            message = header.group(1)
+            break
+    return severity, message.lstrip("\ufeff").strip()
+
+
+def classify(message):
+    """Return (category, resources) for an alert message, None if unrelated."""
+    for category, pattern, resources in ALERT_RULES:
+        if pattern.search(message):
+            return category, resources
+    return None
+
+
+class ReadyNASSyslogListener(asyncio.DatagramProtocol):
+    """UDP syslog receiver shared by every entry that uses the same port."""
+
+    def __init__(self, hass: HomeAssistant, port):
+        """Initialize the listener."""
+        self.hass = hass
+        self.port = port
+        # entry_id -> host as configured
+        self.entries = {}
+        # source address -> entry_id
+        self._addresses = {}
+        # entry_id -> resources waiting for the coalesced refresh
+        self._pending = {}
+        self._resolved_at = 0.0
+        self._transport = None
+        # Task binding the socket, awaited by every entry sharing the port
+        self.started = None
+
+    async def async_start(self):
+        """Bind the UDP socket, raising OSError if the port is taken."""
+        self._transport, _ = await self.hass.loop.create_datagram_endpoint(
+            lambda: self, local_addr=("0.0.0.0", self.port)
+        )
+        _LOGGER.info(f"✅ Listening for ReadyNAS syslog on UDP {self.port}")
+
+    @callback
+    def async_stop(self):
+        """Close the socket, or give up binding it."""
+        if self.started is not None and not self.started.done():
+            self.started.cancel()
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+    async def async_add_entry(self, entry_id, host):
+        """Start accepting alerts from an entry's NAS."""
+        self.entries[entry_id] = host
+        await self._async_resolve()
+
+    @callback
+    def async_remove_entry(self, entry_id):
+        """Stop accepting alerts from an entry's NAS."""
+        self.entries.pop(entry_id, None)
+        self._pending.pop(entry_id, None)
+        self._addresses = {
+            address: owner
+            for address, owner in self._addresses.items()
+            if owner != entry_id
+        }
+
+    async def _async_resolve(self):
+        """Map every configured host to the addresses it may send from."""
+        self._resolved_at = resolved_at = time.monotonic()
+        addresses = {}
+        # Entries may be added while this awaits the resolver
+        for entry_id, host in list(self.entries.items()):
+            # Strip a port, but leave bare IPv6 addresses alone
+            name = host.rsplit(":", 1)[0] if host.count(":") == 1 else host
+            try:
+                infos = await self.hass.loop.getaddrinfo(
+                    name, None, type=socket.SOCK_DGRAM
+                )
+            except OSError as err:
+                _LOGGER.warning(f"⚠️ Could not resolve {name} for syslog: {err}")
+                continue
+            for info in infos:
+                addresses[info[4][0]] = entry_id
+        # A resolve started later knows about more entries, and entries may
+        # have been removed meanwhile
+        if resolved_at == self._resolved_at:
+            self._addresses = {
+                address: owner
+                for address, owner in addresses.items()
+                if owner in self.entries
+            }
+
+    def datagram_received(self, data, addr):
+        """Handle one syslog message."""
+        entry_id = self._addresses.get(addr[0])
+        if entry_id is None:
+            _LOGGER.debug(f"🔍 Ignoring syslog from unknown source {addr[0]}")
+            # A NAS may have picked up a new DHCP lease
+            if time.monotonic() - self._resolved_at > RESOLVE_INTERVAL:
+                self.hass.async_create_task(self._async_resolve())
+            return
+
+        parsed = parse_syslog(data)
+        if parsed is None:
+            return
+        severity, message = parsed
+        alert = classify(message)
+        if alert is None:
+            return
+        category, resources = alert
+
+        _LOGGER.debug(f"📨 {category} alert from {addr[0]}: {message}")
+        self.hass.bus.async_fire(
+            EVENT_ALERT,
+            {
+                "entry_id": entry_id,
+                "host": self.entries[entry_id],
+                "category": category,
+                "severity": severity,
+                "message": message,
+            },
+        )
+
+        pending = self._pending.get(entry_id)
+        if pending is None:
+            self._pending[entry_id] = set(resources)
+            self.hass.loop.call_later(ALERT_COALESCE, self._flush, entry_id)
+        else:
+            pending.update(resources)
+
+    @callback
+    def _flush(self, entry_id):
+        """Ask the entry's platforms to refresh what the alerts touched."""
+        resources = self._pending.pop(entry_id, None)
+        if resources and entry_id in self.entries:
+            async_dispatcher_send(
+                self.hass, SIGNAL_ALERT.format(entry_id), frozenset(resources)
+            )
+
+
+async def async_register_entry(hass: HomeAssistant, entry_id, host, port):
+    """Route alerts from an entry's NAS, starting the port's listener if needed."""
+    listeners = hass.data.setdefault(DATA_SYSLOG, {})
+    listener = listeners.get(port)
+    if listener is None:
+        # Claim the port before binding, so an entry set up meanwhile waits
+        # for this bind instead of binding the port a second time
+        listener = ReadyNASSyslogListener(hass, port)
+        listener.started = hass.async_create_task(listener.async_start())
+        listeners[port] = listener
+    try:
+        # Shielded, so one entry's setup being cancelled keeps the bind going
+        await asyncio.shield(listener.started)
+    except OSError:
+        if listeners.get(port) is listener:
+            del listeners[port]
+        raise
+    await listener.async_add_entry(entry_id, host)
+
+
+@callback
+def async_unregister_entry(hass: HomeAssistant, entry_id, port):
+    """Stop routing alerts for an entry, closing the listener once unused."""
+    listeners = hass.data.get(DATA_SYSLOG, {})
+    listener = listeners.get(port)
+    if listener is None:
+        return
+    listener.async_remove_entry(entry_id)
+    if not listener.entries:
+        listener.async_stop()
+        del listeners[port]
@@ -0,0 +1,90 @@
+"""Count ReadyNAS logins per poll with and without session cookies.
+
+Polls the mock NAS the way the sensor coordinator does, once against a NAS
+that hands out no session cookie (every dbbroker request carries Basic
+credentials) and once against one that does (only logins do). Sessions are
+expired part way through to include the re-login after a 401. Reports the
+Basic credential checks the NAS made, each of which is a PAM authentication
+on a real unit, and exits non-zero if cookie sessions did not reduce them.
+
+    python scripts/bench_auth.py --polls 50 --expire-every 20
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "custom_components" / "readynaslocal"))
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from mock_readynas import MockReadyNAS
+from pyreadynas import ReadyNASAPI
+
+
+async def measure(session_cookies, polls, expire_every):
+    """Poll a fresh mock NAS and count the credential checks it made."""
+    nas = MockReadyNAS(session_cookies=session_cookies)
+    address = await nas.start()
+    api = ReadyNASAPI(address, nas.username, nas.password, use_ssl=False)
+    try:
+        start = time.perf_counter()
+        failed = 0
+        for poll in range(1, polls + 1):
+            if not await api.get_health_info():
+                failed += 1
+            if expire_every and poll % expire_every == 0:
+                nas.expire_sessions()
+        elapsed = time.perf_counter() - start
+    finally:
+        await api.close()
+        await nas.stop()
+
+    requests = nas.nas_calls()
+    return {
+        "session_cookies": session_cookies,
+        "polls": polls,
+        "failed": failed,
+        "nas_requests": requests,
+        "logins": api.logins,
+        "credential_checks": nas.authentications,
+        "credential_checks_per_poll": round(nas.authentications / polls, 2),
+        "rejected": nas.unauthorized,
+        "ms_per_poll": round(elapsed / polls * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--polls", type=int, default=50)
+    parser.add_argument(
+        "--expire-every",
+        type=int,
+        default=20,
+        help="expire the NAS sessions after every N polls (0 never)",
+    )
+    args = parser.parse_args()
+
+    async def _run():
+        return [
+            await measure(session_cookies, args.polls, args.expire_every)
+            for session_cookies in (False, True)
+        ]
+
+    basic, cookie = asyncio.run(_run())
+    print(json.dumps({"basic": basic, "cookie": cookie}, indent=2))
+
+    if basic["failed"] or cookie["failed"]:
+        print("polls failed", file=sys.stderr)
+        return 1
+    if cookie["credential_checks"] >= basic["credential_checks"]:
+        print("session cookies saved no credential checks", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
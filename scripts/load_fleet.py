@@ -0,0 +1,274 @@
+"""Load test the ReadyNAS integration against a fleet of mock NAS units.
+
+Starts one mock NAS per config entry in a child process, so serving them
+costs the measured process nothing, sets up every entry in a test Home
+Assistant instance and then drives the 30 second poll by firing time
+changes. For each fleet size it reports:
+- event-loop lag while polling (a 50 ms timer's overshoot: p50, p99, max)
+- wall and CPU time per poll cycle of the whole fleet
+- resident memory per entry after setup
+- state writes per cycle, and per second at the real poll cadence
+
+and exits non-zero when the p99 lag or the CPU per entry and cycle is over
+budget, so scaling regressions show up in CI. Needs the packages in requirements.txt.
+
+    python scripts/load_fleet.py --entries 50 100 200 --cycles 10
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import resource
+import socket
+import statistics
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from mock_readynas import MockReadyNAS
+
+# This repo's custom_components, bound before the test harness puts its own
+# config directory, which has one too, on sys.path
+import custom_components  # noqa: F401
+
+DOMAIN = "readynaslocal"
+# Seconds between the main coordinator's polls
+POLL_INTERVAL = 30
+# Seconds between event-loop lag samples
+LAG_PERIOD = 0.05
+
+
+def serve_fleet(count, disks, latency, connection):
+    """Serve ``count`` mock NAS units until told to stop (child process)."""
+
+    async def _serve():
+        fleet = [MockReadyNAS(disks=disks, latency=latency) for _ in range(count)]
+        connection.send([await nas.start() for nas in fleet])
+        await asyncio.get_running_loop().run_in_executor(None, connection.recv)
+        connection.send(sum(nas.nas_calls() for nas in fleet))
+        for nas in fleet:
+            await nas.stop()
+
+    asyncio.run(_serve())
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _rss_bytes():
+    """Current resident set size, the peak where /proc is not available."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * resource.getpagesize()
+    except OSError:
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+class LagSampler:
+    """Measure how late a periodic timer fires on the event loop."""
+
+    def __init__(self, period=LAG_PERIOD):
+        self.period = period
+        self.samples = []
+        self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.period
+            await asyncio.sleep(self.period)
+            self.samples.append(max(0.0, loop.time() - expected))
+
+    def start(self):
+        self.samples = []
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    def summary(self):
+        if not self.samples:
+            return {"p50_ms": None, "p99_ms": None, "max_ms": None}
+        ordered = sorted(self.samples)
+        return {
+            "p50_ms": round(statistics.median(ordered) * 1000, 2),
+            "p99_ms": round(
+                ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000, 2
+            ),
+            "max_ms": round(ordered[-1] * 1000, 2),
+        }
+
+
+async def measure_fleet(count, cycles, disks, latency):
+    """Set up ``count`` entries, poll them ``cycles`` times and measure it."""
+    from homeassistant.config_entries import ConfigEntryState
+    from homeassistant.const import EVENT_STATE_CHANGED
+    from homeassistant.helpers import entity_registry as er
+    from homeassistant.loader import DATA_CUSTOM_COMPONENTS
+    from homeassistant.setup import async_setup_component
+    from homeassistant.util import dt as dt_util
+    from pytest_homeassistant_custom_component.common import (
+        MockConfigEntry,
+        async_fire_time_changed,
+        async_test_home_assistant,
+    )
+
+    try:
+        from homeassistant.const import EVENT_STATE_REPORTED
+    except ImportError:
+        # Before state_reported every write fired state_changed
+        EVENT_STATE_REPORTED = None
+
+    connection, child_connection = multiprocessing.Pipe()
+    mocks = multiprocessing.Process(
+        target=serve_fleet,
+        args=(count, disks, latency, child_connection),
+        daemon=True,
+    )
+    mocks.start()
+    loop = asyncio.get_running_loop()
+    addresses = await loop.run_in_executor(None, connection.recv)
+
+    try:
+        async with async_test_home_assistant() as hass:
+            # Same as the enable_custom_integrations fixture
+            hass.data.pop(DATA_CUSTOM_COMPONENTS, None)
+            await async_setup_component(
+                hass, "http", {"http": {"server_port": _free_port()}}
+            )
+
+            writes = [0]
+
+            def _count_write(event):
+                writes[0] += 1
+
+            hass.bus.async_listen(EVENT_STATE_CHANGED, _count_write)
+            if EVENT_STATE_REPORTED is not None:
+                hass.bus.async_listen(EVENT_STATE_REPORTED, _count_write)
+
+            entries = []
+            for address in addresses:
+                entry = MockConfigEntry(
+                    domain=DOMAIN,
+                    unique_id=f"readynas_{address}",
+                    data={
+                        "host": address,
+                        "username": "admin",
+                        "password": "password",
+                        "use_ssl": False,
+                        "ignore_ssl_errors": True,
+                    },
+                )
+                entry.add_to_hass(hass)
+                entries.append(entry)
+
+            rss_before = _rss_bytes()
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(hass.config_entries.async_setup(entry.entry_id) for entry in entries)
+            )
+            await hass.async_block_till_done()
+            setup_s = time.perf_counter() - start
+            rss_after = _rss_bytes()
+
+            registry = er.async_get(hass)
+            entities = sum(
+                len(er.async_entries_for_config_entry(registry, entry.entry_id))
+                for entry in entries
+            )
+            loaded = sum(entry.state is ConfigEntryState.LOADED for entry in entries)
+
+            sampler = LagSampler()
+            sampler.start()
+            cycle_wall, cycle_cpu, cycle_writes = [], [], []
+            for _ in range(cycles):
+                writes[0] = 0
+                wall, cpu = time.perf_counter(), time.process_time()
+                async_fire_time_changed(
+                    hass, dt_util.utcnow() + timedelta(seconds=POLL_INTERVAL + 1)
+                )
+                await hass.async_block_till_done()
+                cycle_wall.append(time.perf_counter() - wall)
+                cycle_cpu.append(time.process_time() - cpu)
+                cycle_writes.append(writes[0])
+            await sampler.stop()
+
+            await asyncio.gather(
+                *(hass.config_entries.async_unload(entry.entry_id) for entry in entries)
+            )
+            await hass.async_block_till_done()
+    finally:
+        connection.send("stop")
+        nas_calls = await loop.run_in_executor(None, connection.recv)
+        mocks.join(timeout=10)
+
+    writes_per_cycle = statistics.mean(cycle_writes) if cycle_writes else 0
+    return {
+        "entries": count,
+        "loaded": loaded,
+        "entities": entities,
+        "setup_s": round(setup_s, 2),
+        "memory_per_entry_kb": round((rss_after - rss_before) / count / 1024, 1),
+        "cycle_wall_ms": round(statistics.mean(cycle_wall) * 1000, 1),
+        "cycle_cpu_ms": round(statistics.mean(cycle_cpu) * 1000, 1),
+        "cpu_per_entry_ms": round(statistics.mean(cycle_cpu) * 1000 / count, 2),
+        "state_writes_per_cycle": round(writes_per_cycle, 1),
+        "state_writes_per_second": round(writes_per_cycle / POLL_INTERVAL, 1),
+        "loop_lag": sampler.summary(),
+        "nas_calls": nas_calls,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--entries", type=int, nargs="+", default=[50, 100, 200], help="fleet sizes"
+    )
+    parser.add_argument("--cycles", type=int, default=10)
+    parser.add_argument("--disks", type=int, default=4)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds each NAS takes to answer"
+    )
+    parser.add_argument("--max-lag-ms", type=float, default=100)
+    parser.add_argument("--max-cpu-per-entry-ms", type=float, default=20)
+    args = parser.parse_args()
+
+    reports = [
+        asyncio.run(measure_fleet(count, args.cycles, args.disks, args.latency))
+        for count in args.entries
+    ]
+    print(json.dumps(reports, indent=2))
+
+    over = []
+    for report in reports:
+        lag = report["loop_lag"]["p99_ms"]
+        if lag is not None and lag > args.max_lag_ms:
+            over.append(f"{report['entries']} entries: p99 lag {lag} ms")
+        if report["cpu_per_entry_ms"] > args.max_cpu_per_entry_ms:
+            over.append(
+                f"{report['entries']} entries: "
+                f"{report['cpu_per_entry_ms']} ms CPU per entry per cycle"
+            )
+        if report["loaded"] < report["entries"]:
+            over.append(f"{report['entries']} entries: only {report['loaded']} loaded")
+    for line in over:
+        print(f"over budget: {line}", file=sys.stderr)
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
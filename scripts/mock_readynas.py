@@ -0,0 +1,451 @@
+"""Minimal stand-in for the ReadyNAS admin page and dbbroker endpoint.
+
+Serves just enough of the NML protocol for the integration to set up:
+the CSRF token on /admin/, and HealthInfo, Volumes, SystemInfo, FanConfig,
+the snapshot, share and backup job listings and the Halt custom operation
+on /dbbroker. Every request is counted so
+harnesses can tell how many NAS round trips something cost, and every
+Basic credential check so they can tell how many logins (PAM runs on a
+real NAS) it cost.
+
+Run standalone with ``python scripts/mock_readynas.py --port 8080``.
+"""
+
+import argparse
+import asyncio
+import base64
+import collections
+import re
+import secrets
+import ssl
+import xml.etree.ElementTree as ET
+
+from aiohttp import web
+
+XS = "{http://www.netgear.com/protocol/transaction/NMLSchema-0.9}"
+CSRF_TOKEN = "mock-csrf-token"
+
+
+class MockReadyNAS:
+    """A fake ReadyNAS with a configurable number of disks, volumes and probes."""
+
+    def __init__(
+        self,
+        username="admin",
+        password="password",
+        disks=4,
+        volumes=("data",),
+        model="ReadyNAS 104",
+        latency=0.0,
+        snapshots=250,
+        session_cookies=True,
+        temperatures=1,
+        fans=1,
+        psus=0,
+        shares=0,
+        backups=0,
+    ):
+        self.username = username
+        self.password = password
+        self.disks = disks
+        self.volumes = list(volumes)
+        self.model = model
+        self.latency = latency
+        self.snapshots = snapshots
+        self.temperatures = temperatures
+        self.fans = fans
+        self.psus = psus
+        self.shares = shares
+        # Backup jobs, driven by start_backup() and finish_backup()
+        self.backup_jobs = [
+            {
+                "name": f"Backup {i + 1}",
+                "type": ("rsync", "cloud", "usb")[i % 3],
+                "running": False,
+                "result": None,
+                "started": None,
+                "finished": None,
+                "bytes": 0,
+                "next_run": None,
+            }
+            for i in range(backups)
+        ]
+        # Whether a login on /admin/ hands out a session cookie
+        self.session_cookies = session_cookies
+        self.sessions = set()
+        # Basic credential checks, each one a PAM authentication on a real NAS
+        self.authentications = 0
+        # resource-ids answered with a 500, to exercise failure handling
+        self.failing = set()
+        self.fan_mode = "balanced"
+        self.halted = False
+        # "admin" for CSRF page loads, otherwise the NML resource-id
+        self.requests = collections.Counter()
+        # resource-type -> listings started: transactions asking for the
+        # first page (or the only one) of that type
+        self.listings = collections.Counter()
+        self.unauthorized = 0
+        self._runner = None
+        self.port = None
+
+    # -- payloads ---------------------------------------------------------
+
+    def health_xml(self):
+        disks = "".join(
+            f"""<Disk resource-id="disk{bay}" resource-type="Disk">
+                <disk_channel>{bay}</disk_channel>
+                <disk_model>WDC WD40EFRX</disk_model>
+                <disk_temperature>{33 + bay}</disk_temperature>
+                <disk_status>ONLINE</disk_status>
+                <disk_capacity>4000787030016</disk_capacity>
+            </Disk>"""
+            for bay in range(self.disks)
+        )
+        probes = "".join(
+            f"""<Temperature resource-id="temp{index}">
+                <temp_name>{"CPU" if index == 0 else f"SYS{index}"}</temp_name>
+                <temp_value>{45 - 5 * index}</temp_value>
+                <temp_status>ok</temp_status>
+            </Temperature>"""
+            for index in range(self.temperatures)
+        )
+        fans = "".join(
+            f"""<Fan resource-id="fan{index}">
+                <fan_name>SYS{index + 1}</fan_name>
+                <fan_speed>{1180 + 20 * index}</fan_speed>
+                <fan_status>ok</fan_status>
+            </Fan>"""
+            for index in range(self.fans)
+        )
+        psus = "".join(
+            f"""<Power_Supply resource-id="psu{index}">
+                <psu_name>PSU{index + 1}</psu_name>
+                <psu_status>ok</psu_status>
+                <psu_voltage>12050</psu_voltage>
+            </Power_Supply>"""
+            for index in range(self.psus)
+        )
+        return f"""<Health_Collection>
+            <Enclosure_Health resource-id="0" resource-type="Enclosure_Health">
+                {probes}
+                {fans}
+                {psus}
+                {disks}
+            </Enclosure_Health>
+        </Health_Collection>"""
+
+    def volumes_xml(self):
+        raid_disks = "".join(
+            f'<Disk resource-id="disk{bay}"/>' for bay in range(self.disks)
+        )
+        volumes = "".join(
+            f"""<Volume resource-id="{name}" resource-type="Volume">
+                <Property_List>
+                    <Volume_Name>{name}</Volume_Name>
+                    <RAID_Level>5</RAID_Level>
+                    <Health>REDUNDANT</Health>
+                    <Capacity>11702900736</Capacity>
+                    <Free>7802900736</Free>
+                    <DataUsedKB>3900000000</DataUsedKB>
+                    <Encryption enabled="0"/>
+                    <AutoExpand>on</AutoExpand>
+                    <Quota>off</Quota>
+                </Property_List>
+                <RAID LEVEL="5" ID="0">{raid_disks}</RAID>
+            </Volume>"""
+            for name in self.volumes
+        )
+        return f"<Volume_Collection>{volumes}</Volume_Collection>"
+
+    def system_xml(self):
+        return f"""<SystemInfo>
+            <Model>{self.model}</Model>
+            <Firmware_Name>ReadyNASOS</Firmware_Name>
+            <Firmware_Version>6.10.8</Firmware_Version>
+            <Serial>MOCK{self.port or 0:06d}</Serial>
+            <System_Uptime>123456</System_Uptime>
+            <MAC_Address>00:11:22:33:44:55</MAC_Address>
+        </SystemInfo>"""
+
+    def stats_xml(self):
+        tick = self.requests["SystemStats"]
+        interfaces = "".join(
+            f"""<Interface name="eth{i}">
+                <rx_bytes>{tick * 3_000_000 + i}</rx_bytes>
+                <tx_bytes>{tick * 1_500_000 + i}</tx_bytes>
+            </Interface>"""
+            for i in range(2)
+        )
+        disks = "".join(
+            f"""<Disk_IO name="sd{chr(ord("a") + bay)}">
+                <reads>{tick * 120}</reads>
+                <writes>{tick * 80}</writes>
+                <sectors_read>{tick * 24_000}</sectors_read>
+                <sectors_written>{tick * 16_000}</sectors_written>
+            </Disk_IO>"""
+            for bay in range(self.disks)
+        )
+        return f"""<System_Stats>
+            <CPU>
+                <user>{tick * 300}</user><nice>0</nice><system>{tick * 100}</system>
+                <idle>{tick * 2600}</idle><iowait>{tick * 20}</iowait>
+                <irq>0</irq><softirq>{tick * 5}</softirq>
+            </CPU>
+            <Memory><total_kb>2097152</total_kb><available_kb>1048576</available_kb></Memory>
+            <Load><load_1m>0.42</load_1m></Load>
+            {interfaces}
+            {disks}
+        </System_Stats>"""
+
+    def snapshots_xml(self, volume, start, count):
+        end = min(start + count, self.snapshots)
+        snapshots = "".join(
+            f"""<Snapshot resource-id="{volume}_snap{i}" resource-type="Snapshot">
+                <Timestamp>{1_700_000_000 + i * 3600}</Timestamp>
+                <Size>{(i + 1) * 1_048_576}</Size>
+            </Snapshot>"""
+            for i in range(start, end)
+        )
+        return f"<Snapshot_Collection>{snapshots}</Snapshot_Collection>"
+
+    def shares_xml(self, start, count):
+        # Every page request grows the shares a little, at varying rates
+        listing = self.requests["Shares"]
+        end = min(start + count, self.shares)
+        shares = "".join(
+            f"""<Share resource-id="share{i}" resource-type="Share">
+                <Share_Name>share{i}</Share_Name>
+                <Volume>{self.volumes[i % len(self.volumes)]}</Volume>
+                <DataUsedKB>{(i * 7919) % 10_000_019 + listing * (i * 31 % 97)}</DataUsedKB>
+                <Quota>{(i % 3) * 512_000}</Quota>
+            </Share>"""
+            for i in range(start, end)
+        )
+        return f"<Share_Collection>{shares}</Share_Collection>"
+
+    def backups_xml(self):
+        jobs = "".join(
+            f"""<BackupJob resource-id="job{i}" resource-type="BackupJob">
+                <Job_Name>{job["name"]}</Job_Name>
+                <Job_Type>{job["type"]}</Job_Type>
+                <Status>{"running" if job["running"] else "idle"}</Status>
+                <Progress>{50 if job["running"] else 0}</Progress>
+                <Last_Run_Status>{job["result"] or ""}</Last_Run_Status>
+                <Last_Run_Start>{job["started"] or 0}</Last_Run_Start>
+                <Last_Run_End>{job["finished"] or 0}</Last_Run_End>
+                <Bytes_Transferred>{job["bytes"]}</Bytes_Transferred>
+                <Next_Run>{job["next_run"] or 0}</Next_Run>
+            </BackupJob>"""
+            for i, job in enumerate(self.backup_jobs)
+        )
+        return f"<BackupJob_Collection>{jobs}</BackupJob_Collection>"
+
+    def start_backup(self, index, now):
+        """Start a backup job's run at epoch ``now``."""
+        job = self.backup_jobs[index]
+        job.update(running=True, started=now)
+
+    def finish_backup(self, index, now, ok=True, transferred=0):
+        """End a backup job's run at epoch ``now``."""
+        job = self.backup_jobs[index]
+        job.update(
+            running=False,
+            finished=now,
+            result="success" if ok else "failed",
+            bytes=transferred,
+        )
+
+    def disk_xml(self, resource_id):
+        return f"""<Disk resource-id="{resource_id}" resource-type="Disk">
+            <Reallocated_Sectors>0</Reallocated_Sectors>
+            <Pending_Sectors>0</Pending_Sectors>
+            <Uncorrectable_Errors>0</Uncorrectable_Errors>
+            <ATA_Errors>0</ATA_Errors>
+            <Command_Timeouts>0</Command_Timeouts>
+            <Power_On_Hours>{self.requests[resource_id] + 31000}</Power_On_Hours>
+            <Start_Stop_Count>212</Start_Stop_Count>
+        </Disk>"""
+
+    def _respond(self, op):
+        resource = op.get("resource-id")
+        kind = op.tag.replace(XS, "")
+        if kind == "set" and resource == "FanConfig":
+            fan = op.find("FanConfig")
+            if fan is None:
+                fan = op.find("{urn:netgear:nas:readynasd}FanConfig")
+            if fan is not None:
+                self.fan_mode = fan.get("mode", self.fan_mode)
+            return ""
+        if op.get("resource-type") == "Snapshot_Collection":
+            return self.snapshots_xml(
+                resource, int(op.get("start", 0)), int(op.get("count", 1_000_000))
+            )
+        if op.get("resource-type") == "Share_Collection":
+            return self.shares_xml(
+                int(op.get("start", 0)), int(op.get("count", 1_000_000))
+            )
+        if op.get("resource-type") == "BackupJob_Collection":
+            return self.backups_xml()
+        if op.get("resource-type") == "Disk":
+            return self.disk_xml(resource)
+        if kind == "custom" and resource == "Shutdown":
+            self.halted = True
+            return ""
+        return {
+            "HealthInfo": self.health_xml,
+            "Volumes": self.volumes_xml,
+            "SystemInfo": self.system_xml,
+            "SystemStats": self.stats_xml,
+            "FanConfig": lambda: f'<FanConfig mode="{self.fan_mode}"/>',
+        }.get(resource, lambda: "")()
+
+    # -- handlers ---------------------------------------------------------
+
+    def _authorized(self, request):
+        authorization = request.headers.get("Authorization")
+        if authorization is None:
+            return request.cookies.get("session") in self.sessions
+        self.authentications += 1
+        expected = base64.b64encode(
+            f"{self.username}:{self.password}".encode()
+        ).decode()
+        return authorization == f"Basic {expected}"
+
+    def expire_sessions(self):
+        """Drop every session, as a NAS reboot or session timeout would."""
+        self.sessions.clear()
+
+    async def handle_admin(self, request):
+        self.requests["admin"] += 1
+        if not self._authorized(request):
+            self.unauthorized += 1
+            return web.Response(status=401)
+        response = web.Response(
+            text=f'<html><script>csrfInsert("csrfpId", "{CSRF_TOKEN}");</script></html>',
+            content_type="text/html",
+        )
+        if self.session_cookies:
+            session = secrets.token_hex(16)
+            self.sessions.add(session)
+            response.set_cookie("session", session, path="/", httponly=True)
+        return response
+
+    async def handle_dbbroker(self, request):
+        body = await request.text()
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if not self._authorized(request):
+            self.requests["unauthorized"] += 1
+            self.unauthorized += 1
+            return web.Response(status=401)
+        if request.headers.get("csrfpId") != CSRF_TOKEN:
+            self.requests["forbidden"] += 1
+            return web.Response(status=403)
+
+        root = ET.fromstring(body)
+        resources = {
+            op.get("resource-id")
+            for op in root.iter()
+            if op.tag in (f"{XS}get", f"{XS}set", f"{XS}custom")
+        }
+        if resources & self.failing:
+            self.requests["failed"] += 1
+            return web.Response(status=500)
+
+        self.listings.update(
+            {
+                op.get("resource-type")
+                for op in root.iter(f"{XS}get")
+                if op.get("start", "0") == "0"
+            }
+        )
+
+        parts = []
+        for op in root.iter():
+            if op.tag in (f"{XS}get", f"{XS}set", f"{XS}custom"):
+                resource = op.get("resource-id")
+                self.requests[resource] += 1
+                parts.append(
+                    f'<xs:response id="{op.get("id")}" resource-id="{resource}">'
+                    f"{self._respond(op)}</xs:response>"
+                )
+        transaction = root.find(f"{XS}transaction")
+        transaction_id = transaction.get("id") if transaction is not None else ""
+        return web.Response(
+            text=(
+                '<?xml version="1.0" encoding="UTF-8"?>'
+                '<xs:nml xmlns:xs="http://www.netgear.com/protocol/transaction/NMLSchema-0.9">'
+                f'<xs:transaction id="{transaction_id}">{"".join(parts)}</xs:transaction>'
+                "</xs:nml>"
+            ),
+            content_type="text/xml",
+        )
+
+    # -- lifecycle --------------------------------------------------------
+
+    def app(self):
+        app = web.Application()
+        app.router.add_get("/admin/", self.handle_admin)
+        app.router.add_post("/dbbroker", self.handle_dbbroker)
+        return app
+
+    async def start(self, host="127.0.0.1", port=0, ssl_context=None):
+        """Start serving and return the ``host:port`` the NAS is reachable on.
+
+        Pass an ``ssl_context`` to serve HTTPS, like the real unit's
+        self-signed certificate.
+        """
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port, ssl_context=ssl_context)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return f"{host}:{self.port}"
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def nas_calls(self):
+        """Total requests that reached the NAS, CSRF page loads included."""
+        return sum(self.requests.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--disks", type=int, default=4)
+    parser.add_argument("--volumes", default="data", help="comma separated names")
+    parser.add_argument("--temperatures", type=int, default=1)
+    parser.add_argument("--fans", type=int, default=1)
+    parser.add_argument("--psus", type=int, default=0)
+    parser.add_argument("--shares", type=int, default=0)
+    parser.add_argument("--backups", type=int, default=0)
+    parser.add_argument("--certfile", help="serve HTTPS with this certificate")
+    parser.add_argument("--keyfile", help="private key of --certfile")
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="password")
+    args = parser.parse_args()
+
+    nas = MockReadyNAS(
+        args.username,
+        args.password,
+        disks=args.disks,
+        volumes=[name for name in re.split(r"\s*,\s*", args.volumes) if name],
+        temperatures=args.temperatures,
+        fans=args.fans,
+        psus=args.psus,
+        shares=args.shares,
+        backups=args.backups,
+    )
+    ssl_context = None
+    if args.certfile:
+        ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        ssl_context.load_cert_chain(args.certfile, args.keyfile)
+    web.run_app(nas.app(), host=args.host, port=args.port, ssl_context=ssl_context)
+
+
+if __name__ == "__main__":
+    main()
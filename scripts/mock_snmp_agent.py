@@ -0,0 +1,263 @@
+"""Minimal SNMP v2c agent standing in for the ReadyNAS net-snmp daemon.
+
+Answers GET, GETNEXT and GETBULK for the READYNASOS-MIB, IF-MIB and UCD
+objects the integration's SNMP telemetry transport reads, with values taken
+from a MockReadyNAS so both transports describe the same unit. Only the BER
+needed for that is implemented; SNMPv3 is not supported.
+
+Run standalone with ``python scripts/mock_snmp_agent.py --port 1161``.
+"""
+
+import argparse
+import asyncio
+import bisect
+import collections
+
+from mock_readynas import MockReadyNAS
+
+READYNAS = (1, 3, 6, 1, 4, 1, 4526, 22)
+UCD = (1, 3, 6, 1, 4, 1, 2021)
+IF_X = (1, 3, 6, 1, 2, 1, 31, 1, 1, 1)
+DISKIO = UCD + (13, 15, 1, 1)
+
+INTEGER, OCTET_STRING, NULL, OID, SEQUENCE = 0x02, 0x04, 0x05, 0x06, 0x30
+COUNTER64 = 0x46
+GET, GET_NEXT, RESPONSE, GET_BULK = 0xA0, 0xA1, 0xA2, 0xA5
+NO_SUCH_OBJECT, END_OF_MIB_VIEW = 0x80, 0x82
+
+
+# -- BER ------------------------------------------------------------------
+
+
+def _tlv(tag, payload):
+    length = len(payload)
+    if length < 0x80:
+        header = bytes([length])
+    else:
+        size = length.to_bytes((length.bit_length() + 7) // 8, "big")
+        header = bytes([0x80 | len(size)]) + size
+    return bytes([tag]) + header + payload
+
+
+def _encode_int(tag, value):
+    return _tlv(tag, value.to_bytes(value.bit_length() // 8 + 1, "big", signed=True))
+
+
+def _encode_oid(oid):
+    payload = bytearray([oid[0] * 40 + oid[1]])
+    for arc in oid[2:]:
+        chunk = [arc & 0x7F]
+        arc >>= 7
+        while arc:
+            chunk.append(0x80 | (arc & 0x7F))
+            arc >>= 7
+        payload.extend(reversed(chunk))
+    return _tlv(OID, bytes(payload))
+
+
+def _decode(data, position=0):
+    """Return (tag, payload, next position) of the TLV at position."""
+    tag = data[position]
+    length = data[position + 1]
+    position += 2
+    if length & 0x80:
+        size = length & 0x7F
+        length = int.from_bytes(data[position : position + size], "big")
+        position += size
+    return tag, data[position : position + length], position + length
+
+
+def _decode_all(data):
+    items, position = [], 0
+    while position < len(data):
+        tag, payload, position = _decode(data, position)
+        items.append((tag, payload))
+    return items
+
+
+def _decode_oid(payload):
+    oid = [payload[0] // 40, payload[0] % 40]
+    arc = 0
+    for byte in payload[1:]:
+        arc = arc << 7 | byte & 0x7F
+        if not byte & 0x80:
+            oid.append(arc)
+            arc = 0
+    return tuple(oid)
+
+
+def _encode_value(value):
+    kind, raw = value
+    if kind == "int":
+        return _encode_int(INTEGER, raw)
+    if kind == "counter64":
+        return _encode_int(COUNTER64, raw)
+    return _tlv(OCTET_STRING, str(raw).encode())
+
+
+# -- agent ----------------------------------------------------------------
+
+
+class MockSNMPAgent(asyncio.DatagramProtocol):
+    """Serve a MockReadyNAS's telemetry over SNMP v2c."""
+
+    def __init__(self, nas, community="public"):
+        self.nas = nas
+        self.community = community
+        # PDU type -> requests answered
+        self.requests = collections.Counter()
+        self._transport = None
+        self.port = None
+
+    def mib(self):
+        """Current (oid, value) pairs, sorted by OID."""
+        tick = self.requests.total()
+        objects = {}
+        for bay in range(self.nas.disks):
+            row = (bay + 1,)
+            objects[READYNAS + (3, 1, 9) + row] = ("str", "ONLINE")
+            objects[READYNAS + (3, 1, 10) + row] = ("int", 33 + bay)
+            objects[DISKIO + (2, bay + 1)] = ("str", f"sd{chr(ord('a') + bay)}")
+            objects[DISKIO + (5, bay + 1)] = ("counter64", tick * 120)
+            objects[DISKIO + (6, bay + 1)] = ("counter64", tick * 80)
+            objects[DISKIO + (12, bay + 1)] = ("counter64", tick * 24_000 * 512)
+            objects[DISKIO + (13, bay + 1)] = ("counter64", tick * 16_000 * 512)
+        for index in range(self.nas.fans):
+            objects[READYNAS + (4, 1, 2, index + 1)] = ("int", 1180 + 20 * index)
+        for index in range(self.nas.temperatures):
+            objects[READYNAS + (5, 1, 2, index + 1)] = ("int", 45 - 5 * index)
+        for index, name in enumerate(("lo", "eth0", "eth1"), start=1):
+            objects[IF_X + (1, index)] = ("str", name)
+            objects[IF_X + (6, index)] = ("counter64", tick * 3_000_000 + index)
+            objects[IF_X + (10, index)] = ("counter64", tick * 1_500_000 + index)
+        for arc, value in (
+            (50, 300),
+            (51, 0),
+            (52, 100),
+            (53, 2600),
+            (54, 20),
+            (56, 0),
+            (61, 5),
+        ):
+            objects[UCD + (11, arc, 0)] = ("counter64", tick * value)
+        objects[UCD + (4, 5, 0)] = ("int", 2097152)
+        objects[UCD + (4, 6, 0)] = ("int", 524288)
+        objects[UCD + (4, 14, 0)] = ("int", 131072)
+        objects[UCD + (4, 15, 0)] = ("int", 393216)
+        objects[UCD + (10, 1, 3, 1)] = ("str", "0.42")
+        return sorted(objects.items())
+
+    def _respond(self, pdu_type, fields, var_binds):
+        mib = self.mib()
+        oids = [oid for oid, _ in mib]
+
+        def _next(oid):
+            index = bisect.bisect_right(oids, oid)
+            if index == len(mib):
+                return oid, None
+            return mib[index]
+
+        answers = []
+        if pdu_type == GET:
+            values = dict(mib)
+            answers = [(oid, values.get(oid, "missing")) for oid in var_binds]
+        elif pdu_type == GET_NEXT:
+            answers = [_next(oid) for oid in var_binds]
+        else:
+            non_repeaters, max_repetitions = fields[1], fields[2]
+            answers = [_next(oid) for oid in var_binds[:non_repeaters]]
+            cursors = var_binds[non_repeaters:]
+            for _ in range(max_repetitions):
+                if not cursors:
+                    break
+                row = [_next(oid) for oid in cursors]
+                answers.extend(row)
+                cursors = [oid for oid, _ in row]
+                if all(value is None for _, value in row):
+                    break
+        return answers
+
+    def datagram_received(self, data, addr):
+        try:
+            _, message, _ = _decode(data)
+            (_, version), (_, community), (pdu_type, pdu) = _decode_all(message)
+            request_id, field_1, field_2, (_, var_bind_list) = _decode_all(pdu)
+        except (IndexError, ValueError):
+            return
+        if int.from_bytes(version, "big") != 1 or community.decode() != self.community:
+            return
+        if pdu_type not in (GET, GET_NEXT, GET_BULK):
+            return
+        self.requests[pdu_type] += 1
+
+        fields = [
+            int.from_bytes(payload, "big", signed=True)
+            for _, payload in (request_id, field_1, field_2)
+        ]
+        var_binds = [
+            _decode_oid(_decode_all(var_bind)[0][1])
+            for _, var_bind in _decode_all(var_bind_list)
+        ]
+
+        encoded = b""
+        for oid, value in self._respond(pdu_type, fields, var_binds):
+            if value is None:
+                encoded_value = _tlv(END_OF_MIB_VIEW, b"")
+            elif value == "missing":
+                encoded_value = _tlv(NO_SUCH_OBJECT, b"")
+            else:
+                encoded_value = _encode_value(value)
+            encoded += _tlv(SEQUENCE, _encode_oid(oid) + encoded_value)
+
+        response = _tlv(
+            RESPONSE,
+            _encode_int(INTEGER, fields[0])
+            + _encode_int(INTEGER, 0)
+            + _encode_int(INTEGER, 0)
+            + _tlv(SEQUENCE, encoded),
+        )
+        self._transport.sendto(
+            _tlv(
+                SEQUENCE,
+                _encode_int(INTEGER, 1)
+                + _tlv(OCTET_STRING, self.community.encode())
+                + response,
+            ),
+            addr,
+        )
+
+    # -- lifecycle --------------------------------------------------------
+
+    async def start(self, host="127.0.0.1", port=0):
+        """Start serving and return the UDP port the agent listens on."""
+        loop = asyncio.get_running_loop()
+        self._transport, _ = await loop.create_datagram_endpoint(
+            lambda: self, local_addr=(host, port)
+        )
+        self.port = self._transport.get_extra_info("sockname")[1]
+        return self.port
+
+    def stop(self):
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1161)
+    parser.add_argument("--disks", type=int, default=4)
+    parser.add_argument("--community", default="public")
+    args = parser.parse_args()
+
+    async def _serve():
+        agent = MockSNMPAgent(MockReadyNAS(disks=args.disks), args.community)
+        await agent.start(args.host, args.port)
+        await asyncio.Event().wait()
+
+    asyncio.run(_serve())
+
+
+if __name__ == "__main__":
+    main()
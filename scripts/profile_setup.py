@@ -0,0 +1,209 @@
+"""Profile ReadyNAS integration import cost and setup time against the mock NAS.
+
+Measures, for one config entry:
+- incremental import time of the integration and each platform module,
+  on top of the Home Assistant modules any install has already loaded
+- wall time of config entry setup until the first sensor appears, and until
+  every entity has been written
+- the number of requests that reached the NAS before the first sensor
+  appeared, per resource
+- how often each slow tier (SMART, snapshots, shares, backups) was listed,
+  and whether any of them was listed before the first sensor appeared
+
+and exits non-zero when any of them is over budget, or a slow tier was
+listed twice or held up the sensors, so startup regressions show up in CI.
+Needs the packages in requirements.txt.
+
+    python scripts/profile_setup.py --max-setup-ms 1500 --max-nas-calls 8
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts"))
+
+from mock_readynas import MockReadyNAS
+
+# This repo's custom_components, bound before the test harness puts its own
+# config directory, which has one too, on sys.path
+import custom_components  # noqa: F401
+
+DOMAIN = "readynaslocal"
+PACKAGE = f"custom_components.{DOMAIN}"
+MODULES = [
+    PACKAGE,
+    f"{PACKAGE}.config_flow",
+    f"{PACKAGE}.button",
+    f"{PACKAGE}.binary_sensor",
+    f"{PACKAGE}.select",
+    f"{PACKAGE}.sensor",
+]
+
+# resource-type of each slow tier's listing -> listings allowed per entry
+# setup, given the number of volumes. Slow tiers refresh in the background,
+# once, after the sensors have been added.
+SLOW_TIERS = {
+    "Disk": lambda volumes: 1,
+    "Snapshot_Collection": lambda volumes: volumes,
+    "Share_Collection": lambda volumes: 1,
+    "BackupJob_Collection": lambda volumes: 1,
+}
+
+# Modules Home Assistant has loaded before any custom integration is imported
+IMPORT_PROBE = """
+import json, sys, time
+import homeassistant.core
+import homeassistant.config_entries
+import homeassistant.helpers.entity
+import homeassistant.helpers.entity_platform
+timings = {}
+for name in sys.argv[1:]:
+    start = time.perf_counter()
+    __import__(name)
+    timings[name] = round((time.perf_counter() - start) * 1000, 2)
+print(json.dumps(timings))
+"""
+
+
+def measure_imports():
+    """Import the integration in a fresh interpreter and time each module."""
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE, *MODULES],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def measure_setup(disks, volumes):
+    """Set up one entry against a fresh mock NAS and time it."""
+    from homeassistant.const import EVENT_STATE_CHANGED
+    from homeassistant.core import callback
+    from homeassistant.helpers import entity_registry as er
+    from homeassistant.loader import DATA_CUSTOM_COMPONENTS
+    from homeassistant.setup import async_setup_component
+    from pytest_homeassistant_custom_component.common import (
+        MockConfigEntry,
+        async_test_home_assistant,
+    )
+
+    nas = MockReadyNAS(disks=disks, volumes=volumes)
+    address = await nas.start()
+    try:
+        async with async_test_home_assistant() as hass:
+            # Same as the enable_custom_integrations fixture
+            hass.data.pop(DATA_CUSTOM_COMPONENTS, None)
+            await async_setup_component(
+                hass, "http", {"http": {"server_port": _free_port()}}
+            )
+
+            entry = MockConfigEntry(
+                domain=DOMAIN,
+                unique_id=f"readynas_{address}",
+                data={
+                    "host": address,
+                    "username": nas.username,
+                    "password": nas.password,
+                    "use_ssl": False,
+                    "ignore_ssl_errors": True,
+                },
+            )
+            entry.add_to_hass(hass)
+
+            # What the NAS had been asked for by the time the first sensor,
+            # and so the main poll's data, was shown
+            first_sensor = {}
+
+            @callback
+            def _first_sensor(event):
+                if not first_sensor and event.data["entity_id"].startswith("sensor."):
+                    first_sensor["ms"] = round((time.perf_counter() - start) * 1000, 1)
+                    first_sensor["calls"] = dict(nas.requests)
+                    first_sensor["listings"] = {
+                        tier: nas.listings[tier] for tier in SLOW_TIERS
+                    }
+
+            hass.bus.async_listen(EVENT_STATE_CHANGED, _first_sensor)
+
+            start = time.perf_counter()
+            assert await hass.config_entries.async_setup(entry.entry_id)
+            await hass.async_block_till_done()
+            setup_ms = round((time.perf_counter() - start) * 1000, 1)
+
+            entities = len(
+                er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+            )
+            listings = {tier: nas.listings[tier] for tier in SLOW_TIERS}
+
+            await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_block_till_done()
+    finally:
+        await nas.stop()
+
+    return {
+        "first_sensor_ms": first_sensor["ms"],
+        "setup_ms": setup_ms,
+        "entities": entities,
+        "nas_calls": sum(first_sensor["calls"].values()),
+        "nas_calls_by_resource": first_sensor["calls"],
+        "slow_listings": listings,
+        "slow_listings_before_sensors": first_sensor["listings"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--disks", type=int, default=4)
+    parser.add_argument("--volumes", type=int, default=1)
+    parser.add_argument("--max-import-ms", type=float, default=250)
+    parser.add_argument("--max-setup-ms", type=float, default=2000)
+    parser.add_argument("--max-nas-calls", type=int, default=10)
+    args = parser.parse_args()
+
+    imports = measure_imports()
+    setup = asyncio.run(
+        measure_setup(args.disks, [f"data{i}" for i in range(args.volumes)])
+    )
+    report = {
+        "import_ms": imports,
+        "import_total_ms": round(sum(imports.values()), 2),
+        **setup,
+    }
+    print(json.dumps(report, indent=2))
+
+    over = []
+    if report["import_total_ms"] > args.max_import_ms:
+        over.append(f"import {report['import_total_ms']} ms > {args.max_import_ms}")
+    if report["setup_ms"] > args.max_setup_ms:
+        over.append(f"setup {report['setup_ms']} ms > {args.max_setup_ms}")
+    if report["nas_calls"] > args.max_nas_calls:
+        over.append(f"NAS calls {report['nas_calls']} > {args.max_nas_calls}")
+    for tier, allowed in SLOW_TIERS.items():
+        listed = report["slow_listings"][tier]
+        if listed > allowed(args.volumes):
+            over.append(f"{tier} listed {listed} times > {allowed(args.volumes)}")
+        if report["slow_listings_before_sensors"][tier]:
+            over.append(f"{tier} listed before the first sensor appeared")
+    for line in over:
+        print(f"over budget: {line}", file=sys.stderr)
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,89 @@
+"""Tests for the backup job tracker."""
+
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from custom_components.readynaslocal.const import (
+    BACKUP_ACTIVE_INTERVAL,
+    BACKUP_IDLE_INTERVAL,
+    EVENT_BACKUP_COMPLETED,
+    EVENT_BACKUP_FAILED,
+)
+from custom_components.readynaslocal.sensor import ReadyNASBackupTracker
+
+NOW = 1_700_000_000
+
+
+def _job(running=False, result="success", finished=None, next_run=None):
+    return {
+        "name": "Nightly",
+        "type": "rsync",
+        "running": running,
+        "result": result,
+        "started": finished - 60 if finished else None,
+        "finished": finished,
+        "next_run": next_run,
+        "bytes": 1024,
+    }
+
+
+def _tracker(hass, *listings):
+    api = SimpleNamespace(host="nas.lan", get_backup_jobs=AsyncMock())
+    api.get_backup_jobs.side_effect = listings
+    return ReadyNASBackupTracker(hass, api)
+
+
+async def test_interval_is_short_while_a_job_runs(hass):
+    tracker = _tracker(hass, {"1": _job(running=True), "2": _job()})
+    await tracker.async_update()
+    assert tracker.next_interval(NOW) == BACKUP_ACTIVE_INTERVAL
+
+
+async def test_interval_follows_the_next_scheduled_run(hass):
+    tracker = _tracker(
+        hass,
+        {
+            "1": _job(next_run=NOW + 600),
+            "2": _job(next_run=NOW + 300),
+            # A schedule in the past is ignored
+            "3": _job(next_run=NOW - 300),
+        },
+    )
+    await tracker.async_update()
+    assert tracker.next_interval(NOW) == timedelta(seconds=300) + BACKUP_ACTIVE_INTERVAL
+
+
+async def test_interval_is_capped_when_idle(hass):
+    tracker = _tracker(hass, {"1": _job(next_run=NOW + 86400)}, {"1": _job()})
+    await tracker.async_update()
+    assert tracker.next_interval(NOW) == BACKUP_IDLE_INTERVAL
+    await tracker.async_update()
+    assert tracker.next_interval(NOW) == BACKUP_IDLE_INTERVAL
+
+
+async def test_finished_runs_fire_events_and_fill_the_history(hass):
+    completed = async_capture_events(hass, EVENT_BACKUP_COMPLETED)
+    failed = async_capture_events(hass, EVENT_BACKUP_FAILED)
+    tracker = _tracker(
+        hass,
+        {"1": _job(finished=NOW)},
+        {"1": _job(finished=NOW)},
+        {"1": _job(finished=NOW + 100, result="failed")},
+    )
+
+    # The first listing only seeds the history
+    await tracker.async_update()
+    await tracker.async_update()
+    jobs = await tracker.async_update()
+    await hass.async_block_till_done()
+
+    assert completed == []
+    assert [event.data["result"] for event in failed] == ["failed"]
+    assert failed[0].data["duration_seconds"] == 60
+    assert list(jobs["1"]["history"]) == [
+        (NOW, True, 60, 1024),
+        (NOW + 100, False, 60, 1024),
+    ]
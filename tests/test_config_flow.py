@@ -0,0 +1,56 @@
+"""Tests for the ReadyNAS config flow."""
+
+from unittest.mock import AsyncMock, patch
+
+from homeassistant import config_entries
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.readynaslocal.const import CONF_CERT_FINGERPRINT, DOMAIN
+
+API = "custom_components.readynaslocal.config_flow.ReadyNASAPI"
+USER_INPUT = {
+    "host": "nas.lan",
+    "username": "admin",
+    "password": "secret",
+    "ssl": True,
+    "ignore_ssl_errors": True,
+}
+
+
+async def _start(hass, pin, probe):
+    async def _pin_certificate(api):
+        api.cert_fingerprint = pin
+        return pin
+
+    with (
+        patch(f"{API}.pin_certificate", _pin_certificate),
+        patch(f"{API}.probe", probe),
+        patch("custom_components.readynaslocal.async_setup_entry", return_value=True),
+    ):
+        return await hass.config_entries.flow.async_init(
+            DOMAIN, context={"source": config_entries.SOURCE_USER}, data=USER_INPUT
+        )
+
+
+async def test_pinned_certificate_is_stored(hass, enable_custom_integrations):
+    result = await _start(hass, "ab" * 32, AsyncMock(return_value=None))
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert result["data"][CONF_CERT_FINGERPRINT] == "ab" * 32
+
+
+async def test_unreadable_certificate_fails_the_flow(hass, enable_custom_integrations):
+    probe = AsyncMock(return_value=None)
+    result = await _start(hass, None, probe)
+
+    # No entry that would pin whatever certificate its first setup sees
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"base": "cannot_connect"}
+    probe.assert_not_called()
+
+
+async def test_probe_error_is_shown(hass, enable_custom_integrations):
+    result = await _start(hass, "ab" * 32, AsyncMock(return_value="invalid_auth"))
+
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"base": "invalid_auth"}
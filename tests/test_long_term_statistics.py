@@ -0,0 +1,39 @@
+"""Tests for the hourly long-term statistics import."""
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from custom_components.readynaslocal.long_term_statistics import (
+    ReadyNASStatistics,
+)
+
+MODULE = "custom_components.readynaslocal.long_term_statistics"
+
+
+def test_unfinished_hour_is_carried_across_a_reload():
+    hass = SimpleNamespace(data={})
+    coordinator = SimpleNamespace(
+        last_update_success=True, data={"cpu_temp": 40, "disks": []}
+    )
+    now = datetime(2024, 1, 1, 10, 15, tzinfo=UTC)
+
+    with (
+        patch(f"{MODULE}.dt_util.utcnow", side_effect=lambda: now),
+        patch(f"{MODULE}.async_add_external_statistics") as add,
+    ):
+        statistics = ReadyNASStatistics(hass, coordinator, "nas", "entry")
+        statistics.async_record()
+        statistics.async_suspend()
+        add.assert_not_called()
+
+        coordinator.data["cpu_temp"] = 50
+        statistics = ReadyNASStatistics(hass, coordinator, "nas", "entry")
+        statistics.async_record()
+        now = now.replace(hour=11)
+        statistics.async_record()
+
+    metadata, (row,) = add.call_args.args[1:]
+    assert metadata["statistic_id"] == "readynaslocal:nas_cpu_temp"
+    assert row["start"] == datetime(2024, 1, 1, 10, tzinfo=UTC)
+    assert (row["mean"], row["min"], row["max"]) == (45, 40, 50)
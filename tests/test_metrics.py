@@ -0,0 +1,90 @@
+"""Tests for the OpenMetrics exporter."""
+
+import asyncio
+from types import SimpleNamespace
+
+from custom_components.readynaslocal.const import DOMAIN
+from custom_components.readynaslocal.metrics import (
+    ReadyNASMetricsView,
+    render_request_stats,
+    render_snapshot,
+)
+from custom_components.readynaslocal.pyreadynas import ReadyNASAPI
+
+
+def _api():
+    api = ReadyNASAPI("nas.lan", "admin", "password")
+    api.snapshot = {
+        "cpu_temp": 45,
+        "fan_speed": None,
+        "disks": [{"key": "0", "model": None, "status": "ONLINE", "temperature": 35}],
+        "volumes": [
+            {"name": "data", "capacity_kb": 2, "free_kb": 1, "health": 'say "hi"'}
+        ],
+    }
+    api.snapshot_time = 1700000000.5
+    api.generation = 1
+    api.request_stats = {"HealthInfo": {"count": 3, "seconds": 0.25, "errors": 1}}
+    return api
+
+
+def test_render_snapshot():
+    samples = render_snapshot(_api())
+
+    assert samples["readynas_cpu_temperature_celsius"] == [
+        'readynas_cpu_temperature_celsius{host="nas.lan"} 45'
+    ]
+    # Unreported values and labels are left out
+    assert samples["readynas_fan_speed_rpm"] == []
+    assert samples["readynas_disk_temperature_celsius"] == [
+        'readynas_disk_temperature_celsius{host="nas.lan",disk="0"} 35'
+    ]
+    assert samples["readynas_volume_size_bytes"] == [
+        'readynas_volume_size_bytes{host="nas.lan",volume="data"} 2048'
+    ]
+    assert samples["readynas_volume_used_bytes"] == []
+    assert samples["readynas_volume_health"] == [
+        'readynas_volume_health{host="nas.lan",volume="data",health="say \\"hi\\""} 1'
+    ]
+    assert samples["readynas_snapshot_timestamp_seconds"] == [
+        'readynas_snapshot_timestamp_seconds{host="nas.lan"} 1700000000.500'
+    ]
+
+
+def test_render_request_stats():
+    samples = render_request_stats(_api())
+
+    labels = 'host="nas.lan",resource="HealthInfo"'
+    assert samples["readynas_request_duration_seconds"] == [
+        f"readynas_request_duration_seconds_count{{{labels}}} 3",
+        f"readynas_request_duration_seconds_sum{{{labels}}} 0.250000",
+    ]
+    assert samples["readynas_request_errors"] == [
+        f"readynas_request_errors_total{{{labels}}} 1"
+    ]
+
+
+def test_view_renders_each_generation_once():
+    api = _api()
+    view = ReadyNASMetricsView(SimpleNamespace(data={DOMAIN: {"entry": api}}))
+
+    body = asyncio.run(view.get(None)).text
+    assert body.startswith("# TYPE readynas_cpu_temperature_celsius gauge\n")
+    assert "# UNIT readynas_cpu_temperature_celsius celsius\n" in body
+    assert body.endswith("# EOF\n")
+
+    # Without a new poll the cached samples are served
+    api.snapshot["cpu_temp"] = 50
+    assert 'readynas_cpu_temperature_celsius{host="nas.lan"} 45' in (
+        asyncio.run(view.get(None)).text
+    )
+    api.generation += 1
+    assert 'readynas_cpu_temperature_celsius{host="nas.lan"} 50' in (
+        asyncio.run(view.get(None)).text
+    )
+
+    # An unloaded entry drops out of the caches
+    view.hass.data[DOMAIN].clear()
+    asyncio.run(view.get(None))
+    assert view._snapshot_cache == {}
+    assert view._stats_cache == {}
@@ -0,0 +1,375 @@
+"""Tests for the snapshot parsing and rate helpers of the API."""
+
+import asyncio
+import contextlib
+import datetime
+import hashlib
+import re
+import ssl
+import xml.etree.ElementTree as ET
+
+import pytest
+from aiohttp import web
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from custom_components.readynaslocal.pyreadynas import (
+    HEALTH_PARSER,
+    CounterRates,
+    ReadyNASAPI,
+    _push_top,
+    _ranked,
+    summarize_disks,
+)
+
+HEALTH_XML = """<nml><transaction><get>
+<Enclosure_Health resource-id="0">
+  <Temperature resource-id="temp0">
+    <temp_name>CPU</temp_name><temp_value>45</temp_value>
+  </Temperature>
+  <Fan resource-id="fan0"><fan_name>SYS</fan_name><fan_speed>1200</fan_speed></Fan>
+  <Power_Supply resource-id="psu0">
+    <psu_status>ok</psu_status><psu_voltage>12100</psu_voltage>
+  </Power_Supply>
+  <Disks>
+    <Disk resource-id="d0">
+      <disk_channel>0</disk_channel><disk_temperature>38</disk_temperature>
+      <disk_status>ONLINE</disk_status><disk_model>WD40</disk_model>
+    </Disk>
+    <Disk resource-id="d1"><disk_channel>1</disk_channel></Disk>
+  </Disks>
+</Enclosure_Health>
+<Enclosure_Health resource-id="eds1">
+  <Temperature resource-id="temp1"><temp_value>bogus</temp_value></Temperature>
+  <Disk resource-id="d2">
+    <disk_channel>0</disk_channel><disk_temperature>41</disk_temperature>
+  </Disk>
+</Enclosure_Health>
+</get></transaction></nml>"""
+
+
+def test_health_schema_single_pass():
+    parsed = HEALTH_PARSER.parse(ET.fromstring(HEALTH_XML))
+
+    assert parsed["temperatures"] == [
+        {
+            "name": "CPU",
+            "value": 45,
+            "status": None,
+            "resource_id": "temp0",
+            "enclosure": "0",
+        },
+        # A value that does not convert is left out
+        {
+            "name": None,
+            "value": None,
+            "status": None,
+            "resource_id": "temp1",
+            "enclosure": "eds1",
+        },
+    ]
+    assert parsed["fans"][0]["speed"] == 1200
+    assert parsed["psus"][0]["voltage"] == 12.1
+    # Disks are found at any depth, in document order, with their defaults
+    assert [
+        (disk["resource_id"], disk["enclosure"], disk["channel"])
+        for disk in parsed["disks"]
+    ] == [("d0", "0", "0"), ("d1", "0", "1"), ("d2", "eds1", "0")]
+    assert parsed["disks"][0]["model"] == "WD40"
+    assert parsed["disks"][1]["model"] == "Unknown"
+    assert parsed["disks"][1]["status"] == "Unknown"
+    assert parsed["disks"][1]["temperature"] is None
+
+
+def test_summarize_disks():
+    summary = summarize_disks(
+        [
+            {"key": "0", "temperature": 38, "status": "ONLINE"},
+            {"key": "1", "temperature": 44, "status": "online"},
+            {"key": "2", "temperature": None, "status": "FAILED"},
+        ]
+    )
+    assert summary == {
+        "disk_temp_max": 44,
+        "disk_temp_avg": 41.0,
+        "hottest_disk": "1",
+        "disks_not_online": 1,
+        "not_online_keys": ["2"],
+    }
+
+
+def test_counter_rates():
+    rates = CounterRates()
+    assert rates.update({"rx": 1000, "tx": 0}, uptime=100, now=10) == {}
+    assert rates.update({"rx": 3000, "tx": 500}, uptime=110, now=20) == {
+        "rx": 200,
+        "tx": 50,
+    }
+    # A counter that first shows up has no rate yet
+    assert rates.update({"rx": 3000, "tx": 500, "new": 7}, now=30) == {
+        "rx": 0,
+        "tx": 0,
+    }
+
+
+def test_counter_rates_wrap():
+    rates = CounterRates()
+    rates.update({"small": 2**32 - 100, "large": 2**64 - 100}, now=0)
+    # A 32-bit counter wraps at 2**32, a larger one at 2**64
+    assert rates.update({"small": 100, "large": 100}, now=10) == {
+        "small": 20,
+        "large": 20,
+    }
+
+
+def test_counter_rates_reset_on_reboot():
+    rates = CounterRates()
+    rates.update({"rx": 5000}, uptime=1000, now=0)
+    # Uptime went backwards: the NAS rebooted and the counters restarted
+    assert rates.update({"rx": 100}, uptime=5, now=10) == {}
+    assert rates.update({"rx": 300}, uptime=15, now=20) == {"rx": 20}
+
+
+def _self_signed(tmp_path):
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "nas")])
+    now = datetime.datetime.now(datetime.UTC)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    cert_file, key_file = tmp_path / "cert.pem", tmp_path / "key.pem"
+    cert_file.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_file.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert_file, key_file)
+    der = cert.public_bytes(serialization.Encoding.DER)
+    return context, hashlib.sha256(der).hexdigest()
+
+
+async def _admin(request):
+    return web.Response(text='csrfInsert("csrfpId", "token");')
+
+
+@contextlib.asynccontextmanager
+async def _serve(admin, ssl_context=None):
+    """Serve an admin page on a free local port, yielding its host."""
+    app = web.Application()
+    app.router.add_get("/admin/", admin)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0, ssl_context=ssl_context).start()
+    try:
+        yield f"127.0.0.1:{runner.addresses[0][1]}"
+    finally:
+        await runner.cleanup()
+
+
+def test_pinned_certificate_is_the_only_one_accepted(socket_enabled, tmp_path):
+    context, fingerprint = _self_signed(tmp_path)
+
+    async def _run():
+        async with _serve(_admin, context) as host:
+            pinned = ReadyNASAPI(host, "admin", "password", use_ssl=True)
+            pin = await pinned.pin_certificate()
+            token = await pinned.ensure_csrf_token()
+            await pinned.close()
+
+            other = ReadyNASAPI(
+                host, "admin", "password", use_ssl=True, cert_fingerprint="00" * 32
+            )
+            mismatch = await other.ensure_csrf_token()
+            await other.close()
+        return pin, token, mismatch
+
+    assert asyncio.run(_run()) == (fingerprint, "token", None)
+
+
+def test_refresh_without_resources_returns_the_snapshot():
+    async def _refresh():
+        api = ReadyNASAPI("nas", "admin", "password")
+        api.snapshot = {"cpu_temp": 40}
+        try:
+            return await api.refresh(())
+        finally:
+            await api.close()
+
+    assert asyncio.run(_refresh()) == {"cpu_temp": 40}
+
+
+def test_concurrent_logins_share_one_session(socket_enabled):
+    logins = 0
+
+    async def _login(request):
+        nonlocal logins
+        logins += 1
+        # Answer late, so every caller is waiting on the first login
+        await asyncio.sleep(0.05)
+        response = web.Response(text=f'csrfInsert("csrfpId", "token{logins}");')
+        response.set_cookie("session", str(logins))
+        return response
+
+    async def _run():
+        async with _serve(_login) as host:
+            api = ReadyNASAPI(host, "admin", "password")
+            tokens = await asyncio.gather(*(api._get_csrf_token() for _ in range(3)))
+            cookie_auth = api._cookie_auth
+            await api.close()
+        return tokens, cookie_auth
+
+    assert asyncio.run(_run()) == (["token1"] * 3, True)
+    assert logins == 1
+
+
+async def _unauthorized(request):
+    return web.Response(status=401)
+
+
+async def _not_readynas(request):
+    return web.Response(text="<html>It works!</html>")
+
+
+async def _redirect_to_https(request):
+    raise web.HTTPFound("https://nas.lan/admin/")
+
+
+async def _plain_http_to_tls_port(request):
+    return web.Response(
+        status=400, text="The plain HTTP request was sent to HTTPS port"
+    )
+
+
+async def _slow(request):
+    await asyncio.sleep(1)
+    return await _admin(request)
+
+
+@pytest.mark.parametrize(
+    ("admin", "error"),
+    [
+        (_admin, None),
+        (_unauthorized, "invalid_auth"),
+        (_not_readynas, "not_readynas"),
+        (_redirect_to_https, "ssl_error"),
+        (_plain_http_to_tls_port, "ssl_error"),
+        (_slow, "timeout"),
+    ],
+)
+def test_probe_maps_the_answer_to_an_error(socket_enabled, admin, error):
+    async def _probe():
+        async with _serve(admin) as host:
+            api = ReadyNASAPI(host, "admin", "password")
+            result = await api.probe(timeout=0.5)
+            token = api.csrf_token
+            await api.close()
+        return result, token
+
+    result, token = asyncio.run(_probe())
+    assert result == error
+    assert token == ("token" if error is None else None)
+
+
+def test_probe_of_a_closed_port(socket_enabled):
+    async def _probe():
+        async with _serve(_admin) as host:
+            pass
+        api = ReadyNASAPI(host, "admin", "password")
+        result = await api.probe(timeout=0.5)
+        await api.close()
+        return result
+
+    assert asyncio.run(_probe()) == "cannot_connect"
+
+
+def test_probe_of_a_mismatched_certificate(socket_enabled, tmp_path):
+    context, _ = _self_signed(tmp_path)
+
+    async def _probe():
+        async with _serve(_admin, context) as host:
+            api = ReadyNASAPI(
+                host, "admin", "password", use_ssl=True, cert_fingerprint="00" * 32
+            )
+            result = await api.probe(timeout=0.5)
+            await api.close()
+        return result
+
+    assert asyncio.run(_probe()) == "ssl_error"
+
+
+def test_top_heap_keeps_the_largest_values():
+    heap = []
+    for name, used in (("a", 5), ("b", 1), ("c", 9), ("d", 5), ("e", 3)):
+        _push_top(heap, 3, used, {"name": name})
+    assert len(heap) == 3
+    # Ties are ranked by name, so equal values never compare the dicts
+    assert [share["name"] for share in _ranked(heap)] == ["c", "d", "a"]
+
+
+class ShareTransport:
+    """Answer Share_Collection pages from a list of (name, used KB)."""
+
+    def __init__(self, shares, ignore_paging=False):
+        self.shares = shares
+        self.ignore_paging = ignore_paging
+        self.pages = 0
+
+    async def post(self, xml_payload, resource):
+        self.pages += 1
+        start = int(re.search(r'start="(\d+)"', xml_payload).group(1))
+        count = int(re.search(r'count="(\d+)"', xml_payload).group(1))
+        if self.ignore_paging:
+            start, count = 0, len(self.shares)
+        page = "".join(
+            f'<Share resource-id="{name}"><Share_Name>{name}</Share_Name>'
+            f"<DataUsedKB>{used}</DataUsedKB><Quota>0</Quota></Share>"
+            for name, used in self.shares[start : start + count]
+        )
+        return f"<nml><transaction><get>{page}</get></transaction></nml>"
+
+
+def test_top_shares_over_several_pages():
+    shares = [(f"share{index}", index) for index in range(7)]
+
+    async def _top():
+        api = ReadyNASAPI("nas", "admin", "password")
+        api.transport = ShareTransport(shares)
+        previous = {"share6": 6 * 1024, "share5": 5 * 1024}
+        result = await api.get_top_shares(count=2, previous=previous, page_size=3)
+        return result, api.transport.pages
+
+    result, pages = asyncio.run(_top())
+    assert pages == 3
+    assert result["count"] == 7
+    assert result["used_bytes"] == 21 * 1024
+    assert [share["name"] for share in result["top_usage"]] == ["share6", "share5"]
+    # The two largest did not grow, new shares grew by all their usage
+    assert [share["name"] for share in result["top_growth"]] == ["share4", "share3"]
+    assert result["usage"]["share3"] == 3 * 1024
+
+
+def test_top_shares_when_paging_is_ignored():
+    async def _top():
+        api = ReadyNASAPI("nas", "admin", "password")
+        api.transport = ShareTransport([("a", 1), ("b", 2)], ignore_paging=True)
+        result = await api.get_top_shares(page_size=1)
+        return result, api.transport.pages
+
+    result, pages = asyncio.run(_top())
+    # The repeated second page adds nothing new and ends the listing
+    assert pages == 2
+    assert result["count"] == 2
+    assert result["top_growth"] == []
@@ -0,0 +1,67 @@
+"""Tests for recording and replaying dbbroker fixtures."""
+
+import asyncio
+
+from custom_components.readynaslocal.pyreadynas import (
+    FixtureRecorder,
+    ReplayTransport,
+    request_signature,
+)
+
+REQUEST = """<?xml version="1.0" encoding="UTF-8"?>
+<xs:nml xmlns:xs="http://www.netgear.com/protocol/transaction/NMLSchema-0.9">
+    <xs:transaction id="njl_id_{id}">
+        <xs:get id="njl_id_{id}" resource-id="{resource}" resource-type="System"/>
+    </xs:transaction>
+</xs:nml>"""
+
+RESPONSE = """<nml><transaction><get>
+<Disk resource-id="0" serial="WD-1234"><Serial_Number>WD-5678</Serial_Number></Disk>
+<Disk resource-id="1" serial="WD-5678"/>
+<Network><MAC_Address>00:1B:21:AA:BB:CC</MAC_Address></Network>
+<Log>eth0 00:1b:21:aa:bb:cc up, token secret-token</Log>
+</get></transaction></nml>"""
+
+
+def test_signature_ignores_transaction_ids_and_layout():
+    first = REQUEST.format(id=1, resource="SystemInfo")
+    again = REQUEST.format(id=2, resource="SystemInfo").replace("\n    ", "\n")
+    other = REQUEST.format(id=1, resource="FanConfig")
+
+    assert request_signature(first) == request_signature(again)
+    assert request_signature(first) != request_signature(other)
+    # Unparseable payloads still get a stable key
+    assert request_signature("not xml") == request_signature(" not xml\n")
+
+
+def test_sanitize_keeps_placeholders_consistent(tmp_path):
+    recorder = FixtureRecorder(str(tmp_path))
+    sanitized = recorder.sanitize(RESPONSE, secrets=("secret-token",))
+
+    assert "WD-1234" not in sanitized and "WD-5678" not in sanitized
+    assert "aa:bb:cc" not in sanitized.lower()
+    assert "secret-token" not in sanitized
+    # The same serial gets the same placeholder in an element and an attribute
+    assert "<Serial_Number>SERIAL0001</Serial_Number>" in sanitized
+    assert '<Disk resource-id="1" serial="SERIAL0001"/>' in sanitized
+    # Whatever its case, a MAC address maps to one placeholder
+    assert sanitized.count("02:00:00:00:00:01") == 2
+
+
+def test_replay_serves_what_was_recorded(tmp_path):
+    recorded = REQUEST.format(id=1, resource="SystemInfo")
+
+    async def _run():
+        recorder = FixtureRecorder(str(tmp_path))
+        await recorder.record("SystemInfo", recorded, RESPONSE)
+        replay = ReplayTransport(str(tmp_path))
+        return (
+            await replay.post(
+                REQUEST.format(id=7, resource="SystemInfo"), "SystemInfo"
+            ),
+            await replay.post(REQUEST.format(id=7, resource="FanConfig"), "FanConfig"),
+        )
+
+    response, missing = asyncio.run(_run())
+    assert "<Disk" in response and "WD-1234" not in response
+    assert missing is None
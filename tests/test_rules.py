@@ -0,0 +1,81 @@
+"""Tests for the problem rules engine."""
+
+from custom_components.readynaslocal.const import (
+    CONF_DISK_HEALTHY,
+    CONF_DISK_TEMPERATURE,
+    CONF_RULE_HYSTERESIS,
+    CONF_VOLUME_FREE_GB,
+    CONF_VOLUME_HEALTHY,
+    CONF_VOLUME_USED_PERCENT,
+)
+from custom_components.readynaslocal.rules import RuleEngine, compile_rules
+
+
+def _snapshot(used=None, temperature=None, health="REDUNDANT"):
+    return {
+        "volumes": [{"name": "data", "used_percentage": used, "health": health}],
+        "disks": [{"key": "0", "temperature": temperature, "status": "ONLINE"}],
+    }
+
+
+def test_compile_rules_defaults_and_disabled_rules():
+    specs = {spec["id"]: spec for spec in compile_rules({})}
+    assert specs["volume_used_space"]["on"] == 90
+    assert specs["volume_used_space"]["off"] == 85.5
+    # A threshold of 0 disables the rule
+    assert "volume_free_space" not in specs
+    assert specs["disk_status"]["allowed"] == ["ONLINE"]
+
+    specs = {
+        spec["id"]: spec
+        for spec in compile_rules(
+            {
+                CONF_VOLUME_FREE_GB: 100,
+                CONF_RULE_HYSTERESIS: 10,
+                CONF_VOLUME_HEALTHY: " redundant, Degraded ,",
+                CONF_DISK_HEALTHY: "",
+                CONF_DISK_TEMPERATURE: 0,
+            }
+        )
+    }
+    # Problems below a threshold clear above it
+    assert specs["volume_free_space"]["off"] == 110
+    assert specs["volume_health"]["allowed"] == ["DEGRADED", "REDUNDANT"]
+    assert "disk_status" not in specs
+    assert "disk_temperature" not in specs
+
+
+def test_threshold_rule_clears_only_past_the_margin():
+    engine = RuleEngine(
+        compile_rules({CONF_VOLUME_USED_PERCENT: 90, CONF_RULE_HYSTERESIS: 5})
+    )
+    key = ("volume_used_space", "data")
+
+    assert engine.evaluate(_snapshot(used=89.9))[key] == (False, 89.9)
+    assert engine.evaluate(_snapshot(used=90))[key] == (True, 90)
+    # Back under the threshold, but not under 85.5 yet
+    assert engine.evaluate(_snapshot(used=87))[key] == (True, 87)
+    assert engine.evaluate(_snapshot(used=85.5))[key] == (True, 85.5)
+    assert engine.evaluate(_snapshot(used=85.4))[key] == (False, 85.4)
+    # And it has to reach the threshold again to trip
+    assert engine.evaluate(_snapshot(used=89))[key] == (False, 89)
+
+
+def test_missing_reading_keeps_the_last_state():
+    engine = RuleEngine(compile_rules({CONF_DISK_TEMPERATURE: 50}))
+    key = ("disk_temperature", "0")
+
+    assert engine.evaluate(_snapshot(temperature=55))[key] == (True, 55)
+    assert engine.evaluate(_snapshot(temperature=None))[key] == (True, None)
+    assert engine.evaluate(_snapshot(temperature=40))[key] == (False, 40)
+
+
+def test_allowed_rule_and_cached_snapshot():
+    engine = RuleEngine(compile_rules({}))
+    data = _snapshot(used=10, temperature=30, health="DEGRADED")
+
+    results = engine.evaluate(data)
+    assert results[("volume_health", "data")] == (True, "DEGRADED")
+    assert results[("disk_status", "0")] == (False, "ONLINE")
+    # The same snapshot is not evaluated twice
+    assert engine.evaluate(data) is results
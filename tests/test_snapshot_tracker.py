@@ -0,0 +1,68 @@
+"""Tests for the snapshot tracker."""
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from custom_components.readynaslocal.const import (
+    EVENT_SNAPSHOT_CREATED,
+    EVENT_SNAPSHOT_DELETED,
+)
+from custom_components.readynaslocal.sensor import ReadyNASSnapshotTracker
+
+
+def _tracker(hass, *listings):
+    coordinator = SimpleNamespace(data={"volumes": [{"name": "data"}]})
+    api = SimpleNamespace(host="nas.lan", get_snapshots=AsyncMock())
+    api.get_snapshots.side_effect = listings
+    return ReadyNASSnapshotTracker(hass, coordinator, api)
+
+
+async def test_only_changed_snapshots_fire_events(hass):
+    created = async_capture_events(hass, EVENT_SNAPSHOT_CREATED)
+    deleted = async_capture_events(hass, EVENT_SNAPSHOT_DELETED)
+    tracker = _tracker(
+        hass,
+        {"a": (1000, 10), "b": (2000, 20)},
+        {"b": (2000, 20), "c": (3000, 30)},
+    )
+
+    # The first listing is the baseline
+    summary = await tracker.async_update()
+    await hass.async_block_till_done()
+    assert created == deleted == []
+    assert summary["data"] == {
+        "count": 2,
+        "latest": datetime.fromtimestamp(2000, UTC),
+        "size_bytes": 30,
+    }
+
+    await tracker.async_update()
+    await hass.async_block_till_done()
+    assert [event.data["snapshot"] for event in created] == ["c"]
+    assert [event.data["snapshot"] for event in deleted] == ["a"]
+    # A deleted snapshot is described by the previous listing
+    assert deleted[0].data["size_bytes"] == 10
+    assert deleted[0].data["volume"] == "data"
+
+
+async def test_empty_volume_and_failed_listing(hass):
+    tracker = _tracker(hass, {}, None)
+
+    summary = await tracker.async_update()
+    assert summary["data"] == {"count": 0, "latest": None, "size_bytes": 0}
+    with pytest.raises(UpdateFailed):
+        await tracker.async_update()
+
+
+async def test_removed_volume_is_forgotten(hass):
+    tracker = _tracker(hass, {"a": (1000, 10)})
+    await tracker.async_update()
+
+    tracker.coordinator.data = {"volumes": []}
+    assert await tracker.async_update() == {}
+    assert tracker._known == {}
@@ -0,0 +1,179 @@
+"""Tests for the SNMP telemetry transport."""
+
+import asyncio
+import bisect
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.readynaslocal.snmp import (
+    CPU_COUNTERS,
+    DISK_STATE,
+    DISK_TEMPERATURE,
+    DISKIO_DEVICE,
+    DISKIO_READ_BYTES,
+    FAN_RPM,
+    IF_HC_IN_OCTETS,
+    IF_NAME,
+    LOAD_1M,
+    MEM_AVAILABLE,
+    MEM_TOTAL,
+    TEMPERATURE_VALUE,
+    ReadyNASSNMP,
+    build_telemetry,
+)
+
+rfc1902 = pytest.importorskip("pysnmp.proto.rfc1902")
+rfc1905 = pytest.importorskip("pysnmp.proto.rfc1905")
+
+# An OID past every table the transport reads
+_AFTER = (1, 3, 6, 1, 6)
+
+
+def _agent_tree(disks=3):
+    tree = {
+        CPU_COUNTERS["user"] + (0,): rfc1902.Counter32(100),
+        CPU_COUNTERS["idle"] + (0,): rfc1902.Counter32(900),
+        MEM_TOTAL + (0,): rfc1902.Integer32(1000),
+        MEM_AVAILABLE + (0,): rfc1902.Integer32(250),
+        LOAD_1M + (1,): rfc1902.OctetString("0.52"),
+        TEMPERATURE_VALUE + (1,): rfc1902.Integer32(45),
+        TEMPERATURE_VALUE + (2,): rfc1902.Integer32(30),
+        FAN_RPM + (1,): rfc1902.Integer32(1200),
+        IF_NAME + (1,): rfc1902.OctetString("lo"),
+        IF_NAME + (2,): rfc1902.OctetString("eth0"),
+        IF_HC_IN_OCTETS + (2,): rfc1902.Counter64(5000),
+        DISKIO_DEVICE + (1,): rfc1902.OctetString("sda"),
+        DISKIO_DEVICE + (2,): rfc1902.OctetString("sda1"),
+        DISKIO_READ_BYTES + (1,): rfc1902.Counter64(1024),
+        _AFTER: rfc1902.Integer32(0),
+    }
+    for bay in range(1, disks + 1):
+        tree[DISK_STATE + (bay,)] = rfc1902.OctetString("ONLINE")
+        tree[DISK_TEMPERATURE + (bay,)] = rfc1902.Integer32(35 + bay)
+    return tree
+
+
+class FakeAgent:
+    """GETBULK over a dict of OIDs, as pysnmp's bulk_cmd would return it."""
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.oids = sorted(tree)
+        self.requests = 0
+
+    def _next(self, oid):
+        position = bisect.bisect_right(self.oids, oid)
+        if position == len(self.oids):
+            return oid, rfc1905.endOfMibView
+        name = self.oids[position]
+        return name, self.tree[name]
+
+    async def bulk_cmd(
+        self, engine, auth, target, context, non_repeaters, repetitions, *oids, **kw
+    ):
+        self.requests += 1
+        table = [self._next(oid) for oid in oids[:non_repeaters]]
+        cursors = list(oids[non_repeaters:])
+        for _ in range(repetitions):
+            for index, cursor in enumerate(cursors):
+                name, value = self._next(cursor)
+                cursors[index] = name
+                table.append((name, value))
+        return None, 0, 0, table
+
+    def hlapi(self):
+        async def _create(address, timeout, retries):
+            return SimpleNamespace(timeout=timeout, retries=retries)
+
+        return SimpleNamespace(
+            UdpTransportTarget=SimpleNamespace(create=_create),
+            ObjectType=lambda identity: identity,
+            ObjectIdentity=lambda oid: oid,
+            ContextData=lambda: None,
+            bulk_cmd=self.bulk_cmd,
+        )
+
+
+def _transport(agent, max_repetitions=2):
+    snmp = ReadyNASSNMP("nas", max_repetitions=max_repetitions)
+    snmp._hlapi, snmp._engine, snmp._auth = agent.hlapi(), object(), None
+    snmp._exceptions = (
+        rfc1905.noSuchObject.tagSet,
+        rfc1905.noSuchInstance.tagSet,
+        rfc1905.endOfMibView.tagSet,
+    )
+    return snmp
+
+
+def test_walk_follows_columns_over_several_requests():
+    agent = FakeAgent(_agent_tree(disks=5))
+    telemetry = asyncio.run(_transport(agent).fetch("HealthInfo"))
+
+    # Two rows per column and request, so the five disks take three
+    assert agent.requests == 3
+    assert [disk["key"] for disk in telemetry["disks"]] == ["0", "1", "2", "3", "4"]
+    assert telemetry["disks"][4] == {
+        "key": "4",
+        "status": "ONLINE",
+        "temperature": 40,
+    }
+    assert telemetry["cpu_temp"] == 45
+    assert telemetry["temperatures"] == [45, 30]
+    assert telemetry["fan_speed"] == 1200
+
+    stats = telemetry["system_stats"]
+    assert stats["counters"][("cpu", "user")] == 100
+    assert stats["counters"][("cpu", "idle")] == 900
+    assert stats["memory_percent"] == 75.0
+    assert stats["load_1m"] == 0.52
+    # The loopback interface and partitions are left out
+    assert stats["interfaces"] == ["eth0"]
+    assert stats["counters"][("net", "eth0", "rx_bytes")] == 5000
+    assert stats["disks"] == ["sda"]
+    assert stats["counters"][("disk", "sda", "sectors_read")] == 2
+
+
+def test_missing_scalar_is_not_taken_from_the_next_oid():
+    tree = _agent_tree()
+    # The agent lacks the CPU system counter, whose GETNEXT lands on idle
+    assert CPU_COUNTERS["system"] + (0,) not in tree
+    del tree[MEM_TOTAL + (0,)]
+    telemetry = asyncio.run(_transport(FakeAgent(tree)).fetch("HealthInfo"))
+
+    counters = telemetry["system_stats"]["counters"]
+    assert ("cpu", "system") not in counters
+    assert counters[("cpu", "idle")] == 900
+    assert telemetry["system_stats"]["memory_percent"] is None
+
+
+def test_walk_gives_up_at_the_deadline():
+    async def _fetch():
+        agent = FakeAgent(_agent_tree(disks=5))
+        loop = asyncio.get_running_loop()
+        result = await _transport(agent).fetch("HealthInfo", loop.time() - 1)
+        return result, agent.requests
+
+    assert asyncio.run(_fetch()) == (None, 0)
+
+
+def test_close_shuts_the_engine_down():
+    snmp = _transport(FakeAgent(_agent_tree()))
+    engine = snmp._engine = MagicMock()
+
+    snmp.close()
+    engine.close_dispatcher.assert_called_once_with()
+    # Closing again, or a transport that never fetched, is a no-op
+    snmp.close()
+    ReadyNASSNMP("nas").close()
+    engine.close_dispatcher.assert_called_once_with()
+
+
+def test_build_telemetry_without_rows():
+    telemetry = build_telemetry({}, {})
+    assert telemetry["cpu_temp"] is None
+    assert telemetry["fan_speed"] is None
+    assert telemetry["disks"] == []
+    assert telemetry["system_stats"]["memory_percent"] is None
+    assert telemetry["system_stats"]["load_1m"] is None
@@ -0,0 +1,59 @@
+"""Tests for the syslog alert listener."""
+
+import asyncio
+
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from custom_components.readynaslocal import syslog_listener
+from custom_components.readynaslocal.const import EVENT_ALERT, SIGNAL_ALERT
+from custom_components.readynaslocal.syslog_listener import (
+    ReadyNASSyslogListener,
+    classify,
+    parse_syslog,
+)
+
+
+def test_parse_rfc3164():
+    data = b"<11>Mar  3 10:15:02 nas readynasd: Disk in channel 2 failed."
+    assert parse_syslog(data) == ("error", "Disk in channel 2 failed.")
+
+
+def test_parse_rfc5424():
+    data = (
+        b"<12>1 2024-03-03T10:15:02Z nas readynasd 123 - "
+        b'[meta sequenceId="1"] \xef\xbb\xbfVolume data is degraded.'
+    )
+    assert parse_syslog(data) == ("warning", "Volume data is degraded.")
+
+
+def test_parse_without_priority():
+    assert parse_syslog(b"Disk in channel 2 failed.") is None
+
+
+def test_classify_first_rule_wins():
+    # Backup alerts often name a USB disk
+    assert classify("Backup job to USB disk finished") == ("backup", ("Backups",))
+    assert classify("Resync started on volume data") == ("resync", ("Volumes",))
+    assert classify("Fan speed is low") == ("fan", ("HealthInfo",))
+    assert classify("Admin logged in") is None
+
+
+async def test_alerts_are_coalesced_into_one_refresh(hass, monkeypatch):
+    monkeypatch.setattr(syslog_listener, "ALERT_COALESCE", 0.01)
+    events = async_capture_events(hass, EVENT_ALERT)
+    refreshes = []
+    async_dispatcher_connect(hass, SIGNAL_ALERT.format("entry"), refreshes.append)
+
+    listener = ReadyNASSyslogListener(hass, 514)
+    listener.entries["entry"] = "nas.lan"
+    listener._addresses["192.0.2.10"] = "entry"
+    listener.datagram_received(b"<11>Fan 1 failed", ("192.0.2.10", 514))
+    listener.datagram_received(b"<11>Volume data degraded", ("192.0.2.10", 514))
+    listener.datagram_received(b"<14>Admin logged in", ("192.0.2.10", 514))
+    await asyncio.sleep(0.05)
+    await hass.async_block_till_done()
+
+    assert [event.data["category"] for event in events] == ["fan", "volume"]
+    assert events[0].data["host"] == "nas.lan"
+    assert refreshes == [frozenset({"HealthInfo", "Volumes"})]
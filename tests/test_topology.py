@@ -0,0 +1,95 @@
+"""Tests for adding and removing disk and volume entities on topology changes."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.readynaslocal.sensor import ReadyNASTopology
+
+
+def _snapshot(disks=("0", "1"), volumes=("data",), **extra):
+    data = {
+        "disks": [{"key": key, "status": "ONLINE"} for key in disks],
+        "volumes": [{"name": name} for name in volumes],
+    }
+    data.update(extra)
+    return data
+
+
+@pytest.fixture
+def coordinator():
+    coordinator = MagicMock()
+    coordinator.config_entry.data = {"host": "nas"}
+    coordinator.last_update_success = True
+    coordinator.data = _snapshot()
+    return coordinator
+
+
+@pytest.fixture
+def registry():
+    registry = MagicMock()
+    registry.async_get_entity_id.side_effect = lambda domain, platform, unique_id: (
+        f"sensor.{unique_id}"
+    )
+    with patch(
+        "custom_components.readynaslocal.sensor.er.async_get", return_value=registry
+    ):
+        yield registry
+
+
+@pytest.fixture
+def topology(coordinator, registry):
+    add_entities = MagicMock()
+    topology = ReadyNASTopology(MagicMock(), coordinator, add_entities, None)
+    topology.async_build_initial()
+    return topology
+
+
+def _removed(registry):
+    return {call.args[0] for call in registry.async_remove.call_args_list}
+
+
+def test_reconcile_adds_and_removes(coordinator, registry, topology):
+    coordinator.data = _snapshot(disks=("0", "2"), volumes=("data", "media"))
+    topology.async_reconcile()
+
+    added = {
+        entity.unique_id for entity in topology._async_add_entities.call_args[0][0]
+    }
+    assert "readynas_nas_disk_2" in added
+    assert "readynas_nas_volume_media" in added
+    assert "sensor.readynas_nas_disk_1" in _removed(registry)
+    assert set(topology._disks) == {"0", "2"}
+    assert set(topology._volumes) == {"data", "media"}
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        # The poll could not fetch the volumes at all
+        {"disks": [{"key": "0"}, {"key": "1"}], "unavailable": ["Volumes"]},
+        # The volumes are the last good copy, not the current ones
+        _snapshot(volumes=(), stale={"Volumes": 600}),
+        # Neither fetched nor reported
+        {"disks": [{"key": "0"}, {"key": "1"}]},
+    ],
+)
+def test_reconcile_keeps_entities_of_missing_collections(
+    coordinator, registry, topology, data
+):
+    coordinator.data = data
+    topology.async_reconcile()
+
+    registry.async_remove.assert_not_called()
+    topology._async_add_entities.assert_not_called()
+    assert set(topology._volumes) == {"data"}
+    assert set(topology._disks) == {"0", "1"}
+
+
+def test_reconcile_ignores_failed_updates(coordinator, registry, topology):
+    coordinator.last_update_success = False
+    coordinator.data = _snapshot(disks=(), volumes=())
+    topology.async_reconcile()
+
+    registry.async_remove.assert_not_called()
+    assert set(topology._disks) == {"0", "1"}